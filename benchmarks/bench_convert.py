@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Benchmark jc.utils numeric conversions over the fixture corpus.
+#
+# Every scalar value found in the tests/fixtures/**/*.json files is turned
+# into a string and converted with convert_to_int() and convert_to_float().
+# The results are checked against the original regex-based implementation
+# and the time for both is reported.
+#
+# usage:
+#   ./benchmarks/bench_convert.py
+#   ./benchmarks/bench_convert.py -r 5
+import os
+import re
+import sys
+import glob
+import json
+import time
+import argparse
+from typing import Any, Callable, List, Optional
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import jc.utils  # noqa: E402
+
+
+def regex_convert_to_int(value: object) -> Optional[int]:
+    """Reference implementation"""
+    if isinstance(value, str):
+        str_val = re.sub(r'[^0-9\-\.]', '', value)
+        try:
+            return int(str_val)
+        except (ValueError, TypeError):
+            try:
+                return int(float(str_val))
+            except (ValueError, TypeError):
+                return None
+
+    elif isinstance(value, (int, float)):
+        return int(value)
+
+    else:
+        return None
+
+
+def regex_convert_to_float(value: object) -> Optional[float]:
+    """Reference implementation"""
+    if isinstance(value, str):
+        try:
+            return float(re.sub(r'[^0-9\-\.]', '', value))
+        except (ValueError, TypeError):
+            return None
+
+    elif isinstance(value, (int, float)):
+        return float(value)
+
+    else:
+        return None
+
+
+def scalars(obj: Any, values: List[str]) -> None:
+    """Append the string form of every scalar in a JSON document"""
+    if isinstance(obj, dict):
+        for item in obj.values():
+            scalars(item, values)
+    elif isinstance(obj, list):
+        for item in obj:
+            scalars(item, values)
+    elif isinstance(obj, str):
+        values.append(obj)
+    elif isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        values.append(str(obj))
+
+
+def load_corpus() -> List[str]:
+    values: List[str] = []
+    pattern = os.path.join(REPO_DIR, 'tests', 'fixtures', '**', '*.json')
+
+    for file in sorted(glob.glob(pattern, recursive=True)):
+        with open(file, 'r', encoding='utf-8') as f:
+            try:
+                scalars(json.load(f), values)
+            except ValueError:
+                pass
+
+    return values
+
+
+def best_time(func: Callable[[str], Any], values: List[str], repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def same(a: Any, b: Any) -> bool:
+    # nan != nan
+    return a == b or (a != a and b != b)
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Benchmark jc.utils numeric conversions.')
+    arg_parser.add_argument('-r', '--repeat', type=int, default=3, help='timing rounds (default: 3)')
+    args = arg_parser.parse_args()
+
+    values = load_corpus()
+    numeric = sum(1 for v in values if v.isdigit())
+    print(f'{len(values):,} values ({numeric:,} plain digit strings)')
+
+    mismatches = 0
+
+    for name, reference, current in (
+        ('convert_to_int', regex_convert_to_int, jc.utils.convert_to_int),
+        ('convert_to_float', regex_convert_to_float, jc.utils.convert_to_float)
+    ):
+        for value in values:
+            if not same(reference(value), current(value)):
+                mismatches += 1
+                print(f'  {name} mismatch: {value!r}: {reference(value)!r} != {current(value)!r}')
+
+        before = best_time(reference, values, args.repeat)
+        after = best_time(current, values, args.repeat)
+        print(f'{name:<18} regex {before:>7.3f}s   current {after:>7.3f}s   {before / after:>5.2f}x')
+
+    if mismatches:
+        print(f'\n{mismatches} mismatches found.')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# Benchmark every parser in jc.lib.parsers against its test fixtures.
+#
+# Standard parsers are timed in processed and raw modes. Streaming parsers
+# are timed when fed a list of lines (library use) and a text stream (cli
+# use). Throughput (lines/s and MB/s) and peak memory (tracemalloc) are
+# written to a JSON report that can be compared against a saved baseline.
+#
+# Fixtures for each parser are the non-JSON files referenced by its
+# tests/test_<parser>.py module plus any tests/fixtures/**/<parser>--*.out
+# files used by the generic fixture test runner.
+#
+# usage:
+#   ./benchmarks/bench_parsers.py -o report.json
+#   ./benchmarks/bench_parsers.py -p ps,ls,ping_s --baseline baseline.json
+#
+# The exit code is 1 if --baseline is used and a regression is found.
+import os
+import re
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTS_DIR = os.path.join(REPO_DIR, 'tests')
+sys.path.insert(0, REPO_DIR)
+
+import jc  # noqa: E402
+import jc.lib  # noqa: E402
+
+FIXTURE_PATH_RE = re.compile(r'''['"/](fixtures/[^'"]+)''')
+STANDARD_MODES = ('processed', 'raw')
+STREAMING_MODES = ('lines', 'stream')
+
+
+def find_fixtures(parser_mod_name: str) -> List[str]:
+    """Return the sorted input fixture paths for a parser"""
+    fixtures = set()
+    test_file = os.path.join(TESTS_DIR, f'test_{parser_mod_name}.py')
+
+    if os.path.isfile(test_file):
+        with open(test_file, 'r', encoding='utf-8') as f:
+            for path in FIXTURE_PATH_RE.findall(f.read()):
+                if not path.endswith('.json'):
+                    fixtures.add(os.path.join(TESTS_DIR, path))
+
+    for root, _, files in os.walk(os.path.join(TESTS_DIR, 'fixtures')):
+        for file in files:
+            if file.startswith(f'{parser_mod_name}--') and file.endswith('.out'):
+                fixtures.add(os.path.join(root, file))
+
+    return sorted(f for f in fixtures if os.path.isfile(f))
+
+
+def load_fixture(path: str) -> Union[str, bytes]:
+    """Read a fixture like the cli reads STDIN: UTF-8 if possible, else bytes"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data
+
+
+def parse_func(parser: Any, mode: str, data: Union[str, bytes]) -> Callable[[], Any]:
+    """Return a function that fully parses the data in the selected mode"""
+    if mode == 'processed':
+        return lambda: parser.parse(data, quiet=True)
+
+    if mode == 'raw':
+        return lambda: parser.parse(data, raw=True, quiet=True)
+
+    if mode == 'lines':
+        lines = data.splitlines()  # type: ignore
+        return lambda: list(parser.parse(lines, quiet=True, ignore_exceptions=True))
+
+    # stream
+    return lambda: list(parser.parse(io.StringIO(data), quiet=True, ignore_exceptions=True))  # type: ignore
+
+
+def time_func(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Return the best time of one call over `repeat` rounds of at least `min_time` seconds"""
+    best = float('inf')
+
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+
+        while True:
+            func()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+
+        best = min(best, elapsed / loops)
+
+    return best
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Return the peak memory allocated by one call in bytes"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_parser(
+    parser_mod_name: str,
+    repeat: int,
+    min_time: float
+) -> Optional[Dict[str, Any]]:
+    """Benchmark one parser in all of its modes. Returns None if there are no fixtures."""
+    fixtures = find_fixtures(parser_mod_name)
+    if not fixtures:
+        return None
+
+    parser = jc.get_parser(parser_mod_name)
+    streaming = jc.lib._parser_is_streaming(parser)
+    modes = STREAMING_MODES if streaming else STANDARD_MODES
+    result: Dict[str, Any] = {'fixtures': len(fixtures), 'modes': {}}
+
+    for mode in modes:
+        seconds = 0.0
+        total_bytes = 0
+        total_lines = 0
+        peak = 0
+        errors: List[str] = []
+
+        for fixture in fixtures:
+            data = load_fixture(fixture)
+            if streaming and isinstance(data, bytes):
+                errors.append(f'{os.path.relpath(fixture, REPO_DIR)}: binary input')
+                continue
+
+            func = parse_func(parser, mode, data)
+
+            try:
+                seconds += time_func(func, repeat, min_time)
+                peak = max(peak, peak_memory(func))
+            except Exception as e:
+                errors.append(f'{os.path.relpath(fixture, REPO_DIR)}: {e.__class__.__name__}: {e}')
+                continue
+
+            total_bytes += len(data.encode('utf-8')) if isinstance(data, str) else len(data)
+            total_lines += len(data.splitlines())
+
+        result['modes'][mode] = {
+            'bytes': total_bytes,
+            'lines': total_lines,
+            'seconds': seconds,
+            'lines_per_sec': total_lines / seconds if seconds else None,
+            'mb_per_sec': total_bytes / 1_000_000 / seconds if seconds else None,
+            'peak_memory': peak,
+            'errors': errors
+        }
+
+    return result
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_threshold: float,
+    memory_threshold: float
+) -> List[str]:
+    """Return a list of regressions of the report compared to the baseline"""
+    regressions: List[str] = []
+
+    for parser_name, result in report['parsers'].items():
+        base_result = baseline.get('parsers', {}).get(parser_name)
+        if not base_result:
+            continue
+
+        for mode, stats in result['modes'].items():
+            base_stats = base_result['modes'].get(mode)
+            if not base_stats or not base_stats['seconds'] or not stats['seconds']:
+                continue
+
+            # compare the same amount of work only
+            if (stats['bytes'], stats['lines']) != (base_stats['bytes'], base_stats['lines']):
+                continue
+
+            time_ratio = stats['seconds'] / base_stats['seconds']
+            if time_ratio > 1 + time_threshold:
+                regressions.append(f'{parser_name} ({mode}): {time_ratio:.2f}x slower')
+
+            if base_stats['peak_memory']:
+                memory_ratio = stats['peak_memory'] / base_stats['peak_memory']
+                if memory_ratio > 1 + memory_threshold:
+                    regressions.append(f'{parser_name} ({mode}): {memory_ratio:.2f}x more memory')
+
+    return regressions
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Benchmark jc parsers against the test fixtures.')
+    arg_parser.add_argument('-p', '--parsers', help='comma separated parser module names (default: all)')
+    arg_parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    arg_parser.add_argument('-b', '--baseline', help='compare against this saved JSON report')
+    arg_parser.add_argument('-r', '--repeat', type=int, default=3, help='timing rounds per fixture (default: 3)')
+    arg_parser.add_argument('-m', '--min-time', type=float, default=0.01,
+                            help='minimum seconds per timing round (default: 0.01)')
+    arg_parser.add_argument('-t', '--time-threshold', type=float, default=0.10,
+                            help='allowed slowdown vs baseline as a fraction (default: 0.10)')
+    arg_parser.add_argument('--memory-threshold', type=float, default=0.10,
+                            help='allowed peak memory increase vs baseline as a fraction (default: 0.10)')
+    args = arg_parser.parse_args()
+
+    if args.parsers:
+        parser_names = [jc.lib._cliname_to_modname(p.strip()) for p in args.parsers.split(',')]
+    else:
+        parser_names = [jc.lib._cliname_to_modname(p) for p in jc.lib.parsers]
+
+    report: Dict[str, Any] = {
+        'jc_version': jc.__version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'repeat': args.repeat,
+        'min_time': args.min_time,
+        'parsers': {},
+        'skipped': []
+    }
+
+    for parser_name in parser_names:
+        result = bench_parser(parser_name, args.repeat, args.min_time)
+        if result is None:
+            report['skipped'].append(parser_name)
+            continue
+
+        report['parsers'][parser_name] = result
+
+        for mode, stats in result['modes'].items():
+            lines_per_sec = f"{stats['lines_per_sec']:,.0f}" if stats['lines_per_sec'] else '-'
+            mb_per_sec = f"{stats['mb_per_sec']:,.2f}" if stats['mb_per_sec'] else '-'
+            print(f"{parser_name:<24} {mode:<10} {lines_per_sec:>12} lines/s {mb_per_sec:>9} MB/s "
+                  f"{stats['peak_memory'] / 1_000_000:>9.2f} MB peak"
+                  f"{'  (' + str(len(stats['errors'])) + ' errors)' if stats['errors'] else ''}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(report, baseline, args.time_threshold, args.memory_threshold)
+
+        if regressions:
+            print('\nRegressions:')
+            for regression in regressions:
+                print(f'  {regression}')
+            return 1
+
+        print('\nNo regressions found.')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# Check that parsers scale linearly with input size.
+#
+# Synthetic inputs from benchmarks/generators.py are parsed at increasing
+# sizes and the scaling exponent between the smallest and largest size is
+# reported: 1.0 is linear, 2.0 is quadratic. Parsers with an exponent above
+# the threshold are listed as non-linear.
+#
+# Inputs are generated in memory, so the largest size should fit in RAM a
+# few times over (the parsed output is usually larger than the input).
+#
+# usage:
+#   ./benchmarks/bench_scaling.py
+#   ./benchmarks/bench_scaling.py -p ps,lsof -s 10M,100M,1G -o scaling.json
+#
+# The exit code is 1 if a parser scales worse than the threshold.
+import os
+import io
+import sys
+import json
+import math
+import time
+import argparse
+from collections import deque
+from typing import Any, Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import jc  # noqa: E402
+import jc.lib  # noqa: E402
+from generators import GENERATORS, generate, parse_size  # noqa: E402
+
+DEFAULT_SIZES = '1M,4M,16M'
+
+
+def parse_func(parser: Any, data: str) -> Callable[[], Any]:
+    """Return a function that fully parses the data"""
+    if jc.lib._parser_is_streaming(parser):
+        # consume the generator without keeping the results
+        return lambda: deque(parser.parse(io.StringIO(data), quiet=True, ignore_exceptions=True), maxlen=0)
+
+    return lambda: parser.parse(data, quiet=True)
+
+
+def time_func(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best time of `repeat` calls"""
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def scaling_exponent(sizes: List[int], seconds: List[float]) -> float:
+    """Return k where time grows as size**k between the smallest and largest size"""
+    return math.log(seconds[-1] / seconds[0]) / math.log(sizes[-1] / sizes[0])
+
+
+def bench_parser(parser_mod_name: str, sizes: List[int], repeat: int) -> Dict[str, Any]:
+    """Time one parser at each input size"""
+    parser = jc.get_parser(parser_mod_name)
+    result: Dict[str, Any] = {'sizes': [], 'seconds': [], 'mb_per_sec': []}
+
+    for size in sizes:
+        data = generate(parser_mod_name, size)
+        seconds = time_func(parse_func(parser, data), repeat)
+        actual_size = len(data.encode('utf-8'))
+        del data
+
+        result['sizes'].append(actual_size)
+        result['seconds'].append(seconds)
+        result['mb_per_sec'].append(actual_size / 1_000_000 / seconds)
+
+    result['exponent'] = scaling_exponent(result['sizes'], result['seconds'])
+    return result
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Check that jc parsers scale linearly with input size.')
+    arg_parser.add_argument('-p', '--parsers', help='comma separated parser module names (default: all generators)')
+    arg_parser.add_argument('-s', '--sizes', default=DEFAULT_SIZES,
+                            help=f'comma separated input sizes (default: {DEFAULT_SIZES})')
+    arg_parser.add_argument('-r', '--repeat', type=int, default=1, help='timing rounds per size (default: 1)')
+    arg_parser.add_argument('-t', '--threshold', type=float, default=1.2,
+                            help='highest scaling exponent allowed (default: 1.2)')
+    arg_parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    args = arg_parser.parse_args()
+
+    sizes = sorted(parse_size(s) for s in args.sizes.split(','))
+    if len(sizes) < 2:
+        arg_parser.error('at least two sizes are required')
+
+    if args.parsers:
+        parser_names = [jc.lib._cliname_to_modname(p.strip()) for p in args.parsers.split(',')]
+    else:
+        parser_names = list(GENERATORS)
+
+    report: Dict[str, Any] = {'jc_version': jc.__version__, 'threshold': args.threshold, 'parsers': {}}
+    non_linear: List[str] = []
+
+    for parser_name in parser_names:
+        result = bench_parser(parser_name, sizes, args.repeat)
+        report['parsers'][parser_name] = result
+
+        throughput = ' '.join(f'{mb:>8.2f}' for mb in result['mb_per_sec'])
+        print(f"{parser_name:<16} {throughput} MB/s   exponent {result['exponent']:.2f}")
+
+        if result['exponent'] > args.threshold:
+            non_linear.append(parser_name)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if non_linear:
+        print(f"\nNon-linear (exponent > {args.threshold}): {', '.join(non_linear)}")
+        return 1
+
+    print('\nAll parsers scale linearly.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Compare the streaming parser output throughput of the batched
+# StreamingEmitter with the per-record print() path used before it.
+#
+# Records are parsed once from repeated fixture lines so only the
+# serialization and output of each path is timed. Output goes to /dev/null.
+#
+# usage: ./benchmarks/bench_streaming_output.py [records] [--color]
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jc  # noqa: E402
+from jc.cli import JcCli  # noqa: E402
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures', 'generic'
+)
+
+PARSERS = {
+    'syslog_s': 'syslog-5424.out',
+    'clf_s': 'common-log-format.log'
+}
+
+
+def load_records(parser: str, fixture: str, count: int) -> List[dict]:
+    with open(os.path.join(FIXTURES_DIR, fixture), 'r', encoding='utf-8') as f:
+        lines = [line for line in f if line.strip()]
+
+    data = (lines * (count // len(lines) + 1))[:count]
+    return list(jc.parse(parser, data, quiet=True, ignore_exceptions=True))
+
+
+def new_cli(color: bool) -> JcCli:
+    cli = JcCli()
+    cli.mono = not color
+    cli.set_custom_colors()
+    return cli
+
+
+def print_path(records: List[dict], color: bool) -> None:
+    cli = new_cli(color)
+    for record in records:
+        cli.data_out = record
+        cli.safe_print_out()
+
+
+def emitter_path(records: List[dict], color: bool) -> None:
+    cli = new_cli(color)
+    emitter = cli.streaming_emitter()
+    for record in records:
+        emitter.emit(record)
+    emitter.flush()
+
+
+def timed(func: Callable, records: List[dict], color: bool) -> float:
+    old_stdout = sys.stdout
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        sys.stdout = devnull
+        try:
+            start = time.perf_counter()
+            func(records, color)
+            return time.perf_counter() - start
+        finally:
+            sys.stdout = old_stdout
+
+
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    count = int(args[0]) if args else 100000
+    color = '--color' in sys.argv
+
+    print(f'{count} records, color={color}')
+    print(f'{"parser":<10} {"print() rec/s":>15} {"emitter rec/s":>15} {"speedup":>8}')
+
+    for parser, fixture in PARSERS.items():
+        records = load_records(parser, fixture, count)
+        old = timed(print_path, records, color)
+        new = timed(emitter_path, records, color)
+        print(f'{parser:<10} {len(records) / old:>15,.0f} {len(records) / new:>15,.0f} {old / new:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# Synthesize large parser inputs from the test fixtures.
+#
+# Each generator keeps the header (and footer) of a real fixture and repeats
+# its body rows with small mutations (unique PIDs, routes, vendor IDs, etc.)
+# until the requested size is reached. Output is written line by line so
+# inputs of 1 GB or more can be generated with bounded memory.
+#
+# usage:
+#   ./benchmarks/generators.py ps 100M -o /tmp/ps-100M.out
+#   ./benchmarks/generators.py ip_route 1G > /tmp/ip_route-1G.out
+#   ./benchmarks/generators.py --list
+import os
+import re
+import sys
+import argparse
+from itertools import count, cycle
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(REPO_DIR, 'tests', 'fixtures')
+
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$', re.IGNORECASE)
+SIZE_UNITS = {'': 1, 'k': 1024, 'm': 1024**2, 'g': 1024**3}
+
+# (header lines, endless body line iterator, footer lines)
+Template = Tuple[List[str], Iterator[str], List[str]]
+
+
+def parse_size(size: str) -> int:
+    """Convert a size like `500K`, `10M`, or `1G` to bytes"""
+    match = SIZE_RE.match(size)
+    if not match:
+        raise ValueError(f'Invalid size: {size}')
+
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).lower()])
+
+
+def read_fixture(path: str) -> List[str]:
+    """Return the lines of a fixture file relative to tests/fixtures"""
+    with open(os.path.join(FIXTURES_DIR, path), 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def _replace_field(line: str, index: int, value: int) -> str:
+    """
+    Replace the whitespace separated numeric field at `index` with `value`,
+    keeping the column alignment of the line.
+    """
+    fields = list(re.finditer(r'\S+', line))
+    if index >= len(fields) or not fields[index].group().isdigit():
+        return line
+
+    start, end = fields[index].span()
+    new = str(value)
+    grow = len(new) - (end - start)
+
+    # right-aligned columns grow to the left into the padding
+    while grow > 0 and start > 1 and line[start - 2:start] == '  ':
+        start -= 1
+        grow -= 1
+
+    return line[:start] + new.rjust(end - start) + line[end:]
+
+
+def renumbered(lines: List[str], index: int, first: int = 1) -> Iterator[str]:
+    """Repeat lines forever with a unique number in the numeric field at `index`"""
+    number = count(first)
+    for line in cycle(lines):
+        yield _replace_field(line, index, next(number))
+
+
+def ps_template() -> Template:
+    lines = read_fixture('centos-7.7/ps-ef.out')
+    return lines[:1], renumbered(lines[1:], 1, first=100000), []
+
+
+def lsof_template() -> Template:
+    lines = read_fixture('centos-7.7/lsof.out')
+    return lines[:1], renumbered(lines[1:], 1, first=100000), []
+
+
+def df_template() -> Template:
+    lines = read_fixture('centos-7.7/df.out')
+    return lines[:1], renumbered(lines[1:], 2), []
+
+
+def ls_template() -> Template:
+    lines = read_fixture('centos-7.7/ls-al.out')
+    body = [line for line in lines[1:] if not line.endswith((' .', ' ..'))]
+    return lines[:1], renumbered(body, 4), []
+
+
+def ip_route_template() -> Template:
+    header = read_fixture('centos-7.7/ip_route.out')
+    devices = ('enp0s3', 'docker0', 'eth1')
+
+    def routes() -> Iterator[str]:
+        for n in count():
+            a, b, c = (n >> 16) & 255, (n >> 8) & 255, n & 255
+            dev = devices[n % len(devices)]
+            if n % 2:
+                yield f'10.{a}.{b}.{c}/32 via 10.0.2.2 dev {dev} proto static metric {n % 1000}'
+            else:
+                yield f'172.{16 + a % 16}.{b}.{c}/32 dev {dev} proto kernel scope link src 172.17.0.1 metric 100'
+
+    return header, routes(), []
+
+
+def syslog_template() -> Template:
+    lines = read_fixture('generic/syslog-5424.out')
+    return [], cycle([line for line in lines if line.strip()]), []
+
+
+def syslog_bsd_template() -> Template:
+    lines = read_fixture('generic/syslog-3164.out')
+    return [], cycle([line for line in lines if line.strip()]), []
+
+
+def clf_template() -> Template:
+    lines = read_fixture('generic/common-log-format.log')
+    return [], cycle([line for line in lines if line.strip()]), []
+
+
+def pci_ids_template() -> Template:
+    lines = read_fixture('generic/pci.ids')
+    first_vendor = next(i for i, line in enumerate(lines) if re.match(r'^[0-9a-f]{4}  ', line))
+    classes = next(i for i, line in enumerate(lines) if line.startswith('C '))
+    while lines[classes - 1].startswith('#') or not lines[classes - 1].strip():
+        classes -= 1
+
+    vendor_lines = lines[first_vendor:classes]
+
+    def vendors() -> Iterator[str]:
+        vendor_id = count()
+        for line in cycle(vendor_lines):
+            if line[:1] not in ('\t', '#', ''):
+                line = f'{next(vendor_id) % 0x10000:04x}{line[4:]}'
+            yield line
+
+    return lines[:first_vendor], vendors(), lines[classes:]
+
+
+def asciitable_m_template() -> Template:
+    border = '+' + '+'.join(['=' * 12] * 5) + '+'
+    row_sep = '+' + '+'.join(['-' * 12] * 5) + '+'
+
+    def cell(value: str) -> str:
+        return f' {value:<10} '
+
+    header = [
+        border,
+        '|' + '|'.join(cell(h) for h in ('pid', 'command', 'state', 'mem', 'note')) + '|',
+        '|' + '|'.join(cell(h) for h in ('', 'line', '', 'usage', '')) + '|',
+        border
+    ]
+
+    def rows() -> Iterator[str]:
+        for n in count(1):
+            yield '|' + '|'.join(cell(v) for v in (str(n), 'python3', 'running', f'{n % 9999}K', 'multi')) + '|'
+            yield '|' + '|'.join(cell(v) for v in ('', '-m http', '', '', 'line')) + '|'
+            yield row_sep
+
+    return header, rows(), [border]
+
+
+GENERATORS: Dict[str, Callable[[], Template]] = {
+    'asciitable_m': asciitable_m_template,
+    'clf': clf_template,
+    'clf_s': clf_template,
+    'df': df_template,
+    'ip_route': ip_route_template,
+    'ls': ls_template,
+    'ls_s': ls_template,
+    'lsof': lsof_template,
+    'pci_ids': pci_ids_template,
+    'ps': ps_template,
+    'syslog': syslog_template,
+    'syslog_s': syslog_template,
+    'syslog_bsd': syslog_bsd_template,
+    'syslog_bsd_s': syslog_bsd_template
+}
+
+
+def generate_lines(parser_mod_name: str, size: int) -> Iterator[str]:
+    """
+    Yield the lines (without newlines) of a synthetic input for a parser.
+    The input is at least `size` bytes long once UTF-8 encoded.
+    """
+    if parser_mod_name not in GENERATORS:
+        raise ValueError(f'No generator for parser: {parser_mod_name}')
+
+    header, body, footer = GENERATORS[parser_mod_name]()
+    total = 0
+
+    for line in header:
+        total += len(line.encode('utf-8')) + 1
+        yield line
+
+    for line in body:
+        if total >= size:
+            break
+        total += len(line.encode('utf-8')) + 1
+        yield line
+
+    yield from footer
+
+
+def generate(parser_mod_name: str, size: int) -> str:
+    """Return a synthetic input of about `size` bytes for a parser"""
+    return '\n'.join(generate_lines(parser_mod_name, size)) + '\n'
+
+
+def write(
+    parser_mod_name: str,
+    size: int,
+    stream: TextIO,
+    chunk_lines: int = 10000
+) -> None:
+    """Write a synthetic input of about `size` bytes to a text stream"""
+    chunk: List[str] = []
+
+    for line in generate_lines(parser_mod_name, size):
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            stream.write('\n'.join(chunk) + '\n')
+            chunk = []
+
+    if chunk:
+        stream.write('\n'.join(chunk) + '\n')
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Generate large synthetic inputs for jc parsers.')
+    arg_parser.add_argument('parser', nargs='?', help='parser module name (e.g. ps, lsof, ip_route)')
+    arg_parser.add_argument('size', nargs='?', default='10M', help='output size, e.g. 10M or 1G (default: 10M)')
+    arg_parser.add_argument('-o', '--output', help='write to this file instead of STDOUT')
+    arg_parser.add_argument('-l', '--list', action='store_true', help='list the available generators')
+    args = arg_parser.parse_args()
+
+    if args.list or not args.parser:
+        print('\n'.join(GENERATORS))
+        return 0
+
+    try:
+        size = parse_size(args.size)
+        output: Optional[TextIO] = open(args.output, 'w', encoding='utf-8') if args.output else None
+        try:
+            write(args.parser, size, output or sys.stdout)
+        finally:
+            if output:
+                output.close()
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# build the parser metadata index (jc/parser_index.py) from the info class of
+# each built-in parser so parser listing and magic command lookups do not need
+# to import every parser module at runtime
+import importlib
+import jc.lib
+
+index_entries = []
+
+for p in jc.lib.parsers:
+    parser_mod_name = jc.lib._cliname_to_modname(p)
+
+    # plugin parsers are not part of the package so they are not indexed
+    try:
+        parser_mod = importlib.import_module(f'jc.parsers.{parser_mod_name}')
+    except ModuleNotFoundError:
+        continue
+
+    attributes = [
+        f'        {k!r}: {v!r},' for k, v in vars(parser_mod.info).items()
+        if not k.startswith('__')
+    ]
+    index_entries.append(f'    {parser_mod_name!r}: {{\n' + '\n'.join(attributes) + '\n    },')
+
+index_entries_text = '\n'.join(index_entries)
+
+output = f'''\
+"""jc - JSON Convert parser metadata index
+
+This file is generated by build-parser-index.py from the info class of each
+built-in parser. Do not edit it manually.
+"""
+from typing import Any, Dict
+
+version: str = {jc.lib.__version__!r}
+
+parser_index: Dict[str, Dict[str, Any]] = {{
+{index_entries_text}
+}}
+'''
+
+with open('jc/parser_index.py', 'w') as f:
+    f.write(output)
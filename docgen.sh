@@ -24,6 +24,11 @@ cd jc
     ../doc2md.py jc.streaming > ../docs/streaming.md && echo "+++ streaming docs complete" || echo "*** STREAMING DOCS FAILED ***"
 ) &
 
+(
+    echo Building docs for: server
+    ../doc2md.py jc.server > ../docs/server.md && echo "+++ server docs complete" || echo "*** SERVER DOCS FAILED ***"
+) &
+
 (
     echo Building docs for: universal parser
     ../doc2md.py jc.parsers.universal > ../docs/parsers/universal.md && echo "+++ universal parser docs complete" || echo "*** UNIVERSAL PARSER DOCS FAILED ***"
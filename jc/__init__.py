@@ -83,6 +83,30 @@ Use `help(jc.lib)` for details.
 High-level API to easily access the parser. This API will find both
 built-in parsers and local plugin parsers.
 
+### parse_many
+
+    parse_many(
+        parser_module_name: str,
+        inputs: Iterable[str],
+        workers: int | None = None
+    ) -> list[dict | list[dict]]
+
+Parse many files in parallel with a standard parser using a pool of worker
+processes. Results are returned in input order and each result is tagged
+with a `_file` key.
+
+### parse_items
+
+    parse_items(
+        parser_module_name: str,
+        items: Iterable,
+        workers: int | None = None
+    ) -> Iterable[dict | list[dict]]
+
+Lazily parse each item of an iterable (e.g. lines of slurped input)
+separately using a pool of worker processes. Results are yielded in input
+order.
+
 ### get_parser
 
     get_parser(
@@ -147,6 +171,8 @@ Get a list of streaming parser module names to be used in
 from .lib import (
     __version__ as __version__,
     parse as parse,
+    parse_many as parse_many,
+    parse_items as parse_items,
     get_parser as get_parser,
     parser_mod_list as parser_mod_list,
     plugin_parser_mod_list as plugin_parser_mod_list,
@@ -4,27 +4,33 @@ JC cli module
 
 import io
 import sys
+import codecs
 import os
 import re
+import mmap
+import stat
 from datetime import datetime, timezone
 import textwrap
 import shlex
-import subprocess
-from typing import List, Dict, Iterable, Union, Optional, TextIO
+from typing import Any, BinaryIO, Callable, List, Dict, Iterable, Iterator, Union, Optional, TextIO
 from types import ModuleType
 from .lib import (
     __version__, parser_info, all_parser_info, parsers, get_parser, _parser_is_streaming,
     parser_mod_list, standard_parser_mod_list, plugin_parser_mod_list, streaming_parser_mod_list,
-    slurpable_parser_mod_list, _parser_is_slurpable
+    slurpable_parser_mod_list, _parser_is_slurpable, parse_many, parse_items, _add_file_key,
+    parse
 )
 from .jc_types import JSONDictType, CustomColorType, ParserInfoType
 from . import utils
 from .cli_data import (
-    long_options_map, new_pygments_colors, old_pygments_colors, helptext_preamble_string,
-    slicetext_string, helptext_end_string
+    long_options_map, value_options_map, new_pygments_colors, old_pygments_colors,
+    helptext_preamble_string, slicetext_string, helptext_end_string
 )
 from .shell_completions import bash_completion, zsh_completion
 from . import tracebackplus
+from .colorizer import JsonColorizer
+from .emitter import StreamingEmitter, write_json, write_yaml
+from .magic import MagicCommand
 from .exceptions import LibraryNotInstalled, ParseError
 
 PYGMENTS_INSTALLED: bool = False
@@ -44,6 +50,8 @@ JC_ERROR_EXIT: int = 100
 MAX_EXIT: int = 255
 SLICER_PATTERN: str = r'-?[0-9]*\:-?[0-9]*$'
 SLICER_RE = re.compile(SLICER_PATTERN)
+STREAM_FLUSH_RECORDS: int = 1000
+STREAM_FLUSH_INTERVAL: float = 1.0
 
 
 class info():
@@ -67,7 +75,7 @@ if PYGMENTS_INSTALLED:
 
 class JcCli():
     __slots__ = ('data_in', 'data_out', 'options', 'args', 'parser_module',
-                 'parser_name', 'indent', 'pad', 'custom_colors',
+                 'parser_name', 'indent', 'pad', 'custom_colors', 'colorizer',
                  'show_hidden', 'show_categories', 'ascii_only',
                  'json_separators', 'json_indent', 'run_timestamp',
                  'inputlist', 'about', 'debug', 'verbose_debug',
@@ -75,11 +83,13 @@ class JcCli():
                  'ignore_exceptions', 'raw', 'slurp', 'meta_out', 'unbuffer',
                  'version_info', 'yaml_output', 'bash_comp', 'zsh_comp',
                  'magic_found_parser', 'magic_options', 'magic_run_command',
-                 'magic_run_command_str', 'magic_stdout', 'magic_stderr',
-                 'magic_returncode', 'slice_str', 'slice_start', 'slice_end')
+                 'magic_run_command_str', 'magic_stdout', 'magic_command',
+                 'magic_timeout', 'magic_returncode', 'magic_proc_parser', 'slice_str', 'slice_start', 'slice_end',
+                 'value_options', 'serve_socket', 'client_socket', 'json_lines',
+                 'files', 'workers', 'input_file')
 
     def __init__(self) -> None:
-        self.data_in: Optional[Union[str, bytes, TextIO, Iterable[str]]] = None
+        self.data_in: Optional[Union[str, bytes, mmap.mmap, TextIO, Iterable[str]]] = None
         self.data_out: Optional[Union[List[JSONDictType], JSONDictType]] = None
         self.options: List[str] = []
         self.args: List[str] = []
@@ -88,6 +98,7 @@ class JcCli():
         self.indent: int = 0
         self.pad: int = 0
         self.custom_colors: CustomColorType = {}
+        self.colorizer: Optional[JsonColorizer] = None
         self.show_hidden: bool = False
         self.show_categories: bool = False
         self.ascii_only: bool = False
@@ -95,6 +106,7 @@ class JcCli():
         self.json_indent: Optional[int] = None
         self.run_timestamp: Optional[datetime] = None
         self.inputlist: Optional[List[str]] = None
+        self.value_options: Dict[str, Union[str, List[str]]] = {}
 
         # slicer
         self.slice_str: str = ''
@@ -119,19 +131,28 @@ class JcCli():
         self.yaml_output: bool = False
         self.bash_comp: bool = False
         self.zsh_comp: bool = False
+        self.json_lines: bool = False
+        self.serve_socket: Optional[str] = None
+        self.client_socket: Optional[str] = None
+        self.files: List[str] = []
+        self.workers: Optional[int] = None
+        self.input_file: Optional[str] = None
 
         # magic attributes
         self.magic_found_parser: Optional[str] = None
         self.magic_options: List[str] = []
         self.magic_run_command: Optional[List[str]] = None
         self.magic_run_command_str: str = ''
-        self.magic_stdout: Optional[Union[str, Iterable[str]]] = None
-        self.magic_stderr: Optional[str] = None
+        self.magic_stdout: Optional[Union[str, bytes, Iterable[str]]] = None
+        self.magic_command: Optional[MagicCommand] = None
+        self.magic_timeout: Optional[float] = None
         self.magic_returncode: int = 0
+        self.magic_proc_parser: Optional[str] = None
 
     def set_custom_colors(self) -> None:
         """
-        Sets the custom_colors dictionary to be used in Pygments custom style class.
+        Sets the custom_colors dictionary to be used in Pygments custom style
+        class and the native JSON colorizer with the same colors.
 
         Grab custom colors from JC_COLORS environment variable. JC_COLORS env
         variable takes 4 comma separated string values and should be in the
@@ -146,6 +167,9 @@ class JcCli():
         Default colors:
         JC_COLORS=blue,brightblack,magenta,green
         JC_COLORS=default,default,default,default
+
+        JSON output is colored by the native colorizer unless the JC_COLORIZER
+        environment variable is set to `pygments`.
         """
         if PYGMENTS_INSTALLED:
             input_error = False
@@ -176,6 +200,10 @@ class JcCli():
                 String: PYGMENT_COLOR[color_list[3]] if color_list[3] != 'default' else PYGMENT_COLOR['green']                         # strings
             }
 
+            # Pygments 2.3 uses different color codes, so it colors the output itself
+            if os.getenv('JC_COLORIZER') != 'pygments' and PYGMENT_COLOR is new_pygments_colors:
+                self.colorizer = JsonColorizer(*color_list)
+
     def set_mono(self) -> None:
         """
         Sets mono attribute based on CLI options.
@@ -264,6 +292,15 @@ class JcCli():
             padding_text: str = padding_char * padding
             otext += indent_text + o_combined + padding_text + o_desc + '\n'
 
+        for option in value_options_map:
+            o_value: str = value_options_map[option][0]
+            o_desc = value_options_map[option][1]
+            o_combined = option + ' ' + o_value
+            padding = self.pad - len(o_combined)
+            indent_text = padding_char * self.indent
+            padding_text = padding_char * padding
+            otext += indent_text + o_combined + padding_text + o_desc + '\n'
+
         return otext
 
     @staticmethod
@@ -353,64 +390,66 @@ class JcCli():
         Return a YAML formatted string. String may include color codes. If the
         YAML library is not installed, output will fall back to JSON with a
         warning message to STDERR"""
-        # make ruamel.yaml import optional
+        from .yaml_backend import dumps as yaml_dumps
+
         try:
-            from ruamel.yaml import YAML, representer
-            YAML_INSTALLED = True
-        except Exception:
-            YAML_INSTALLED = False
+            y_string = yaml_dumps(self.data_out, self.ascii_only)
+        except LibraryNotInstalled:
+            utils.warning_message(['YAML Library not installed. Reverting to JSON output.'])
+            return self.json_out()
 
-        if YAML_INSTALLED:
-            y_string_buf = io.BytesIO()
+        colorize = self.yaml_colorizer()
 
-            # monkey patch to disable plugins since we don't use them and in
-            # ruamel.yaml versions prior to 0.17.0 the use of __file__ in the
-            # plugin code is incompatible with the pyoxidizer packager
-            YAML.official_plug_ins = lambda a: []  # type: ignore
+        if colorize:
+            return colorize(y_string)
 
-            # monkey patch to disable aliases
-            representer.RoundTripRepresenter.ignore_aliases = lambda x, y: True  # type: ignore
+        return y_string
 
-            yaml = YAML()
-            yaml.default_flow_style = False
-            yaml.explicit_start = True  # type: ignore
-            yaml.allow_unicode = not self.ascii_only
-            yaml.encoding = 'utf-8'
-            yaml.dump(self.data_out, y_string_buf)
-            y_string = y_string_buf.getvalue().decode('utf-8')[:-1]
+    def yaml_colorizer(self) -> Optional[Callable[[str], str]]:
+        """
+        Return a function that adds color codes to a YAML string or None if
+        output is monochrome. The Pygments lexer and formatter are created
+        once so the function can be called for every streamed record.
+        """
+        if self.mono or not PYGMENTS_INSTALLED:
+            return None
 
-            if not self.mono:
-                class JcStyle(Style):
-                    styles: CustomColorType = self.custom_colors
+        class JcStyle(Style):
+            styles: CustomColorType = self.custom_colors
 
-                return str(highlight(y_string, YamlLexer(), Terminal256Formatter(style=JcStyle))[0:-1])
+        lexer = YamlLexer()
+        formatter = Terminal256Formatter(style=JcStyle)
 
-            return y_string
+        def colorize(y_string: str) -> str:
+            return str(highlight(y_string, lexer, formatter)[0:-1])
 
-        utils.warning_message(['YAML Library not installed. Reverting to JSON output.'])
-        return self.json_out()
+        return colorize
 
     def json_out(self) -> str:
         """
         Return a JSON formatted string. String may include color codes or be
         pretty printed.
         """
-        import json
+        from .json_backend import dumps
 
-        if self.pretty:
+        if self.pretty and not self.json_lines:
             self.json_indent = 2
             self.json_separators = None
 
-        # Convert any non-serializable object to a string
-        def string_serializer(data):
-            return str(data)
+        if not self.mono and self.colorizer:
+            return self.colorizer.dumps(
+                self.data_out,
+                self.json_indent,
+                self.json_separators,
+                self.ascii_only
+            )
 
-        j_string = json.dumps(
+        # Convert any non-serializable object to a string
+        j_string = dumps(
             self.data_out,
-            indent=self.json_indent,
-            separators=self.json_separators,
-            ensure_ascii=self.ascii_only,
-            default=string_serializer
+            self.json_indent,
+            self.json_separators,
+            self.ascii_only
         )
 
         if not self.mono and PYGMENTS_INSTALLED:
@@ -421,21 +460,209 @@ class JcCli():
 
         return j_string
 
+    def json_colorizer(self) -> Optional[Callable[[str], str]]:
+        """
+        Return a function that adds color codes to a JSON string with Pygments
+        or None if output is monochrome or colored by the native colorizer.
+        The Pygments lexer and formatter are created once so the function can
+        be called for every streamed record.
+        """
+        if self.mono or self.colorizer or not PYGMENTS_INSTALLED:
+            return None
+
+        class JcStyle(Style):
+            styles: CustomColorType = self.custom_colors
+
+        lexer = JsonLexer()
+        formatter = Terminal256Formatter(style=JcStyle)
+
+        def colorize(j_string: str) -> str:
+            return str(highlight(j_string, lexer, formatter)[0:-1])
+
+        return colorize
+
+    def streaming_emitter(self, pretty: bool = True) -> StreamingEmitter:
+        """
+        Return a StreamingEmitter for JSON Lines or YAML document output of
+        streaming parsers. The --pretty option is ignored if pretty is False.
+
+        The output batch size can be set with the JC_FLUSH_RECORDS (number of
+        records) and JC_FLUSH_INTERVAL (seconds) environment variables.
+        """
+        flush_records = STREAM_FLUSH_RECORDS
+        flush_interval = STREAM_FLUSH_INTERVAL
+
+        try:
+            flush_records = int(os.getenv('JC_FLUSH_RECORDS', STREAM_FLUSH_RECORDS))
+            flush_interval = float(os.getenv('JC_FLUSH_INTERVAL', STREAM_FLUSH_INTERVAL))
+        except ValueError:
+            utils.warning_message(['Could not parse JC_FLUSH_RECORDS or JC_FLUSH_INTERVAL environment variable'])
+
+        if self.yaml_output:
+            from .yaml_backend import dumps as yaml_dumps, get_yaml
+
+            if get_yaml() is not None:
+                return StreamingEmitter(
+                    sys.stdout.buffer,
+                    encoding=sys.stdout.encoding or 'utf-8',
+                    ascii_only=self.ascii_only,
+                    colorize=self.yaml_colorizer(),
+                    dumps=lambda data, indent, separators, ascii_only: yaml_dumps(data, ascii_only),
+                    flush_records=flush_records,
+                    flush_interval=flush_interval,
+                    unbuffer=self.unbuffer
+                )
+
+            utils.warning_message(['YAML Library not installed. Reverting to JSON output.'])
+
+        if self.pretty and pretty:
+            self.json_indent = 2
+            self.json_separators = None
+
+        colorizer = None if self.mono else self.colorizer
+
+        return StreamingEmitter(
+            sys.stdout.buffer,
+            encoding=sys.stdout.encoding or 'utf-8',
+            indent=self.json_indent,
+            separators=self.json_separators,
+            ascii_only=self.ascii_only,
+            colorize=self.json_colorizer(),
+            dumps=colorizer.dumps if colorizer else None,
+            flush_records=flush_records,
+            flush_interval=flush_interval,
+            unbuffer=self.unbuffer
+        )
+
     def safe_print_out(self) -> None:
-        """Safely prints JSON or YAML output in both UTF-8 and ASCII systems"""
+        """
+        Safely prints JSON or YAML output in both UTF-8 and ASCII systems. If
+        JSON Lines output is selected, each item of a list is printed on its
+        own line.
+        """
         if self.yaml_output:
+            if self.mono and hasattr(sys.stdout, 'buffer') \
+                    and codecs.lookup(sys.stdout.encoding or 'utf-8').name == 'utf-8':
+                self.yaml_write_out()
+                return
+
             try:
                 print(self.yaml_out(), flush=self.unbuffer)
             except UnicodeEncodeError:
                 self.ascii_only = True
                 print(self.yaml_out(), flush=self.unbuffer)
 
+        elif self.json_lines and isinstance(self.data_out, list):
+            all_data = self.data_out
+            for item in all_data:
+                self.data_out = item
+                self.safe_print_json()
+
+            self.data_out = all_data
+
+        elif (self.mono or self.colorizer) and hasattr(sys.stdout, 'buffer'):
+            self.json_write_out()
+
         else:
-            try:
-                print(self.json_out(), flush=self.unbuffer)
-            except UnicodeEncodeError:
-                self.ascii_only = True
-                print(self.json_out(), flush=self.unbuffer)
+            self.safe_print_json()
+
+    def safe_print_json(self) -> None:
+        """Safely prints JSON output in both UTF-8 and ASCII systems"""
+        try:
+            print(self.json_out(), flush=self.unbuffer)
+        except UnicodeEncodeError:
+            self.ascii_only = True
+            print(self.json_out(), flush=self.unbuffer)
+
+    def json_write_out(self) -> None:
+        """
+        Write JSON output to STDOUT in pieces through a fixed size buffer.
+        Large dictionaries and lists are encoded in runs of items so the
+        output is never held in memory both as objects and as one JSON string.
+        Colored output is encoded with the native colorizer.
+        """
+        if self.pretty:
+            self.json_indent = 2
+            self.json_separators = None
+
+        colorizer = None if self.mono else self.colorizer
+
+        sys.stdout.flush()
+        write_json(
+            sys.stdout.buffer,
+            self.data_out,
+            encoding=sys.stdout.encoding or 'utf-8',
+            indent=self.json_indent,
+            separators=self.json_separators,
+            ascii_only=self.ascii_only,
+            dumps=colorizer.dumps if colorizer else None,
+            key_encoder=colorizer.key_encoder(self.ascii_only) if colorizer else None
+        )
+
+    def yaml_write_out(self) -> None:
+        """
+        Write monochrome YAML output to a UTF-8 STDOUT in pieces through a
+        fixed size buffer. The items of a large list or dictionary are
+        encoded one at a time. If the YAML library is not installed, output
+        will fall back to JSON with a warning message to STDERR.
+        """
+        sys.stdout.flush()
+
+        try:
+            write_yaml(sys.stdout.buffer, self.data_out, ascii_only=self.ascii_only)
+        except LibraryNotInstalled:
+            utils.warning_message(['YAML Library not installed. Reverting to JSON output.'])
+            self.json_write_out()
+
+    def parse_value_options(self) -> None:
+        """
+        Find long options that take a value (e.g. `--serve SOCKET`) and add
+        them to the value_options dictionary. The options and their values are
+        removed from self.args so they are not mistaken for parsers or magic
+        commands.
+
+        Scanning stops at the first magic command so options meant for the
+        command are left alone.
+        """
+        args: List[str] = self.args[0:1]
+        arg_iter = iter(self.args[1:])
+
+        for arg in arg_iter:
+            if arg in value_options_map:
+                value_name: str = value_options_map[arg][0]
+
+                # multiple values until the next option
+                if value_name.endswith('...'):
+                    values: List[str] = []
+                    for value in arg_iter:
+                        if value.startswith('-'):
+                            args.append(value)
+                            break
+                        values.append(value)
+
+                    if not values:
+                        utils.error_message([f'Missing {value_name[:-3]} value for the {arg} option. Use "jc -h" for help.'])
+                        self.exit_error()
+
+                    self.value_options[arg] = values
+                    continue
+
+                single_value = next(arg_iter, None)
+                if single_value is None:
+                    utils.error_message([f'Missing {value_name} value for the {arg} option. Use "jc -h" for help.'])
+                    self.exit_error()
+
+                self.value_options[arg] = single_value  # type: ignore
+                continue
+
+            args.append(arg)
+
+            # magic command found - stop looking for options
+            if not arg.startswith('-') and ':' not in arg:
+                args.extend(arg_iter)
+                break
+
+        self.args = args
 
     def magic_parser(self) -> None:
         """
@@ -491,45 +718,79 @@ class JcCli():
         for entry in all_parser_info():
             magic_dict.update({mc: entry['argument'] for mc in entry.get('magic_commands', [])})
 
-        # set the command list and string
+        # set the command list
         self.magic_run_command = args_given
 
-        if self.magic_run_command:
-            try:
-                # python 3.8+
-                self.magic_run_command_str = shlex.join(self.magic_run_command)
-            except AttributeError:
-                # older python versions
-                self.magic_run_command_str = ' '.join(self.magic_run_command)
-
         # try to get a parser for two_word_command, otherwise get one for one_word_command
         one_word_command: str = self.magic_run_command[0]
         two_word_command: str = ' '.join(self.magic_run_command[0:2])
         self.magic_found_parser = magic_dict.get(two_word_command, magic_dict.get(one_word_command))
 
+        # a command name with a `-s` suffix selects the streaming parser of the
+        # command, if it has one: `jc ping-s 1.1.1.1`
+        if not self.magic_found_parser and one_word_command.endswith('-s'):
+            command: List[str] = [one_word_command[:-2]] + self.magic_run_command[1:]
+            parser = magic_dict.get(' '.join(command[0:2]), magic_dict.get(command[0]))
+
+            if parser and self.parser_shortname(parser + '-s').replace('-', '_') in streaming_parser_mod_list():
+                self.magic_run_command = command
+                self.magic_found_parser = parser + '-s'
+
+        # set the command string
+        try:
+            # python 3.8+
+            self.magic_run_command_str = shlex.join(self.magic_run_command)
+        except AttributeError:
+            # older python versions
+            self.magic_run_command_str = ' '.join(self.magic_run_command)
+
     @staticmethod
     def open_text_file(path_string: str) -> str:
         with open(path_string, 'r') as f:
             return f.read()
 
+    def open_input_file(self) -> TextIO:
+        """
+        Open the --file input as UTF-8 text for line by line parsing. Bytes
+        that are not UTF-8 are kept as surrogates like with STDIN, so they do
+        not raise an error. The caller closes the file.
+        """
+        return open(self.input_file, 'r', encoding='utf-8', errors='surrogateescape')  # type: ignore
+
+    def magic_output_is_lazy(self) -> bool:
+        """
+        Return True if the magic command output is read lazily while it is
+        parsed: by streaming parsers and for slurped JSON Lines output.
+        """
+        return _parser_is_streaming(get_parser(self.magic_found_parser)) \
+            or (self.slurp and self.json_lines and not self.yaml_output)  # type: ignore
+
     def run_user_command(self) -> None:
         """
-        Use subprocess to run the user's command.
-        Updates magic_stdout, magic_stderr, and magic_returncode.
+        Start the user's command. Its STDERR is forwarded to STDERR as it
+        arrives. If the output is not read lazily while it is parsed, then
+        read it until the command exits.
+        Updates magic_command, magic_stdout, and magic_returncode.
         """
         if self.magic_run_command:
-            proc = subprocess.Popen(
-                self.magic_run_command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                close_fds=False,           # Allows inheriting file descriptors
-                universal_newlines=True,   # which is useful for process substitution
-                encoding='UTF-8'
-            )
+            self.magic_command = MagicCommand(self.magic_run_command, timeout=self.magic_timeout)
 
-            self.magic_stdout, self.magic_stderr = proc.communicate()
-            self.magic_stdout = self.magic_stdout or '\n'
-            self.magic_returncode = proc.returncode
+            if not self.magic_output_is_lazy():
+                self.magic_stdout = self.magic_command.read() or '\n'
+                self.wait_user_command()
+
+    def wait_user_command(self) -> None:
+        """
+        Wait for the user's command to exit and warn if it was stopped by the
+        --timeout option. Updates magic_returncode.
+        """
+        if self.magic_command:
+            self.magic_returncode = self.magic_command.wait()
+
+            if self.magic_command.timed_out:
+                utils.warning_message([
+                    f'"{self.magic_run_command_str}" command timed out after {self.magic_timeout:g} seconds.'
+                ])
 
     def do_magic(self) -> None:
         """
@@ -541,12 +802,21 @@ class JcCli():
         If multiple /proc files are detected, then a list of string output
         is sent to self.magic_stdout and a corresponding list of proc filenames
         is sent to self.inputlist.
+
+        If all of the /proc files are known Proc files of the same type, then
+        the name of their parser is sent to self.magic_proc_parser so the file
+        type does not need to be detected from the file contents.
         """
         if self.magic_run_command_str.startswith('/proc'):
             try:
                 self.magic_found_parser = 'proc'
                 filelist = shlex.split(self.magic_run_command_str)
 
+                from .parsers.proc import parser_from_filename
+                proc_parsers = {parser_from_filename(file) for file in filelist}
+                if len(proc_parsers) == 1:
+                    self.magic_proc_parser = proc_parsers.pop()
+
                 # multiple proc files detected
                 if len(filelist) > 1:
                     self.slurp = True
@@ -587,8 +857,6 @@ class JcCli():
         elif self.magic_found_parser:
             try:
                 self.run_user_command()
-                if self.magic_stderr:
-                    utils._safe_print(self.magic_stderr[:-1], file=sys.stderr)
 
             except OSError as e:
                 if self.debug:
@@ -632,7 +900,8 @@ class JcCli():
                 utils.error_message(['Missing or incorrect arguments. Use "jc -h" for help.'])
                 self.exit_error()
 
-        if sys.stdin.isatty() and self.magic_stdout is None:
+        if sys.stdin.isatty() and self.magic_stdout is None and not self.magic_command \
+           and not self.files and not self.input_file:
             utils.error_message(['Missing piped data. Use "jc -h" for help.'])
             self.exit_error()
 
@@ -657,7 +926,12 @@ class JcCli():
 
             if self.magic_run_command:
                 meta_obj['magic_command'] = self.magic_run_command
-                meta_obj['magic_command_exit'] = self.magic_returncode
+
+                # the exit code is null while the command output is streamed
+                if self.magic_command:
+                    meta_obj['magic_command_exit'] = self.magic_command.returncode
+                else:
+                    meta_obj['magic_command_exit'] = self.magic_returncode
 
             if self.inputlist:
                 meta_obj['input_list'] = self.inputlist
@@ -684,7 +958,12 @@ class JcCli():
                 self.exit_error()
 
     def slicer(self) -> None:
-        """Slice input data lazily, if possible. Updates self.data_in"""
+        """
+        Slice input data lazily, if possible. Updates self.data_in
+
+        Memory-mapped input is decoded to a UTF-8 string, if possible.
+        Otherwise it is converted to bytes.
+        """
         if self.slice_str:
             slice_start_str, slice_end_str = self.slice_str.split(':', maxsplit=1)
             if slice_start_str:
@@ -692,7 +971,20 @@ class JcCli():
             if slice_end_str:
                 self.slice_end = int(slice_end_str)
 
-        self.data_in = utils.line_slice(self.data_in, self.slice_start, self.slice_end)
+        mapped_data = self.data_in if isinstance(self.data_in, mmap.mmap) else None
+
+        try:
+            self.data_in = utils.line_slice(self.data_in, self.slice_start, self.slice_end)
+
+            if mapped_data is not None and self.data_in is mapped_data:
+                try:
+                    self.data_in = str(mapped_data, 'utf-8')
+                except UnicodeDecodeError:
+                    self.data_in = mapped_data[:]
+
+        finally:
+            if mapped_data is not None:
+                mapped_data.close()
 
     def create_slurp_output(self) -> None:
         """
@@ -715,82 +1007,270 @@ class JcCli():
 
             # single-line string parsers
             if isinstance(self.data_in, str):
-                items = self.data_in.splitlines()
-                self.inputlist = []
-
-                for line in items:
-                    line = line.strip()
-                    self.inputlist.append(line)
-                    parsed_line = self.parser_module.parse(
-                        line,
-                        raw=self.raw,
-                        quiet=self.quiet
-                    )
-
-                    self.data_out.append(parsed_line)
+                self.inputlist = [line.strip() for line in self.data_in.splitlines()]
+                self.data_out = list(self.slurp_parse(self.inputlist))
 
             # multiple files from /proc magic syntax
             elif isinstance(self.data_in, List) and self.inputlist:
-                items = self.data_in
-
-                for mline in zip(self.inputlist, items):
-                    parsed_line = self.parser_module.parse(
-                        mline[1],
-                        raw=self.raw,
-                        quiet=self.quiet
-                    )
-
-                    if isinstance(parsed_line, dict):
-                        parsed_line.update({'_file': mline[0]})
-
-                    elif isinstance(parsed_line, List):
-                        for obj in parsed_line:
-                            obj.update({'_file': mline[0]})
-
-                    self.data_out.append(parsed_line)
+                for file, parsed_line in zip(self.inputlist, self.slurp_parse(self.data_in)):
+                    self.data_out.append(_add_file_key(parsed_line, file))
 
             if self.meta_out:
                 self.data_out = {"result": self.data_out}
                 self.run_timestamp = datetime.now(timezone.utc)
                 self.add_metadata_to_output()
 
+    def proc_file_parser(self) -> ModuleType:
+        """
+        Return the parser module to parse with. This is the Proc file parser
+        found from the /proc magic syntax filenames, if any, so the proc
+        parser does not need to detect the file type. The parser name in the
+        metadata is still `proc`.
+        """
+        if self.magic_proc_parser:
+            return get_parser(self.magic_proc_parser)
+
+        return self.parser_module  # type: ignore
+
+    def slurp_parse(self, items: Iterable[Any]) -> Iterator[Union[JSONDictType, List[JSONDictType]]]:
+        """
+        Parse each slurped item and lazily yield the results in input order.
+        Items are parsed by a pool of worker processes if --workers is used.
+        """
+        return parse_items(
+            self.proc_file_parser(),
+            items,
+            workers=self.workers or 1,
+            raw=self.raw,
+            quiet=self.quiet
+        )
+
+    def slurp_stream_and_print(self) -> None:
+        """
+        Parse slurped input and print each result as a JSON Line as soon as it
+        is available. Input lines are read lazily so memory use stays bounded
+        for long inputs.
+
+        If --meta-out is used then metadata is added to each result like with
+        streaming parsers.
+        """
+        files: Optional[List[str]] = None
+        input_file: Optional[TextIO] = None
+
+        # multiple files from /proc magic syntax
+        if isinstance(self.magic_stdout, list):
+            files = self.inputlist
+            self.inputlist = None
+            self.data_in = self.magic_stdout
+
+        elif self.magic_stdout is not None:
+            self.data_in = io.StringIO(self.magic_stdout)  # type: ignore
+
+        elif self.magic_command:
+            self.data_in = self.magic_command.lines()
+
+        elif self.input_file:
+            self.data_in = input_file = self.open_input_file()
+
+        else:
+            self.data_in = sys.stdin
+
+        self.slicer()
+
+        items: Iterable[str] = self.data_in if files else (line.strip() for line in self.data_in)  # type: ignore
+        emitter = self.streaming_emitter()
+
+        try:
+            for index, result in enumerate(self.slurp_parse(items)):
+                self.data_out = _add_file_key(result, files[index]) if files else result
+                if self.meta_out:
+                    self.run_timestamp = datetime.now(timezone.utc)
+                    self.add_metadata_to_output()
+
+                emitter.emit(self.data_out)
+
+        finally:
+            emitter.flush()
+
+            if input_file:
+                input_file.close()
+
+        self.wait_user_command()
+
     def create_normal_output(self) -> None:
-        """standard output - updates self.data_out"""
+        """
+        standard output - updates self.data_out
+
+        Large tables are parsed in chunks by a pool of worker processes if
+        --workers is used and the parser supports it.
+        """
         if self.parser_module:
-            self.data_out = self.parser_module.parse(
-                self.data_in,
+            self.data_out = parse(
+                self.proc_file_parser(),
+                self.data_in,  # type: ignore
                 raw=self.raw,
-                quiet=self.quiet
+                quiet=self.quiet,
+                workers=self.workers
             )
 
             if self.meta_out:
                 self.run_timestamp = datetime.now(timezone.utc)
                 self.add_metadata_to_output()
 
-    def streaming_parse_and_print(self) -> None:
-        """only supports UTF-8 string data for now"""
-        self.data_in = sys.stdin
-        self.slicer()
+    def normal_stream_and_print(self) -> None:
+        """
+        Print standard parser output as JSON Lines. Each record is printed as
+        soon as it is parsed so the list of records and its JSON string are
+        never built. Parsers that support it (`incremental` in the parser
+        info) send each record as soon as it is processed.
 
-        if self.parser_module:
-            result = self.parser_module.parse(
-                self.data_in,
+        If --meta-out is used then metadata is added to each record.
+        """
+        emitter = self.streaming_emitter(pretty=False)
+        record_count = 0
+
+        if self.meta_out:
+            self.run_timestamp = datetime.now(timezone.utc)
+
+        def emit(record: JSONDictType) -> None:
+            nonlocal record_count
+            record_count += 1
+
+            if self.meta_out:
+                self.data_out = record
+                self.add_metadata_to_output()
+
+            emitter.emit(record)
+
+        try:
+            parse(
+                self.proc_file_parser(),
+                self.data_in,  # type: ignore
                 raw=self.raw,
                 quiet=self.quiet,
-                ignore_exceptions=self.ignore_exceptions
+                workers=self.workers,
+                sink=emit
             )
 
-            for line in result:
-                self.data_out = line
-                if self.meta_out:
-                    self.run_timestamp = datetime.now(timezone.utc)
-                    self.add_metadata_to_output()
+            # always print metadata, even if there are no results
+            if self.meta_out and not record_count:
+                self.data_out = []
+                self.add_metadata_to_output()
+                emitter.emit(self.data_out[0])
 
-                self.safe_print_out()
+        finally:
+            emitter.flush()
 
-    def standard_parse_and_print(self) -> None:
-        """supports binary and UTF-8 string data"""
-        self.data_in = self.magic_stdout or sys.stdin.buffer.read()
+    def files_parse_and_print(self) -> None:
+        """
+        Parse the --files input files in parallel using worker processes and
+        print a list of the results in input order. Each result has a `_file`
+        key added.
+
+        If --meta-out is used then the list is wrapped in a dict like so:
+            {"result": data}
+        """
+        self.inputlist = self.files
+        self.data_out = parse_many(
+            self.parser_module,  # type: ignore
+            self.files,
+            workers=self.workers,
+            raw=self.raw,
+            quiet=self.quiet
+        )
+
+        if self.meta_out:
+            self.data_out = {"result": self.data_out}
+            self.run_timestamp = datetime.now(timezone.utc)
+            self.add_metadata_to_output()
+
+        self.safe_print_out()
+
+    def streaming_parse_and_print(self) -> None:
+        """
+        only supports UTF-8 string data for now
+
+        Magic command output is parsed line by line as it arrives.
+        """
+        input_file: Optional[TextIO] = None
+
+        if self.magic_command:
+            self.data_in = self.magic_command.lines()
+        elif self.input_file:
+            self.data_in = input_file = self.open_input_file()
+        else:
+            self.data_in = sys.stdin
+
+        self.slicer()
+
+        try:
+            if self.parser_module:
+                result = self.parser_module.parse(
+                    self.data_in,
+                    raw=self.raw,
+                    quiet=self.quiet,
+                    ignore_exceptions=self.ignore_exceptions
+                )
+
+                sys.stdout.flush()
+                emitter = self.streaming_emitter()
+
+                try:
+                    for line in result:
+                        self.data_out = line
+                        if self.meta_out:
+                            self.run_timestamp = datetime.now(timezone.utc)
+                            self.add_metadata_to_output()
+
+                        emitter.emit(self.data_out)
+
+                finally:
+                    emitter.flush()
+
+        finally:
+            if input_file:
+                input_file.close()
+
+        self.wait_user_command()
+
+    @staticmethod
+    def mmap_input(input_file: BinaryIO) -> Optional[mmap.mmap]:
+        """
+        Return a read-only memory map of the input if it is a non-empty
+        regular file read from the beginning. Otherwise return None.
+        """
+        try:
+            fileno = input_file.fileno()
+            if not stat.S_ISREG(os.fstat(fileno).st_mode) or input_file.tell() != 0:
+                return None
+
+            return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return None
+
+    def set_standard_data_in(self) -> None:
+        """
+        Set self.data_in to the magic command output, the --file contents, or
+        STDIN. Input is converted to a UTF-8 string, if possible. Otherwise it
+        is left as bytes.
+
+        Regular files are memory-mapped instead of being read into memory so
+        the input is not held as both bytes and a string. The memory map is
+        decoded by the slicer so only the selected lines are decoded when a
+        positive slice is used.
+        """
+        if self.magic_stdout:
+            self.data_in = self.magic_stdout
+
+        else:
+            input_file: BinaryIO = open(self.input_file, 'rb') if self.input_file else sys.stdin.buffer
+
+            try:
+                self.data_in = self.mmap_input(input_file) or input_file.read()
+            finally:
+                if self.input_file:
+                    input_file.close()
 
         # convert to UTF-8, if possible. Otherwise, leave as bytes
         try:
@@ -799,16 +1279,104 @@ class JcCli():
         except UnicodeDecodeError:
             pass
 
+    def standard_parse_and_print(self) -> None:
+        """supports binary and UTF-8 string data"""
+        if self.slurp and self.json_lines and not self.yaml_output:
+            self.slurp_stream_and_print()
+            return
+
+        self.set_standard_data_in()
         self.slicer()
 
         if self.parser_module:
             if self.slurp:
                 self.create_slurp_output()
+
+            elif self.json_lines and not self.yaml_output:
+                self.normal_stream_and_print()
+                return
+
             else:
                 self.create_normal_output()
 
+                # the input is not needed anymore so free it before the output
+                # is written
+                self.data_in = None
+                self.magic_stdout = None
+
             self.safe_print_out()
 
+    def serve(self) -> None:
+        """Run a jc server on the --serve socket until interrupted"""
+        import signal
+        from .server import serve
+
+        # stop cleanly on SIGTERM so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(JC_CLEAN_EXIT))
+
+        try:
+            serve(self.serve_socket)  # type: ignore
+
+        except KeyboardInterrupt:
+            pass
+
+        except OSError as e:
+            if self.debug:
+                raise
+
+            utils.error_message([f'jc server could not be started: {e.strerror or e}.'])
+            self.exit_error()
+
+    def client_parse_and_print(self) -> None:
+        """
+        Send the input to a jc server (--serve) on the --client socket and
+        print the results. Results from streaming parsers are printed as they
+        are received.
+        """
+        from .server import request
+
+        streaming = _parser_is_streaming(self.parser_module)  # type: ignore
+        input_file: Optional[TextIO] = None
+
+        if streaming:
+            if self.input_file:
+                self.data_in = input_file = self.open_input_file()
+            else:
+                self.data_in = sys.stdin
+        else:
+            self.set_standard_data_in()
+
+        self.slicer()
+
+        try:
+            results = request(
+                self.client_socket,  # type: ignore
+                self.parser_name,  # type: ignore
+                self.data_in,  # type: ignore
+                raw=self.raw,
+                quiet=self.quiet,
+                ignore_exceptions=self.ignore_exceptions if streaming else None
+            )
+
+            for result in results:
+                self.data_out = result
+                if self.meta_out:
+                    self.run_timestamp = datetime.now(timezone.utc)
+                    self.add_metadata_to_output()
+
+                self.safe_print_out()
+
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            if self.debug:
+                raise
+
+            utils.error_message([f'Could not connect to jc server at "{self.client_socket}": {e.strerror}.'])
+            self.exit_error()
+
+        finally:
+            if input_file:
+                input_file.close()
+
     def exit_clean(self) -> None:
         exit_code: int = self.magic_returncode + JC_CLEAN_EXIT
         exit_code = min(exit_code, MAX_EXIT)
@@ -826,6 +1394,7 @@ class JcCli():
 
         # parse magic syntax first: e.g. jc -p ls -al
         self.args = sys.argv
+        self.parse_value_options()
         self.magic_parser()
 
         # add magic options to regular options
@@ -848,6 +1417,7 @@ class JcCli():
         self.verbose_debug = self.options.count('d') > 1
         self.force_color = 'C' in self.options
         self.help_me = 'h' in self.options
+        self.json_lines = 'l' in self.options
         self.show_hidden = self.options.count('h') > 1   # verbose help
         self.show_categories = self.options.count('h') > 2
         self.pretty = 'p' in self.options
@@ -861,6 +1431,32 @@ class JcCli():
         self.yaml_output = 'y' in self.options
         self.bash_comp = 'B' in self.options
         self.zsh_comp = 'Z' in self.options
+        self.serve_socket = self.value_options.get('--serve')  # type: ignore
+        self.client_socket = self.value_options.get('--client')  # type: ignore
+        self.files = self.value_options.get('--files', [])  # type: ignore
+        self.input_file = self.value_options.get('--file')  # type: ignore
+
+        if '--timeout' in self.value_options:
+            try:
+                self.magic_timeout = float(self.value_options['--timeout'])  # type: ignore
+                if not self.magic_timeout > 0:
+                    raise ValueError
+            except ValueError:
+                utils.error_message(['The --timeout value must be a positive number of seconds. Use "jc -h" for help.'])
+                self.exit_error()
+
+            if not self.magic_run_command:
+                utils.error_message(['The --timeout option is only available with magic syntax.'])
+                self.exit_error()
+
+        if '--workers' in self.value_options:
+            try:
+                self.workers = int(self.value_options['--workers'])  # type: ignore
+                if self.workers < 1:
+                    raise ValueError
+            except ValueError:
+                utils.error_message(['The --workers value must be a positive integer. Use "jc -h" for help.'])
+                self.exit_error()
 
         self.set_mono()
         self.set_custom_colors()
@@ -892,6 +1488,10 @@ class JcCli():
             utils._safe_print(zsh_completion())
             self.exit_clean()
 
+        if self.serve_socket:
+            self.serve()
+            self.exit_clean()
+
         # if magic syntax used, try to run the command and set the magic attributes
         self.do_magic()
 
@@ -907,8 +1507,36 @@ class JcCli():
                 ])
                 self.exit_error()
 
+            if self.slurp and self.client_socket:
+                utils.error_message(['Slurp option not available with the --client option.'])
+                self.exit_error()
+
+            if self.input_file and (self.magic_run_command or self.files):
+                utils.error_message(['The --file option cannot be used with magic syntax or --files.'])
+                self.exit_error()
+
+            if self.input_file and not os.path.exists(self.input_file):
+                utils.error_message([f'File not found: {self.input_file}'])
+                self.exit_error()
+
+            if self.files and (self.client_socket or self.magic_run_command or self.slurp
+                               or _parser_is_streaming(self.parser_module)):
+                utils.error_message([
+                    'The --files option is only available with standard parsers',
+                    'and cannot be used with magic syntax, --slurp, or --client.'
+                ])
+                self.exit_error()
+
             try:
-                if _parser_is_streaming(self.parser_module):
+                if self.client_socket:
+                    self.client_parse_and_print()
+                    self.exit_clean()
+
+                elif self.files:
+                    self.files_parse_and_print()
+                    self.exit_clean()
+
+                elif _parser_is_streaming(self.parser_module):
                     self.streaming_parse_and_print()
                     self.exit_clean()
 
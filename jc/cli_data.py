@@ -6,6 +6,7 @@ long_options_map: Dict[str, List[str]] = {
     '--force-color': ['C', 'force color output (overrides -m)'],
     '--debug': ['d', 'debug (double for verbose debug)'],
     '--help': ['h', 'help (--help --parser_name for parser documentation)'],
+    '--jsonl': ['l', 'JSON Lines output (one array item per line)'],
     '--monochrome': ['m', 'monochrome output'],
     '--meta-out': ['M', 'add metadata to output including timestamp, etc.'],
     '--pretty': ['p', 'pretty print output'],
@@ -19,6 +20,18 @@ long_options_map: Dict[str, List[str]] = {
     '--zsh-comp': ['Z', 'gen Zsh completion: jc -Z > "${fpath[1]}/_jc"']
 }
 
+# long options that take a value: --option VALUE
+# options with a value name ending in '...' take all following arguments up
+# to the next option
+value_options_map: Dict[str, List[str]] = {
+    '--file': ['FILE', 'read input from FILE instead of STDIN'],
+    '--files': ['FILE...', 'parse multiple files in parallel'],
+    '--workers': ['N', 'number of worker processes for --files, --slurp, and large tables'],
+    '--timeout': ['SECONDS', 'stop the magic syntax command after SECONDS'],
+    '--serve': ['SOCKET', 'run a jc server on a Unix domain socket'],
+    '--client': ['SOCKET', 'send input to a jc server (--serve) to parse']
+}
+
 new_pygments_colors: Dict[str, str] = {
     'black': 'ansiblack',
     'red': 'ansired',
@@ -76,6 +89,20 @@ Usage:
 
         jc [SLICE] [OPTIONS] /proc/<path-to-procfile>
 
+    Server syntax:
+
+        jc --serve SOCKET
+
+        COMMAND | jc --client SOCKET [SLICE] [OPTIONS] PARSER
+
+    File input syntax:
+
+        jc [SLICE] [OPTIONS] PARSER --file FILE
+
+    Multiple files syntax:
+
+        jc [OPTIONS] PARSER --files FILE [FILE ...]
+
 Parsers:
 '''
 
@@ -100,6 +127,13 @@ Examples:
         $ jc --pretty dig www.google.com
         $ jc --pretty /proc/meminfo
 
+    Multiple Files:
+        $ jc --dmidecode --files host1.out host2.out host3.out
+
+    Server:
+        $ jc --serve /tmp/jc.sock &
+        $ dig www.google.com | jc --client /tmp/jc.sock --pretty --dig
+
     Line Slicing:
         $ cat output.txt | jc 4:15 --parser    # Parse from line 4 to 14
                                                  with parser (zero-based)
@@ -0,0 +1,256 @@
+"""jc - JSON Convert native JSON colorizer
+
+Encodes data as JSON with ANSI color codes added to the tokens while
+encoding, so colored output does not need to be re-tokenized by the
+Pygments JSON lexer.
+
+The output is the same as the `Terminal256Formatter` output of Pygments
+for the `jc` color style: key names are bold and `true`, `false`, `null`,
+numbers, and strings are colored. Brackets, separators, and whitespace are
+not colored. Without the color codes the output is the same as:
+
+    json.dumps(data, indent=indent, separators=separators,
+               ensure_ascii=ascii_only, default=str)
+"""
+from json.encoder import encode_basestring, encode_basestring_ascii  # type: ignore
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ANSI foreground color codes for the JC_COLORS color names. White is the
+# bold default color, as in Pygments.
+ANSI_COLORS: Dict[str, str] = {
+    'black': '30',
+    'red': '31',
+    'green': '32',
+    'yellow': '33',
+    'blue': '34',
+    'magenta': '35',
+    'cyan': '36',
+    'gray': '37',
+    'brightblack': '90',
+    'brightred': '91',
+    'brightgreen': '92',
+    'brightyellow': '93',
+    'brightblue': '94',
+    'brightmagenta': '95',
+    'brightcyan': '96',
+    'white': '01'
+}
+
+# key name, keyword (true, false, null), number, and string colors
+DEFAULT_COLORS: Tuple[str, str, str, str] = ('blue', 'brightblack', 'magenta', 'green')
+
+INFINITY = float('inf')
+
+EncoderType = Callable[[Any], str]
+
+
+def _floatstr(o: float) -> str:
+    """Return the JSON representation of a float (same as the json module)"""
+    if o != o:
+        return 'NaN'
+
+    if o == INFINITY:
+        return 'Infinity'
+
+    if o == -INFINITY:
+        return '-Infinity'
+
+    return float.__repr__(o)
+
+
+class JsonColorizer():
+    """
+    JSON encoder that adds ANSI color codes to the JSON tokens.
+
+    Parameters:
+
+        key:      (string)  color name for key names
+        keyword:  (string)  color name for `true`, `false`, and `null`
+        number:   (string)  color name for numbers
+        string:   (string)  color name for strings
+
+    Color names are the names in `ANSI_COLORS`. `default` selects the
+    default color for the token type.
+    """
+    def __init__(
+        self,
+        key: str = 'default',
+        keyword: str = 'default',
+        number: str = 'default',
+        string: str = 'default'
+    ) -> None:
+        colors = [
+            ANSI_COLORS[color if color != 'default' else default]
+            for color, default in zip((key, keyword, number, string), DEFAULT_COLORS)
+        ]
+
+        self.key_start = f'\x1b[{colors[0]};01m'
+        self.key_end = '\x1b[39;00m'
+        self.keyword_start = f'\x1b[{colors[1]}m'
+        self.number_start = f'\x1b[{colors[2]}m'
+        self.string_start = f'\x1b[{colors[3]}m'
+        self.color_end = '\x1b[39m'
+        self._encoders: Dict[Tuple[Optional[int], Optional[Tuple[str, str]], bool], EncoderType] = {}
+
+    def key_encoder(self, ascii_only: bool = False) -> Callable[[str], str]:
+        """Return a function that encodes a key name as a colored JSON string"""
+        encode_str = encode_basestring_ascii if ascii_only else encode_basestring
+        key_start = self.key_start
+        key_end = self.key_end
+
+        def encode_key(key: str) -> str:
+            return key_start + encode_str(key) + key_end
+
+        return encode_key
+
+    def dumps(
+        self,
+        data: Any,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = (',', ':'),
+        ascii_only: bool = False
+    ) -> str:
+        """
+        Return the data as a colored JSON string. Non-serializable objects
+        are converted to strings.
+
+        Parameters:
+
+            data:        (any)      data to encode
+            indent:      (int)      JSON indent (None for compact output)
+            separators:  (tuple)    JSON item and key separators
+            ascii_only:  (boolean)  escape non-ASCII characters if True
+
+        Returns:
+
+            string       colored JSON string
+        """
+        options = (indent, separators, ascii_only)
+        encoder = self._encoders.get(options)
+
+        if encoder is None:
+            encoder = self._make_encoder(indent, separators, ascii_only)
+            self._encoders[options] = encoder
+
+        return encoder(data)
+
+    def _make_encoder(
+        self,
+        indent: Optional[int],
+        separators: Optional[Tuple[str, str]],
+        ascii_only: bool
+    ) -> EncoderType:
+        """Return an encoder function for the output format"""
+        if separators:
+            item_separator, key_separator = separators
+        elif indent is None:
+            item_separator, key_separator = ', ', ': '
+        else:
+            item_separator, key_separator = ',', ': '
+
+        encode_str = encode_basestring_ascii if ascii_only else encode_basestring
+        indent_str = ' ' * indent if indent is not None else ''
+        key_start = self.key_start
+        key_end = self.key_end + key_separator
+        string_start = self.string_start
+        number_start = self.number_start
+        color_end = self.color_end
+        true = self.keyword_start + 'true' + color_end
+        false = self.keyword_start + 'false' + color_end
+        null = self.keyword_start + 'null' + color_end
+
+        def _key(key: Any) -> str:
+            if isinstance(key, str):
+                pass
+            elif isinstance(key, float):
+                key = _floatstr(key)
+            elif key is True:
+                key = 'true'
+            elif key is False:
+                key = 'false'
+            elif key is None:
+                key = 'null'
+            elif isinstance(key, int):
+                key = int.__repr__(key)
+            else:
+                raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+            return key_start + encode_str(key) + key_end
+
+        def _encode(o: Any, level: int, out: List[str]) -> None:
+            if isinstance(o, str):
+                out.append(string_start + encode_str(o) + color_end)
+            elif o is None:
+                out.append(null)
+            elif o is True:
+                out.append(true)
+            elif o is False:
+                out.append(false)
+            elif isinstance(o, int):
+                out.append(number_start + int.__repr__(o) + color_end)
+            elif isinstance(o, float):
+                out.append(number_start + _floatstr(o) + color_end)
+            elif isinstance(o, (list, tuple)):
+                if not o:
+                    out.append('[]')
+                    return
+
+                if indent is None:
+                    newline_indent = ''
+                else:
+                    level += 1
+                    newline_indent = '\n' + indent_str * level
+
+                separator = item_separator + newline_indent
+                out.append('[' + newline_indent)
+                first = True
+
+                for value in o:
+                    if first:
+                        first = False
+                    else:
+                        out.append(separator)
+
+                    _encode(value, level, out)
+
+                if indent is not None:
+                    out.append('\n' + indent_str * (level - 1))
+
+                out.append(']')
+            elif isinstance(o, dict):
+                if not o:
+                    out.append('{}')
+                    return
+
+                if indent is None:
+                    newline_indent = ''
+                else:
+                    level += 1
+                    newline_indent = '\n' + indent_str * level
+
+                separator = item_separator + newline_indent
+                out.append('{' + newline_indent)
+                first = True
+
+                for key, value in o.items():
+                    if first:
+                        first = False
+                    else:
+                        out.append(separator)
+
+                    out.append(_key(key))
+                    _encode(value, level, out)
+
+                if indent is not None:
+                    out.append('\n' + indent_str * (level - 1))
+
+                out.append('}')
+            else:
+                _encode(str(o), level, out)
+
+        def encoder(data: Any) -> str:
+            out: List[str] = []
+            _encode(data, 0, out)
+            return ''.join(out)
+
+        return encoder
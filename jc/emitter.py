@@ -0,0 +1,260 @@
+"""jc - JSON Convert streaming output emitter
+
+Writes the records yielded by streaming parsers as JSON Lines. The JSON
+encoder backend and optional colorizer are chosen once and the encoded
+records are written to a binary stream in batches instead of calling
+`print()` for every record.
+
+The batch is flushed when it holds `flush_records` records or when
+`flush_interval` seconds have passed since the last flush. When the output
+is unbuffered or the stream is a terminal, every record is flushed as soon
+as it is written.
+
+Large single documents are written with `write_json()` or `write_yaml()`,
+which encode the document in pieces and write them through a fixed size
+buffer.
+"""
+import re
+import time
+from typing import Any, BinaryIO, Callable, List, Match, Optional, Tuple
+from .json_backend import DumpsType, dumps as backend_dumps, iterdumps
+from . import yaml_backend
+
+# size of the write buffer (in characters) used by write_json()
+WRITE_BUFFER_SIZE = 65536
+
+NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
+class StreamingEmitter():
+    """
+    Batched JSON Lines writer for streaming parser output. A YAML `dumps`
+    function can be used to write a stream of YAML documents instead.
+
+    Parameters:
+
+        stream:          (binary file)  output stream (e.g. `sys.stdout.buffer`)
+
+        encoding:        (string)       text encoding of the output stream
+
+        indent:          (int)          JSON indent (None for compact output)
+
+        separators:      (tuple)        JSON item and key separators
+
+        ascii_only:      (boolean)      escape non-ASCII characters if True
+
+        colorize:        (callable)     optional function that adds color
+                                        codes to a JSON string
+
+        dumps:           (callable)     JSON encoder backend function
+                                        (default: jc.json_backend.dumps)
+
+        flush_records:   (int)          flush after this many records
+
+        flush_interval:  (float)        flush after this many seconds
+
+        unbuffer:        (boolean)      flush after every record if True
+    """
+    def __init__(
+        self,
+        stream: BinaryIO,
+        encoding: str = 'utf-8',
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = (',', ':'),
+        ascii_only: bool = False,
+        colorize: Optional[Callable[[str], str]] = None,
+        dumps: Optional[DumpsType] = None,
+        flush_records: int = 1000,
+        flush_interval: float = 1.0,
+        unbuffer: bool = False
+    ) -> None:
+        self.stream = stream
+        self.encoding = encoding
+        self.indent = indent
+        self.separators = separators
+        self.ascii_only = ascii_only
+        self.colorize = colorize
+        self.dumps = dumps or backend_dumps
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.buffer: List[bytes] = []
+        self.last_flush = time.monotonic()
+
+        try:
+            is_tty = stream.isatty()
+        except (AttributeError, ValueError):
+            is_tty = False
+
+        self.unbuffer = unbuffer or is_tty
+
+    def encode(self, obj: Any) -> bytes:
+        """Return the JSON line for the object as bytes"""
+        j_string = self.dumps(obj, self.indent, self.separators, self.ascii_only)
+
+        if self.colorize:
+            j_string = self.colorize(j_string)
+
+        j_string += '\n'
+
+        try:
+            return j_string.encode(self.encoding)
+
+        # fall back to ASCII output for the rest of the stream
+        except UnicodeEncodeError:
+            self.ascii_only = True
+            return self.encode(obj)
+
+    def emit(self, obj: Any) -> None:
+        """Add an object to the output batch and flush if needed"""
+        self.buffer.append(self.encode(obj))
+
+        if self.unbuffer \
+           or len(self.buffer) >= self.flush_records \
+           or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the output batch to the stream"""
+        if self.buffer:
+            self.stream.write(b''.join(self.buffer))
+            self.buffer = []
+
+        self.stream.flush()
+        self.last_flush = time.monotonic()
+
+
+def _ascii_escape(match: Match) -> str:
+    """Return the JSON escape sequence for a non-ASCII character"""
+    code = ord(match.group())
+
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+
+    code -= 0x10000
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+
+def write_json(
+    stream: BinaryIO,
+    data: Any,
+    encoding: str = 'utf-8',
+    indent: Optional[int] = None,
+    separators: Optional[Tuple[str, str]] = (',', ':'),
+    ascii_only: bool = False,
+    dumps: Optional[DumpsType] = None,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    key_encoder: Optional[Callable[[str], str]] = None
+) -> None:
+    """
+    Write the data as a JSON document followed by a newline to a binary
+    stream. The document is encoded in pieces with `iterdumps()` and written
+    through a fixed size buffer so the whole JSON string is never held in
+    memory.
+
+    If the output cannot be encoded with the stream encoding then non-ASCII
+    characters are escaped from that point to the end of the document.
+
+    Parameters:
+
+        stream:       (binary file)  output stream (e.g. `sys.stdout.buffer`)
+
+        data:         (any)          data to write
+
+        encoding:     (string)       text encoding of the output stream
+
+        indent:       (int)          JSON indent (None for compact output)
+
+        separators:   (tuple)        JSON item and key separators
+
+        ascii_only:   (boolean)      escape non-ASCII characters if True
+
+        dumps:        (callable)     JSON encoder backend function
+                                     (default: jc.json_backend.dumps)
+
+        buffer_size:  (int)          write when the buffer holds this many
+                                     characters
+
+        key_encoder:  (callable)     function that encodes the key names of
+                                     split dictionaries (e.g. to add color
+                                     codes)
+    """
+    ascii_escape = False
+    buffer: List[str] = []
+    size = 0
+
+    def write(j_string: str) -> None:
+        nonlocal ascii_escape
+
+        if not ascii_escape:
+            try:
+                stream.write(j_string.encode(encoding))
+                return
+
+            # fall back to ASCII output for the rest of the document
+            except UnicodeEncodeError:
+                ascii_escape = True
+
+        stream.write(NON_ASCII_RE.sub(_ascii_escape, j_string).encode(encoding))
+
+    pieces = iterdumps(
+        data, indent, separators, ascii_only, encoder=dumps or backend_dumps, key_encoder=key_encoder
+    )
+
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= buffer_size:
+            write(''.join(buffer))
+            buffer = []
+            size = 0
+
+    buffer.append('\n')
+    write(''.join(buffer))
+    stream.flush()
+
+
+def write_yaml(
+    stream: BinaryIO,
+    data: Any,
+    encoding: str = 'utf-8',
+    ascii_only: bool = False,
+    buffer_size: int = WRITE_BUFFER_SIZE
+) -> None:
+    """
+    Write the data as a YAML document to a binary stream. The document is
+    encoded in pieces with `jc.yaml_backend.iterdumps()` and written through
+    a fixed size buffer. The stream encoding must be able to encode the
+    whole document (e.g. UTF-8).
+
+    Parameters:
+
+        stream:       (binary file)  output stream (e.g. `sys.stdout.buffer`)
+
+        data:         (any)          data to write
+
+        encoding:     (string)       text encoding of the output stream
+
+        ascii_only:   (boolean)      escape non-ASCII characters if True
+
+        buffer_size:  (int)          write when the buffer holds this many
+                                     characters
+
+    Raises:
+
+        LibraryNotInstalled          ruamel.yaml library is not installed
+    """
+    buffer: List[str] = []
+    size = 0
+
+    for piece in yaml_backend.iterdumps(data, ascii_only):
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= buffer_size:
+            stream.write(''.join(buffer).encode(encoding))
+            buffer = []
+            size = 0
+
+    stream.write(''.join(buffer).encode(encoding))
+    stream.flush()
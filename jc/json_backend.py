@@ -0,0 +1,421 @@
+"""jc - JSON Convert JSON encoder backends
+
+Serializes `jc` output with `orjson` or `ujson` when one of them is
+installed and falls back to the standard library `json` module when not.
+The `JC_JSON_BACKEND` environment variable can be set to `orjson`, `ujson`,
+or `json` to choose a backend.
+
+All backends produce the same output as:
+
+    json.dumps(data, indent=indent, separators=separators,
+               ensure_ascii=ascii_only, default=str)
+
+The fast backends are only used for compact and two-space indented output
+without `ascii_only`. Data they cannot encode exactly the same way (e.g.
+integers larger than 64 bits, non-string keys, floats formatted with an
+exponent, or NaN and Infinity floats) is re-encoded with the standard
+library.
+
+Large documents can be encoded in pieces with `iterdumps()` so the whole
+JSON string is never held in memory.
+"""
+import os
+import re
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii  # type: ignore
+from typing import Any, AnyStr, Callable, Dict, Iterator, List, Optional, Tuple
+
+DumpsType = Callable[[Any, Optional[int], Optional[Tuple[str, str]], bool], str]
+
+# candidates for float tokens the fast backends may format differently than
+# python: exponents, small fractions, and large values without an exponent.
+# Literal prefixes keep the scan fast and matches are checked by _is_number().
+# The output is scanned as bytes (orjson) or as a string (ujson).
+EXPONENT_RE = re.compile(rb'e[-+0-9]')
+LARGE_DECIMAL_RE = re.compile(rb'[0-9]{17,}\.')
+NUMBER_CHARS = b'0123456789.-+eE'
+EXPONENT_STR_RE = re.compile(r'e[-+0-9]')
+LARGE_DECIMAL_STR_RE = re.compile(r'[0-9]{17,}\.')
+NUMBER_STR_CHARS = '0123456789.-+eE'
+
+INFINITY = float('inf')
+
+
+def json_dumps(
+    data: Any,
+    indent: Optional[int] = None,
+    separators: Optional[Tuple[str, str]] = (',', ':'),
+    ascii_only: bool = False
+) -> str:
+    """Standard library JSON encoder. Non-serializable objects are converted to strings."""
+    return json.dumps(
+        data,
+        indent=indent,
+        separators=separators,
+        ensure_ascii=ascii_only,
+        default=str
+    )
+
+
+def _is_number(j_output: AnyStr, pos: int) -> bool:
+    """
+    Return True if the token at position `pos` of the JSON output is a number
+    value and not part of a string.
+    """
+    if isinstance(j_output, bytes):
+        number_chars: Any = NUMBER_CHARS
+        whitespace: Any = b' \n'
+        value_start: Any = b':[,'
+    else:
+        number_chars = NUMBER_STR_CHARS
+        whitespace = ' \n'
+        value_start = ':[,'
+
+    start = pos
+    while start > 0 and j_output[start - 1] in number_chars:
+        start -= 1
+
+    prev = start - 1
+    while prev >= 0 and j_output[prev] in whitespace:
+        prev -= 1
+
+    return prev < 0 or j_output[prev] in value_start
+
+
+def _float_mismatch(j_output: AnyStr, large_decimals: bool = False) -> bool:
+    """
+    Return True if the JSON output may contain a float formatted differently
+    than the standard library. The output can be bytes or a string.
+    """
+    if isinstance(j_output, bytes):
+        exponent_re: Any = EXPONENT_RE
+        large_decimal_re: Any = LARGE_DECIMAL_RE
+        digits: Any = b'0123456789'
+        small_fraction: Any = b'0.0000'
+    else:
+        exponent_re = EXPONENT_STR_RE
+        large_decimal_re = LARGE_DECIMAL_STR_RE
+        digits = '0123456789'
+        small_fraction = '0.0000'
+
+    for match in exponent_re.finditer(j_output):
+        pos = match.start()
+        if pos and j_output[pos - 1] in digits and _is_number(j_output, pos):
+            return True
+
+    pos = j_output.find(small_fraction)
+    while pos != -1:
+        if _is_number(j_output, pos):
+            return True
+        pos = j_output.find(small_fraction, pos + 1)
+
+    if large_decimals:
+        for match in large_decimal_re.finditer(j_output):
+            if _is_number(j_output, match.start()):
+                return True
+
+    return False
+
+
+def _has_non_finite(data: Any) -> bool:
+    """
+    Return True if the data contains a NaN or Infinity float. The fast
+    backends encode them as `null` instead of `NaN` and `Infinity`.
+    """
+    stack = [[data]]
+
+    while stack:
+        obj = stack.pop()
+
+        if isinstance(obj, dict):
+            stack.append(list(obj))
+            obj = obj.values()
+
+        for value in obj:
+            value_type = type(value)
+
+            if value_type is str or value_type is int or value is None:
+                continue
+
+            if isinstance(value, float):
+                if value != value or value == INFINITY or value == -INFINITY:
+                    return True
+
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+
+    return False
+
+
+def _fast_format(
+    indent: Optional[int],
+    separators: Optional[Tuple[str, str]],
+    ascii_only: bool
+) -> bool:
+    """Return True if the output format is supported by the fast backends"""
+    if ascii_only:
+        return False
+
+    if indent is None:
+        return separators == (',', ':')
+
+    return indent == 2 and separators is None
+
+
+backends: Dict[str, DumpsType] = {'json': json_dumps}
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def orjson_dumps(
+        data: Any,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = (',', ':'),
+        ascii_only: bool = False
+    ) -> str:
+        """orjson encoder with standard library fallback"""
+        if not _fast_format(indent, separators, ascii_only):
+            return json_dumps(data, indent, separators, ascii_only)
+
+        option = (_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else _ORJSON_OPTIONS
+
+        try:
+            j_bytes = orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            return json_dumps(data, indent, separators, ascii_only)
+
+        if _float_mismatch(j_bytes) or (b'null' in j_bytes and _has_non_finite(data)):
+            return json_dumps(data, indent, separators, ascii_only)
+
+        return j_bytes.decode('utf-8')
+
+    backends['orjson'] = orjson_dumps
+
+except Exception:
+    pass
+
+try:
+    import ujson
+
+    def ujson_dumps(
+        data: Any,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = (',', ':'),
+        ascii_only: bool = False
+    ) -> str:
+        """ujson encoder with standard library fallback"""
+        if not _fast_format(indent, separators, ascii_only):
+            return json_dumps(data, indent, separators, ascii_only)
+
+        try:
+            j_string = ujson.dumps(
+                data,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                indent=indent or 0,
+                default=str
+            )
+        except (TypeError, OverflowError):
+            return json_dumps(data, indent, separators, ascii_only)
+
+        if _float_mismatch(j_string, large_decimals=True) \
+                or (('null' in j_string or 'Inf' in j_string or 'NaN' in j_string) and _has_non_finite(data)):
+            return json_dumps(data, indent, separators, ascii_only)
+
+        return j_string
+
+    backends['ujson'] = ujson_dumps
+
+except Exception:
+    pass
+
+
+def get_backend(name: Optional[str] = None) -> Tuple[str, DumpsType]:
+    """
+    Return the name and dumps function of a JSON encoder backend.
+
+    Parameters:
+
+        name:      (string)  `orjson`, `ujson`, or `json`. If None, the
+                             JC_JSON_BACKEND environment variable is used
+                             or the fastest installed backend is chosen.
+
+    Returns:
+
+        Tuple      (backend name, dumps function)
+    """
+    name = name or os.getenv('JC_JSON_BACKEND')
+
+    if name in backends:
+        return name, backends[name]  # type: ignore
+
+    for backend in ('orjson', 'ujson', 'json'):
+        if backend in backends:
+            return backend, backends[backend]
+
+    return 'json', json_dumps
+
+
+backend, dumps = get_backend()
+
+
+# containers with more than this many nested items are split into pieces by
+# iterdumps(). Smaller containers are encoded in one piece.
+SPLIT_ITEMS = 1000
+
+# target length of the pieces of a split container
+PIECE_SIZE = 65536
+
+CONTAINER_TYPES = (dict, list, tuple)
+
+
+def _count_items(data: Any, limit: int = SPLIT_ITEMS) -> int:
+    """
+    Return the number of nested items in a dictionary or list. Stops
+    counting once the count is larger than `limit`.
+    """
+    stack = [data]
+    count = 0
+
+    while stack:
+        obj = stack.pop()
+        values = obj.values() if isinstance(obj, dict) else obj
+        count += len(values)
+
+        if count > limit:
+            break
+
+        stack.extend(v for v in values if isinstance(v, CONTAINER_TYPES))
+
+    return count
+
+
+def iterdumps(
+    data: Any,
+    indent: Optional[int] = None,
+    separators: Optional[Tuple[str, str]] = (',', ':'),
+    ascii_only: bool = False,
+    encoder: Optional[DumpsType] = None,
+    key_encoder: Optional[Callable[[str], str]] = None
+) -> Iterator[str]:
+    """
+    Lazily encode the data as JSON in pieces. The joined pieces are the same
+    as the output of `dumps()`.
+
+    Dictionaries and lists with more than `SPLIT_ITEMS` nested items are
+    split into runs of items that are encoded separately with the backend
+    `dumps` function, so only a small part of the output is held as a JSON
+    string at a time. Items that are large themselves are split further.
+
+    Parameters:
+
+        data:        (any)       data to encode
+        indent:      (int)       JSON indent (None for compact output)
+        separators:  (tuple)     JSON item and key separators
+        ascii_only:  (boolean)   escape non-ASCII characters if True
+        encoder:     (callable)  JSON encoder backend function
+                                 (default: jc.json_backend.dumps)
+        key_encoder: (callable)  function that encodes the key names of
+                                 split dictionaries (default: JSON string
+                                 encoder)
+
+    Returns:
+
+        Iterator     JSON string pieces
+    """
+    encode = encoder or dumps
+
+    if separators:
+        item_separator, key_separator = separators
+    elif indent is None:
+        item_separator, key_separator = ', ', ': '
+    else:
+        item_separator, key_separator = ',', ': '
+
+    encode_key = key_encoder or (encode_basestring_ascii if ascii_only else encode_basestring)
+    indent_str = ' ' * indent if indent is not None else ''
+
+    def _piece(obj: Any, level: int) -> str:
+        j_string = encode(obj, indent, separators, ascii_only)
+
+        if indent is not None and level:
+            j_string = j_string.replace('\n', '\n' + indent_str * level)
+
+        return j_string
+
+    def _encode(obj: Any, level: int) -> Iterator[str]:
+        is_dict = isinstance(obj, dict)
+
+        if not isinstance(obj, CONTAINER_TYPES) or _count_items(obj) <= SPLIT_ITEMS \
+                or (is_dict and not all(isinstance(k, str) for k in obj)):
+            yield _piece(obj, level)
+            return
+
+        if indent is None:
+            open_separator = ''
+            close_separator = ''
+        else:
+            open_separator = '\n' + indent_str * (level + 1)
+            close_separator = '\n' + indent_str * level
+
+        separator = item_separator + open_separator
+
+        # items of wide containers are assumed to be small unless their own
+        # length is large. Otherwise the nested items of each item are counted.
+        wide = len(obj) > SPLIT_ITEMS
+        batch: List[Any] = []
+        batch_items = 0
+        batch_size = 64
+        first = True
+
+        def _batch_piece() -> str:
+            # encode the run of items as a container and remove the brackets
+            j_string = _piece(dict(batch) if is_dict else batch, level)
+            return j_string[1 + len(open_separator):-1 - len(close_separator)]
+
+        yield ('{' if is_dict else '[') + open_separator
+
+        for item in obj.items() if is_dict else obj:
+            value = item[1] if is_dict else item
+            count = 0
+
+            if isinstance(value, CONTAINER_TYPES):
+                count = len(value) if wide else _count_items(value)
+
+            if count > SPLIT_ITEMS:
+                if batch:
+                    yield ('' if first else separator) + _batch_piece()
+                    first = False
+                    batch = []
+                    batch_items = 0
+
+                if not first:
+                    yield separator
+
+                first = False
+
+                if is_dict:
+                    yield encode_key(item[0]) + key_separator
+
+                yield from _encode(value, level + 1)
+                continue
+
+            batch.append(item)
+            batch_items += count + 1
+
+            if len(batch) >= batch_size or batch_items >= SPLIT_ITEMS:
+                j_string = _batch_piece()
+                yield ('' if first else separator) + j_string
+                first = False
+                batch_size = max(1, min(SPLIT_ITEMS, batch_size * PIECE_SIZE // (len(j_string) or 1)))
+                batch = []
+                batch_items = 0
+
+        if batch:
+            yield ('' if first else separator) + _batch_piece()
+
+        yield close_separator + ('}' if is_dict else ']')
+
+    return _encode(data, 0)
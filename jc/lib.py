@@ -2,12 +2,15 @@
 import sys
 import os
 import re
+import stat
 import importlib
-from typing import List, Iterable, Optional, Union, Iterator
+from itertools import islice
+from typing import Any, Callable, Dict, List, Iterable, Optional, Union, Iterator, Tuple
 from types import ModuleType
 from .jc_types import ParserInfoType, JSONDictType
 from jc import appdirs
 from jc import utils
+from jc import parser_index
 
 
 __version__ = '1.25.5'
@@ -247,39 +250,147 @@ def _modname_to_cliname(parser_mod_name: str) -> str:
     """Return module's cli name (underscores converted to dashes)"""
     return parser_mod_name.replace('_', '-')
 
-def _is_valid_parser_plugin(name: str, local_parsers_dir: str) -> bool:
-    if re.match(r'\w+\.py$', name) and os.path.isfile(os.path.join(local_parsers_dir, name)):
+def _plugin_manifest_path() -> str:
+    """Return the path of the parser plugin manifest cache file"""
+    cache_dir = appdirs.user_cache_dir('jc', 'jc')  # type: ignore
+    return os.path.join(cache_dir, 'jcparsers_manifest.json')
+
+def _read_plugin_manifest(manifest_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the cached plugin manifest entries. An empty dictionary is
+    returned if the manifest does not exist, cannot be read, or was written
+    by a different jc version.
+    """
+    import json
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        if manifest.get('version') == __version__ and isinstance(manifest.get('plugins'), dict):
+            return manifest['plugins']
+
+    except Exception:
+        pass
+
+    return {}
+
+def _write_plugin_manifest(manifest_path: str, plugins: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Write the plugin manifest entries to the cache file. The file is
+    replaced atomically so concurrent jc processes never read a partially
+    written manifest. Any errors are ignored since the manifest is only a
+    cache.
+    """
+    import json
+
+    temp_path = f'{manifest_path}.{os.getpid()}.tmp'
+
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': __version__, 'plugins': plugins}, f)
+        os.replace(temp_path, manifest_path)
+
+    except Exception:
         try:
-            parser_mod_name = _cliname_to_modname(name)[0:-3]
-            modpath = 'jcparsers.'
-            plugin =  importlib.import_module(f'{modpath}{parser_mod_name}')
-            if hasattr(plugin, 'info') and hasattr(plugin, 'parse'):
-                del plugin
-                return True
-            else:
-                utils.warning_message([f'Not installing invalid parser plugin "{parser_mod_name}" at {local_parsers_dir}'])
-                return False
-        except Exception as e:
-            utils.warning_message([f'Not installing parser plugin "{parser_mod_name}" at {local_parsers_dir} due to error: {e}'])
-            return False
-    return False
+            os.remove(temp_path)
+        except Exception:
+            pass
+
+def _check_parser_plugin(name: str, local_parsers_dir: str) -> Dict[str, Any]:
+    """
+    Import and validate a parser plugin and return its manifest entry. The
+    `info` attributes of valid plugins are included in the entry if they are
+    JSON serializable so the plugin does not need to be imported to list it.
+    """
+    import json
+
+    parser_mod_name = _cliname_to_modname(name)[0:-3]
+    entry: Dict[str, Any] = {'valid': False, 'info': None, 'error': None}
+
+    try:
+        modpath = 'jcparsers.'
+        plugin =  importlib.import_module(f'{modpath}{parser_mod_name}')
+        if hasattr(plugin, 'info') and hasattr(plugin, 'parse'):
+            entry['valid'] = True
+            info_attrs = {k: v for k, v in vars(plugin.info).items() if not k.startswith('__')}
+            try:
+                json.dumps(info_attrs)
+                entry['info'] = info_attrs
+            except Exception:
+                pass
+        else:
+            entry['error'] = f'Not installing invalid parser plugin "{parser_mod_name}" at {local_parsers_dir}'
+        del plugin
+    except Exception as e:
+        entry['error'] = f'Not installing parser plugin "{parser_mod_name}" at {local_parsers_dir} due to error: {e}'
+
+    return entry
+
+def _get_plugin_manifest(local_parsers_dir: str, manifest_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the manifest entries of the parser plugins in local_parsers_dir
+    keyed by file name.
+
+    Entries are cached in the plugin manifest file and keyed on the plugin
+    file name, mtime, and size. Plugins are only imported and validated if
+    they are new or have changed since the manifest was last written.
+    """
+    cached_plugins = _read_plugin_manifest(manifest_path)
+    plugins: Dict[str, Dict[str, Any]] = {}
+    manifest_changed = False
+
+    for name in os.listdir(local_parsers_dir):
+        if not re.match(r'\w+\.py$', name):
+            continue
+
+        try:
+            file_stat = os.stat(os.path.join(local_parsers_dir, name))
+        except OSError:
+            continue
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            continue
+
+        entry = cached_plugins.get(name)
+        if not entry or entry.get('mtime') != file_stat.st_mtime_ns or entry.get('size') != file_stat.st_size:
+            entry = _check_parser_plugin(name, local_parsers_dir)
+            entry['mtime'] = file_stat.st_mtime_ns
+            entry['size'] = file_stat.st_size
+            manifest_changed = True
+
+        plugins[name] = entry
+
+    if manifest_changed or plugins.keys() != cached_plugins.keys():
+        _write_plugin_manifest(manifest_path, plugins)
+
+    return plugins
 
 # Create the local_parsers list. This is a list of custom or
 # override parsers from <user_data_dir>/jc/jcparsers/*.py.
 # Once this list is created, extend the parsers list with it.
+# Plugin validation results and info metadata are cached in the
+# plugin manifest so unchanged plugins are not imported here.
 local_parsers: List[str] = []
+local_parsers_info: Dict[str, Dict[str, Any]] = {}
 data_dir = appdirs.user_data_dir('jc', 'jc')  # type: ignore
 local_parsers_dir = os.path.join(data_dir, 'jcparsers')
 if os.path.isdir(local_parsers_dir):
     sys.path.append(data_dir)
-    for name in os.listdir(local_parsers_dir):
-        if _is_valid_parser_plugin(name, local_parsers_dir):
-            plugin_name = name[0:-3]
-            local_parsers.append(_modname_to_cliname(plugin_name))
-            if plugin_name not in parsers:
-                parsers.append(_modname_to_cliname(plugin_name))
+    for name, entry in _get_plugin_manifest(local_parsers_dir, _plugin_manifest_path()).items():
+        if not entry.get('valid'):
+            utils.warning_message([entry.get('error') or f'Not installing invalid parser plugin "{name}"'])
+            continue
+
+        plugin_name = name[0:-3]
+        local_parsers.append(_modname_to_cliname(plugin_name))
+        if entry.get('info') is not None:
+            local_parsers_info[_modname_to_cliname(plugin_name)] = entry['info']
+        if plugin_name not in parsers:
+            parsers.append(_modname_to_cliname(plugin_name))
     try:
-        del name
+        del name, entry
     except Exception:
         pass
 
@@ -344,6 +455,39 @@ def _get_parser(parser_mod_name: str) -> ModuleType:
 
     return mod
 
+def _get_indexed_info(parser_mod_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the prebuilt info metadata for a parser without importing the
+    parser module. Built-in parsers are found in the parser index and
+    plugin parsers are found in the plugin manifest.
+
+    Returns None if the parser is not in the index or manifest, or if the
+    index was built for a different jc version. In these cases the parser
+    module must be imported to get its metadata.
+    """
+    parser_cli_name = _modname_to_cliname(parser_mod_name)
+
+    if parser_cli_name in local_parsers:
+        return local_parsers_info.get(parser_cli_name)
+
+    if parser_index.version != __version__:
+        return None
+
+    return parser_index.parser_index.get(parser_mod_name)
+
+def _get_parser_info_attrs(parser_cli_name: str) -> Dict[str, Any]:
+    """
+    Return the info attributes of a parser. Uses the parser index when
+    possible, otherwise the parser module is imported.
+    """
+    info_attrs = _get_indexed_info(_cliname_to_modname(parser_cli_name))
+
+    if info_attrs is None:
+        parser = get_parser(parser_cli_name)
+        info_attrs = {k: v for k, v in vars(parser.info).items() if not k.startswith('__')}
+
+    return info_attrs
+
 def _parser_is_slurpable(parser: ModuleType) -> bool:
     """
     Returns True if this parser can use the `--slurp` command option, else False
@@ -389,14 +533,40 @@ def _parser_is_deprecated(parser: ModuleType) -> bool:
 
     return False
 
+def _parser_is_chunkable(parser: ModuleType) -> bool:
+    """
+    Returns True if this parser can parse large inputs in chunks with
+    worker processes, else False
+
+    parser is a parser module object.
+    """
+    if getattr(parser.info, 'chunkable', None):
+        return True
+
+    return False
+
+def _parser_is_incremental(parser: ModuleType) -> bool:
+    """
+    Returns True if this parser can pass each record to a `sink` function
+    as soon as it is processed, else False
+
+    parser is a parser module object.
+    """
+    if getattr(parser.info, 'incremental', None):
+        return True
+
+    return False
+
 def parse(
     parser_mod_name: Union[str, ModuleType],
     data: Union[str, bytes, Iterable[str]],
     quiet: bool = False,
     raw: bool = False,
     ignore_exceptions: Optional[bool] = None,
+    workers: Optional[int] = None,
+    sink: Optional[Callable[[JSONDictType], Any]] = None,
     **kwargs
-) -> Union[JSONDictType, List[JSONDictType], Iterator[JSONDictType]]:
+) -> Union[JSONDictType, List[JSONDictType], Iterator[JSONDictType], None]:
     """
     Parse the data (string or bytes) using the supplied parser (string or
     module object).
@@ -439,6 +609,14 @@ def parse(
         >>> print(f'The year is: {date_obj["year"]}')
         The year is: 2022
 
+    Example (sink):
+
+        >>> import jc
+        >>> jc.parse('ps', ps_output, sink=print)
+        {'uid': 'root', 'pid': 1, 'ppid': 0, ...}
+        {'uid': 'root', 'pid': 2, 'ppid': 0, ...}
+        ...
+
     Finally, you can access the low-level parser modules manually:
 
         >>> import jc.parsers.date
@@ -480,13 +658,41 @@ def parse(
         ignore_exceptions:  (boolean)    ignore parsing exceptions if True
                                          (streaming parsers only)
 
+        workers:            (int)        number of worker processes used to
+                                         parse large inputs in chunks. Only
+                                         used by table parsers that support
+                                         it (`chunkable` in the parser info).
+                                         Defaults to parsing in the current
+                                         process.
+
+        sink:               (callable)   function called with each output
+                                         record instead of returning the
+                                         output. Each item of a list is a
+                                         record. Parsers that support it
+                                         (`incremental` in the parser info)
+                                         call the function as soon as each
+                                         record is processed so the whole
+                                         list is never held in memory.
+
     Returns:
 
         Standard Parsers:   Dictionary or List of Dictionaries
         Streaming Parsers:  Generator Object containing Dictionaries
+        sink:               None
     """
     jc_parser = get_parser(parser_mod_name)
 
+    if workers and workers > 1 and isinstance(data, str) and not kwargs \
+            and _parser_is_chunkable(jc_parser):
+        return _parse_chunked(jc_parser, data, workers, quiet, raw, sink=sink)
+
+    if sink is not None:
+        if ignore_exceptions is not None:
+            kwargs['ignore_exceptions'] = ignore_exceptions
+
+        _parse_to_sink(jc_parser, data, quiet, raw, sink, **kwargs)
+        return None
+
     if ignore_exceptions is not None:
         return jc_parser.parse(
             data,
@@ -498,6 +704,382 @@ def parse(
 
     return jc_parser.parse(data, quiet=quiet, raw=raw, **kwargs)
 
+def _parse_to_sink(
+    jc_parser: ModuleType,
+    data: Union[str, bytes, Iterable[str]],
+    quiet: bool,
+    raw: bool,
+    sink: Callable[[JSONDictType], Any],
+    **kwargs
+) -> None:
+    """
+    Parse the data and call sink with each output record. Incremental
+    parsers call sink as each record is processed. Otherwise the output is
+    parsed first and then each item of a list (or generator) is sent.
+    """
+    if _parser_is_incremental(jc_parser):
+        jc_parser.parse(data, quiet=quiet, raw=raw, sink=sink, **kwargs)
+        return
+
+    result = jc_parser.parse(data, quiet=quiet, raw=raw, **kwargs)
+
+    if isinstance(result, dict):
+        sink(result)
+        return
+
+    for item in result:
+        sink(item)
+
+def _add_file_key(
+    parsed: Union[JSONDictType, List[JSONDictType]],
+    file: str
+) -> Union[JSONDictType, List[JSONDictType]]:
+    """
+    Add a `_file` key to a parsed dictionary or to each dictionary in a
+    list of parsed dictionaries. Returns the same object.
+    """
+    if isinstance(parsed, dict):
+        parsed.update({'_file': file})
+
+    elif isinstance(parsed, list):
+        for obj in parsed:
+            obj.update({'_file': file})
+
+    return parsed
+
+def _parse_file_task(
+    task: Tuple[str, str, bool, bool]
+) -> Union[JSONDictType, List[JSONDictType]]:
+    """
+    Worker function for `parse_many()`. Reads and parses a single file and
+    adds the `_file` key to the output.
+
+    task is a tuple of (parser module import path, file path, raw, quiet).
+    """
+    parser_import_path, file, raw, quiet = task
+    jc_parser = importlib.import_module(parser_import_path)
+
+    with open(file, 'rb') as f:
+        data: Union[str, bytes] = f.read()
+
+    # convert to UTF-8, if possible. Otherwise, leave as bytes
+    try:
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+
+    return _add_file_key(jc_parser.parse(data, raw=raw, quiet=quiet), file)
+
+def parse_many(
+    parser_mod_name: Union[str, ModuleType],
+    inputs: Iterable[str],
+    workers: Optional[int] = None,
+    quiet: bool = False,
+    raw: bool = False,
+    chunksize: Optional[int] = None
+) -> List[Union[JSONDictType, List[JSONDictType]]]:
+    """
+    Parse many input files with the supplied standard parser (string or
+    module object) using a pool of worker processes.
+
+    Each file is read and parsed in a worker process. Results are returned
+    in the same order as the input files and a `_file` key with the file
+    path is added to each parsed dictionary (or to each dictionary in a
+    list of parsed dictionaries).
+
+    Example:
+
+        >>> import jc
+        >>> results = jc.parse_many('dmidecode', ['host1.out', 'host2.out'])
+        >>> for result in results:
+        >>>     print(result[0]['_file'], result[0]['type'])
+        host1.out 0
+        host2.out 0
+
+    Parameters:
+
+        parser_mod_name:    (string or   name of the parser module. This
+                            Module)      function will accept module_name,
+                                         cli-name, and --argument-name
+                                         variants of the module name.
+
+                                         A Module object can also be passed
+                                         directly or via get_parser()
+
+        inputs:             (iterable)   file paths to parse
+
+        workers:            (int)        number of worker processes. Defaults
+                                         to the number of CPUs. Files are
+                                         parsed in the current process if
+                                         set to 1.
+
+        quiet:              (boolean)    suppress warning messages if True
+
+        raw:                (boolean)    output preprocessed JSON if True
+
+        chunksize:          (int)        number of files sent to a worker
+                                         process at a time. By default the
+                                         files are split into about four
+                                         chunks per worker.
+
+    Returns:
+
+        List of parsed results (Dictionaries or Lists of Dictionaries)
+
+    Raises:
+
+        ValueError:  If a streaming parser is supplied
+    """
+    jc_parser = get_parser(parser_mod_name)
+
+    if _parser_is_streaming(jc_parser):
+        raise ValueError('parse_many() does not support streaming parsers.')
+
+    # workers import the parser by module path so it does not need to be pickled
+    spec = getattr(jc_parser, '__spec__', None)
+    parser_import_path: str = spec.name if spec else jc_parser.__name__
+
+    files: List[str] = [str(f) for f in inputs]
+    tasks = [(parser_import_path, f, raw, quiet) for f in files]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    workers = max(1, min(workers, len(files)))
+
+    if workers == 1:
+        return [_parse_file_task(task) for task in tasks]
+
+    if chunksize is None:
+        chunksize = max(1, len(files) // (workers * 4))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_file_task, tasks, chunksize=chunksize))
+
+def _parse_items_task(
+    task: Tuple[str, List[Any], bool, bool]
+) -> List[Union[JSONDictType, List[JSONDictType]]]:
+    """
+    Worker function for `parse_items()`. Parses a batch of items.
+
+    task is a tuple of (parser module import path, items, raw, quiet).
+    """
+    parser_import_path, items, raw, quiet = task
+    jc_parser = importlib.import_module(parser_import_path)
+    return [jc_parser.parse(item, raw=raw, quiet=quiet) for item in items]
+
+def _parse_items_iter(
+    jc_parser: ModuleType,
+    items: Iterable[Any],
+    workers: int,
+    quiet: bool,
+    raw: bool,
+    batch_size: int
+) -> Iterator[Union[JSONDictType, List[JSONDictType]]]:
+    """Generator for `parse_items()`"""
+    if workers == 1:
+        for item in items:
+            yield jc_parser.parse(item, raw=raw, quiet=quiet)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    # workers import the parser by module path so it does not need to be pickled
+    spec = getattr(jc_parser, '__spec__', None)
+    parser_import_path: str = spec.name if spec else jc_parser.__name__
+
+    item_iter = iter(items)
+    pending: deque = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # keep two batches per worker in flight so memory use is bounded
+            while len(pending) < workers * 2:
+                batch = list(islice(item_iter, batch_size))
+                if not batch:
+                    break
+
+                pending.append(
+                    executor.submit(_parse_items_task, (parser_import_path, batch, raw, quiet))
+                )
+
+            if not pending:
+                break
+
+            yield from pending.popleft().result()
+
+def parse_items(
+    parser_mod_name: Union[str, ModuleType],
+    items: Iterable[Any],
+    workers: Optional[int] = None,
+    quiet: bool = False,
+    raw: bool = False,
+    batch_size: int = 1000
+) -> Iterator[Union[JSONDictType, List[JSONDictType]]]:
+    """
+    Parse each item of an iterable separately with the supplied standard
+    parser (string or module object) and lazily yield the results in input
+    order. This is how `jc` parses slurped input (e.g. one IP address or URL
+    per line) and is typically used with slurpable parsers.
+
+    Items are sent in batches to a pool of worker processes. Only a few
+    batches per worker are read ahead of the results that have been
+    consumed, so memory use stays bounded for long inputs.
+
+    Example:
+
+        >>> import jc
+        >>> lines = ['192.168.1.1', '10.0.0.1/8']
+        >>> for result in jc.parse_items('ip_address', lines):
+        >>>     print(result['ip'])
+        192.168.1.1
+        10.0.0.1
+
+    Parameters:
+
+        parser_mod_name:    (string or   name of the parser module. This
+                            Module)      function will accept module_name,
+                                         cli-name, and --argument-name
+                                         variants of the module name.
+
+                                         A Module object can also be passed
+                                         directly or via get_parser()
+
+        items:              (iterable)   data items to parse (e.g. lines)
+
+        workers:            (int)        number of worker processes. Defaults
+                                         to the number of CPUs. Items are
+                                         parsed in the current process if
+                                         set to 1.
+
+        quiet:              (boolean)    suppress warning messages if True
+
+        raw:                (boolean)    output preprocessed JSON if True
+
+        batch_size:         (int)        number of items sent to a worker
+                                         process at a time
+
+    Returns:
+
+        Generator Object of parsed results (Dictionaries or Lists of
+        Dictionaries)
+
+    Raises:
+
+        ValueError:  If a streaming parser is supplied
+    """
+    jc_parser = get_parser(parser_mod_name)
+
+    if _parser_is_streaming(jc_parser):
+        raise ValueError('parse_items() does not support streaming parsers.')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    return _parse_items_iter(jc_parser, items, max(1, workers), quiet, raw, max(1, batch_size))
+
+# inputs smaller than this are parsed in a single process
+PARALLEL_CHUNK_SIZE = 4 * 1024 * 1024
+
+def _table_chunks(data: str, chunk_size: int) -> Iterator[str]:
+    """
+    Split table data at line boundaries into chunks of about chunk_size
+    characters. The header row is copied to the start of each chunk.
+    """
+    header_end = data.find('\n') + 1
+    header = data[:header_end]
+    start = 0
+
+    while start < len(data):
+        end = data.find('\n', max(start, header_end) + chunk_size - 1) + 1 or len(data)
+        yield data[start:end] if start == 0 else header + data[start:end]
+        start = end
+
+def _parse_chunk_task(task: Tuple[str, str, bool, bool]) -> List[JSONDictType]:
+    """
+    Worker function for `_parse_chunked()`. Parses one chunk of a table.
+
+    task is a tuple of (parser module import path, chunk, raw, quiet).
+    """
+    parser_import_path, chunk, raw, quiet = task
+    jc_parser = importlib.import_module(parser_import_path)
+    return jc_parser.parse(chunk, raw=raw, quiet=quiet)
+
+def _parse_chunked(
+    jc_parser: ModuleType,
+    data: str,
+    workers: int,
+    quiet: bool,
+    raw: bool,
+    chunk_size: Optional[int] = None,
+    sink: Optional[Callable[[JSONDictType], Any]] = None
+) -> Optional[List[JSONDictType]]:
+    """
+    Parse a large table in chunks with a pool of worker processes. Each
+    worker parses and processes a chunk that starts with the header row and
+    the results are concatenated in input order. If sink is used then the
+    records of each chunk are sent to it in input order and None is
+    returned.
+
+    The input is parsed in the current process if it is too small to split
+    or does not start with a header row.
+    """
+    if chunk_size is None:
+        chunk_size = max(PARALLEL_CHUNK_SIZE, len(data) // (workers * 4))
+
+    header = data[:data.find('\n') + 1]
+
+    if len(data) <= chunk_size or not header.strip() or len(header.splitlines()) != 1:
+        if sink is not None:
+            _parse_to_sink(jc_parser, data, quiet, raw, sink)
+            return None
+
+        return jc_parser.parse(data, raw=raw, quiet=quiet)
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    # workers import the parser by module path so it does not need to be pickled
+    spec = getattr(jc_parser, '__spec__', None)
+    parser_import_path: str = spec.name if spec else jc_parser.__name__
+
+    chunks = enumerate(_table_chunks(data, chunk_size))
+    pending: deque = deque()
+    result: List[JSONDictType] = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # keep two chunks per worker in flight so memory use is bounded
+            while len(pending) < workers * 2:
+                index, chunk = next(chunks, (0, None))
+                if chunk is None:
+                    break
+
+                # only the first chunk prints warnings so they are not repeated
+                pending.append(
+                    executor.submit(_parse_chunk_task, (parser_import_path, chunk, raw, quiet or index > 0))
+                )
+
+            if not pending:
+                break
+
+            chunk_result = pending.popleft().result()
+
+            if sink is None:
+                result.extend(chunk_result)
+            else:
+                for item in chunk_result:
+                    sink(item)
+
+    if sink is not None:
+        return None
+
+    return result
+
 def parser_mod_list(
     show_hidden: bool = False,
     show_deprecated: bool = False
@@ -505,12 +1087,12 @@ def parser_mod_list(
     """Returns a list of all available parser module names."""
     plist: List[str] = []
     for p in parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if not show_hidden and _parser_is_hidden(parser):
+        if not show_hidden and p_info.get('hidden'):
             continue
 
-        if not show_deprecated and _parser_is_deprecated(parser):
+        if not show_deprecated and p_info.get('deprecated'):
             continue
 
         plist.append(_cliname_to_modname(p))
@@ -527,12 +1109,12 @@ def plugin_parser_mod_list(
     """
     plist: List[str] = []
     for p in local_parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if not show_hidden and _parser_is_hidden(parser):
+        if not show_hidden and p_info.get('hidden'):
             continue
 
-        if not show_deprecated and _parser_is_deprecated(parser):
+        if not show_deprecated and p_info.get('deprecated'):
             continue
 
         plist.append(_cliname_to_modname(p))
@@ -550,14 +1132,14 @@ def standard_parser_mod_list(
     """
     plist: List[str] = []
     for p in parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if not _parser_is_streaming(parser):
+        if not p_info.get('streaming'):
 
-            if not show_hidden and _parser_is_hidden(parser):
+            if not show_hidden and p_info.get('hidden'):
                 continue
 
-            if not show_deprecated and _parser_is_deprecated(parser):
+            if not show_deprecated and p_info.get('deprecated'):
                 continue
 
             plist.append(_cliname_to_modname(p))
@@ -574,14 +1156,14 @@ def streaming_parser_mod_list(
     """
     plist: List[str] = []
     for p in parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if _parser_is_streaming(parser):
+        if p_info.get('streaming'):
 
-            if not show_hidden and _parser_is_hidden(parser):
+            if not show_hidden and p_info.get('hidden'):
                 continue
 
-            if not show_deprecated and _parser_is_deprecated(parser):
+            if not show_deprecated and p_info.get('deprecated'):
                 continue
 
             plist.append(_cliname_to_modname(p))
@@ -598,14 +1180,14 @@ def slurpable_parser_mod_list(
     """
     plist: List[str] = []
     for p in parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if _parser_is_slurpable(parser):
+        if 'slurpable' in p_info.get('tags', []):
 
-            if not show_hidden and _parser_is_hidden(parser):
+            if not show_hidden and p_info.get('hidden'):
                 continue
 
-            if not show_deprecated and _parser_is_deprecated(parser):
+            if not show_deprecated and p_info.get('deprecated'):
                 continue
 
             plist.append(_cliname_to_modname(p))
@@ -629,13 +1211,23 @@ def parser_info(
 
         documentation:      (boolean)    include parser docstring if True
     """
-    parser_mod = get_parser(parser_mod_name)
-    parser_mod_name = parser_mod.__name__.split('.')[-1]
+    parser_mod: Optional[ModuleType] = None
+    parser_entry: Optional[Dict[str, Any]] = None
+
+    # answer from the parser index if possible to avoid importing the parser
+    if isinstance(parser_mod_name, str) and not documentation:
+        parser_entry = _get_indexed_info(_cliname_to_modname(parser_mod_name))
+        if parser_entry is not None:
+            parser_mod_name = _cliname_to_modname(parser_mod_name)
+
+    if parser_entry is None:
+        parser_mod = get_parser(parser_mod_name)
+        parser_mod_name = parser_mod.__name__.split('.')[-1]
+        parser_entry = vars(parser_mod.info)
 
     info_dict: ParserInfoType = {}
     info_dict['name'] = parser_mod_name
     info_dict['argument'] = _parser_argument(parser_mod_name)
-    parser_entry = vars(parser_mod.info)
 
     for k, v in parser_entry.items():
         if not k.startswith('__'):
@@ -644,7 +1236,7 @@ def parser_info(
     if _modname_to_cliname(parser_mod_name) in local_parsers:
         info_dict['plugin'] = True
 
-    if documentation:
+    if documentation and parser_mod:
         docs = parser_mod.__doc__
         if not docs:
             docs = 'No documentation available.\n'
@@ -672,12 +1264,12 @@ def all_parser_info(
     """
     plist: List[str] = []
     for p in parsers:
-        parser = get_parser(p)
+        p_info = _get_parser_info_attrs(p)
 
-        if not show_hidden and _parser_is_hidden(parser):
+        if not show_hidden and p_info.get('hidden'):
             continue
 
-        if not show_deprecated and _parser_is_deprecated(parser):
+        if not show_deprecated and p_info.get('deprecated'):
             continue
 
         plist.append(p)
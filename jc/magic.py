@@ -0,0 +1,135 @@
+"""jc - JSON Convert magic command module
+
+Runs the command of the magic syntax (e.g. `jc ls -al`). The `STDERR` of the
+command is forwarded to `STDERR` as it arrives instead of being buffered
+until the command exits. The output can be read after the command exits or
+lazily, line by line, while the command is still running.
+"""
+import io
+import sys
+import codecs
+import signal
+import threading
+import subprocess
+from typing import Iterator, List, Optional, Union
+from . import utils
+
+# exit code of a command stopped by the timeout (same as timeout(1))
+TIMEOUT_EXIT: int = 124
+
+STDERR_READ_SIZE: int = 65536
+
+# not available on Windows
+SIGPIPE: Optional[int] = getattr(signal, 'SIGPIPE', None)
+
+
+class MagicCommand():
+    """
+    Start a command with its output connected to a pipe.
+
+    Parameters:
+
+        command:   (list)   command and its arguments
+        timeout:   (float)  seconds until the command is killed. None lets
+                            the command run until it exits.
+
+    Raises:
+
+        OSError                 the command could not be run
+    """
+    def __init__(self, command: List[str], timeout: Optional[float] = None) -> None:
+        self.timed_out: bool = False
+        self._closed_while_running: bool = False
+        self.proc = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False            # Allows inheriting file descriptors
+        )                              # which is useful for process substitution
+
+        self._stderr_thread = threading.Thread(target=self._forward_stderr, daemon=True)
+        self._stderr_thread.start()
+
+        self._timer: Optional[threading.Timer] = None
+        if timeout is not None:
+            self._timer = threading.Timer(timeout, self._kill)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _forward_stderr(self) -> None:
+        """Write the STDERR of the command to STDERR as it arrives"""
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+        while True:
+            chunk = self.proc.stderr.read1(STDERR_READ_SIZE)  # type: ignore
+            text = decoder.decode(chunk, final=not chunk)
+
+            if text:
+                utils._safe_print(text, end='', file=sys.stderr, flush=True)
+
+            if not chunk:
+                break
+
+    def _kill(self) -> None:
+        """Kill the command if it is still running when the timeout expires"""
+        if self.proc.poll() is None:
+            self.timed_out = True
+            self.proc.kill()
+
+    @property
+    def returncode(self) -> Optional[int]:
+        """Exit code of the command or None if it is still running"""
+        returncode = self.proc.poll()
+
+        if returncode is not None and self.timed_out:
+            return TIMEOUT_EXIT
+
+        # a command that is still writing gets SIGPIPE if its output is not
+        # read to the end (e.g. with a slice end). This is not an error, like
+        # with `command | head`.
+        if self._closed_while_running and SIGPIPE is not None and returncode == -SIGPIPE:
+            return 0
+
+        return returncode
+
+    def lines(self) -> Iterator[str]:
+        """
+        Lazily return the lines of the output as they arrive. The output is
+        decoded as UTF-8 and line endings are converted to newlines.
+        """
+        return io.TextIOWrapper(self.proc.stdout, encoding='utf-8', errors='replace')  # type: ignore
+
+    def read(self) -> Union[str, bytes]:
+        """
+        Read all of the output. The output is returned as a string with line
+        endings converted to newlines if it is UTF-8. Otherwise it is
+        returned as bytes.
+        """
+        data: bytes = self.proc.stdout.read()  # type: ignore
+
+        try:
+            output = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return data
+
+        if '\r' in output:
+            output = output.replace('\r\n', '\n').replace('\r', '\n')
+
+        return output
+
+    def wait(self) -> int:
+        """
+        Stop reading the output and wait for the command to exit and for its
+        STDERR to be forwarded. Returns the exit code of the command or
+        `TIMEOUT_EXIT` if it was killed by the timeout.
+        """
+        self._closed_while_running = self.proc.poll() is None
+        self.proc.stdout.close()  # type: ignore
+        self.proc.wait()
+
+        if self._timer:
+            self._timer.cancel()
+
+        # descendants of a killed command can keep STDERR open
+        self._stderr_thread.join(1 if self.timed_out else None)
+        return self.returncode  # type: ignore
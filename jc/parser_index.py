@@ -0,0 +1,2007 @@
+"""jc - JSON Convert parser metadata index
+
+This file is generated by build-parser-index.py from the info class of each
+built-in parser. Do not edit it manually.
+"""
+from typing import Any, Dict
+
+version: str = '1.25.5'
+
+parser_index: Dict[str, Dict[str, Any]] = {
+    'acpi': {
+        'version': '1.7',
+        'description': '`acpi` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['acpi'],
+        'tags': ['command'],
+    },
+    'airport': {
+        'version': '1.5',
+        'description': '`airport -I` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['darwin'],
+        'magic_commands': ['airport -I'],
+        'tags': ['command'],
+    },
+    'airport_s': {
+        'version': '1.6',
+        'description': '`airport -s` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['darwin'],
+        'magic_commands': ['airport -s'],
+        'tags': ['command'],
+    },
+    'amixer': {
+        'version': '1.0',
+        'description': '`amixer` command parser',
+        'author': 'Eden Refael',
+        'author_email': 'edenraf@hotmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['amixer'],
+        'tags': ['command'],
+    },
+    'apt_cache_show': {
+        'version': '1.0',
+        'description': '`apt-cache show` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the rpm-qi parser',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['apt-cache show'],
+    },
+    'apt_get_sqq': {
+        'version': '1.1',
+        'description': '`apt-get -sqq` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['apt-get -sqq'],
+    },
+    'arp': {
+        'version': '1.12',
+        'description': '`arp` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin'],
+        'magic_commands': ['arp'],
+        'tags': ['command'],
+    },
+    'asciitable': {
+        'version': '1.3',
+        'description': 'ASCII and Unicode table parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['generic', 'string'],
+    },
+    'asciitable_m': {
+        'version': '1.3',
+        'description': 'multi-line ASCII and Unicode table parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['generic', 'string'],
+    },
+    'blkid': {
+        'version': '1.6',
+        'description': '`blkid` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['blkid'],
+        'tags': ['command'],
+    },
+    'bluetoothctl': {
+        'version': '1.4',
+        'description': '`bluetoothctl` command parser',
+        'author': 'Jake Ob',
+        'author_email': 'iakopap at gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['bluetoothctl'],
+        'tags': ['command'],
+    },
+    'cbt': {
+        'version': '1.0',
+        'description': '`cbt` (Google Bigtable) command parser',
+        'author': 'Andreas Weiden',
+        'author_email': 'andreas.weiden@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['cbt'],
+        'tags': ['command'],
+    },
+    'cef': {
+        'version': '1.0',
+        'description': 'CEF string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the pycef library at https://github.com/DavidJBianco/pycef/releases/tag/v1.11-2',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'cef_s': {
+        'version': '1.0',
+        'description': 'CEF string streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the pycef library at https://github.com/DavidJBianco/pycef/releases/tag/v1.11-2',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+        'streaming': True,
+    },
+    'certbot': {
+        'version': '1.2',
+        'description': '`certbot` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['certbot'],
+    },
+    'chage': {
+        'version': '1.1',
+        'description': '`chage --list` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['chage --list', 'chage -l'],
+        'tags': ['command'],
+    },
+    'cksum': {
+        'version': '1.4',
+        'description': '`cksum` and `sum` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['cksum', 'sum'],
+        'tags': ['command'],
+    },
+    'clf': {
+        'version': '1.1',
+        'description': 'Common and Combined Log Format file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'clf_s': {
+        'version': '1.0',
+        'description': 'Common and Combined Log Format file streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+        'streaming': True,
+    },
+    'crontab': {
+        'version': '1.9',
+        'description': '`crontab` command and file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'magic_commands': ['crontab'],
+        'tags': ['file', 'command'],
+    },
+    'crontab_u': {
+        'version': '1.10',
+        'description': '`crontab` file parser with user support',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'tags': ['file', 'command'],
+    },
+    'csv': {
+        'version': '1.5',
+        'description': 'CSV file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the python standard csv library',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'csv_s': {
+        'version': '1.4',
+        'description': 'CSV file streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the python standard csv library',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+        'streaming': True,
+    },
+    'curl_head': {
+        'version': '1.0',
+        'description': '`curl --head` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the http-headers parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command', 'standard'],
+        'magic_commands': ['curl'],
+    },
+    'date': {
+        'version': '2.6',
+        'description': '`date` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['date'],
+        'tags': ['command', 'slurpable'],
+    },
+    'datetime_iso': {
+        'version': '1.1',
+        'description': 'ISO 8601 Datetime string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the pyiso8601 library from https://github.com/micktwomey/pyiso8601/releases/tag/1.0.2',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin', 'win32', 'cygwin'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'debconf_show': {
+        'version': '1.0',
+        'description': '`debconf-show` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['debconf-show'],
+    },
+    'df': {
+        'version': '2.1',
+        'description': '`df` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['df'],
+        'tags': ['command'],
+    },
+    'dig': {
+        'version': '2.5',
+        'description': '`dig` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin', 'win32', 'cygwin'],
+        'magic_commands': ['dig'],
+        'tags': ['command'],
+    },
+    'dir': {
+        'version': '1.6',
+        'description': '`dir` command parser',
+        'author': 'Rasheed Elsaleh',
+        'author_email': 'rasheed@rebelliondefense.com',
+        'compatible': ['win32'],
+        'tags': ['command'],
+    },
+    'dmidecode': {
+        'version': '1.5',
+        'description': '`dmidecode` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['dmidecode'],
+        'tags': ['command'],
+    },
+    'dpkg_l': {
+        'version': '1.3',
+        'description': '`dpkg -l` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['dpkg -l'],
+        'tags': ['command'],
+    },
+    'du': {
+        'version': '1.6',
+        'description': '`du` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'magic_commands': ['du'],
+        'tags': ['command'],
+    },
+    'efibootmgr': {
+        'version': '1.0',
+        'description': '`efibootmgr` command parser',
+        'author': 'Yaofei Zheng',
+        'author_email': 'zyf26256@gmail.com, Yaofei.Zheng@dell.com',
+        'compatible': ['linux'],
+        'magic_commands': ['efibootmgr'],
+        'tags': ['command'],
+    },
+    'email_address': {
+        'version': '1.1',
+        'description': 'Email Address string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'env': {
+        'version': '1.5',
+        'description': '`env` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['env', 'printenv'],
+        'tags': ['command'],
+    },
+    'ethtool': {
+        'version': '1.1',
+        'description': '`ethtool` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['ethtool'],
+    },
+    'file': {
+        'version': '1.5',
+        'description': '`file` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin'],
+        'magic_commands': ['file'],
+        'tags': ['command'],
+    },
+    'find': {
+        'version': '1.0',
+        'description': '`find` command parser',
+        'author': 'Solomon Leang',
+        'author_email': 'solomonleang@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+    },
+    'findmnt': {
+        'version': '1.1',
+        'description': '`findmnt` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['findmnt'],
+        'tags': ['command'],
+    },
+    'finger': {
+        'version': '1.2',
+        'description': '`finger` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'freebsd'],
+        'magic_commands': ['finger'],
+        'tags': ['command'],
+    },
+    'free': {
+        'version': '1.8',
+        'description': '`free` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['free'],
+        'tags': ['command'],
+    },
+    'fstab': {
+        'version': '1.7',
+        'description': '`/etc/fstab` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'freebsd'],
+        'tags': ['file'],
+    },
+    'git_log': {
+        'version': '1.6',
+        'description': '`git log` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['git log'],
+        'tags': ['command'],
+    },
+    'git_log_s': {
+        'version': '1.5',
+        'description': '`git log` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'git_ls_remote': {
+        'version': '1.0',
+        'description': '`git ls-remote` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['git ls-remote'],
+        'tags': ['command'],
+    },
+    'gpg': {
+        'version': '1.0',
+        'description': '`gpg --with-colons` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['gpg --with-colons'],
+        'tags': ['command'],
+    },
+    'group': {
+        'version': '1.5',
+        'description': '`/etc/group` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'gshadow': {
+        'version': '1.3',
+        'description': '`/etc/gshadow` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'hash': {
+        'version': '1.4',
+        'description': '`hash` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'tags': ['command'],
+    },
+    'hashsum': {
+        'version': '1.2',
+        'description': 'hashsum command parser (`md5sum`, `shasum`, etc.)',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Parses MD5 and SHA hash program output',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['md5sum', 'md5', 'shasum', 'sha1sum', 'sha224sum', 'sha256sum', 'sha384sum', 'sha512sum'],
+        'tags': ['command'],
+    },
+    'hciconfig': {
+        'version': '1.4',
+        'description': '`hciconfig` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['hciconfig'],
+        'tags': ['command'],
+    },
+    'history': {
+        'version': '1.7',
+        'description': '`history` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Optimizations by https://github.com/philippeitis',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'tags': ['command'],
+    },
+    'host': {
+        'version': '1.0',
+        'description': '`host` command parser',
+        'author': 'Pettai',
+        'author_email': 'pettai@sunet.se',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['host'],
+    },
+    'hosts': {
+        'version': '1.4',
+        'description': '`/etc/hosts` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'http_headers': {
+        'version': '1.0',
+        'description': 'HTTP headers parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file'],
+    },
+    'id': {
+        'version': '1.7',
+        'description': '`id` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'magic_commands': ['id'],
+        'tags': ['command', 'slurpable'],
+    },
+    'ifconfig': {
+        'version': '2.4',
+        'description': '`ifconfig` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin'],
+        'magic_commands': ['ifconfig'],
+        'tags': ['command'],
+    },
+    'ini': {
+        'version': '2.2',
+        'description': 'INI file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using configparser from the python standard library',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'ini_dup': {
+        'version': '1.2',
+        'description': 'INI with duplicate key file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using configparser from the python standard library',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'iostat': {
+        'version': '1.2',
+        'description': '`iostat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['iostat'],
+        'tags': ['command'],
+    },
+    'iostat_s': {
+        'version': '1.4',
+        'description': '`iostat` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'ip_address': {
+        'version': '1.5',
+        'description': 'IPv4 and IPv6 Address string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'ipconfig': {
+        'version': '1.0',
+        'description': '`ipconfig` Windows command parser',
+        'author': 'joehacksalot',
+        'author_email': 'joehacksalot@gmail.com',
+        'compatible': ['windows'],
+        'magic_commands': ['ipconfig'],
+        'tags': ['command'],
+    },
+    'iptables': {
+        'version': '1.12',
+        'description': '`iptables` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['iptables'],
+        'tags': ['command'],
+    },
+    'ip_route': {
+        'version': '1.0',
+        'description': '`ip route` command parser',
+        'author': 'Julian Jackson',
+        'author_email': 'jackson.julian55@yahoo.com',
+        'compatible': ['linux'],
+        'magic_commands': ['ip route'],
+        'tags': ['command'],
+    },
+    'iw_scan': {
+        'version': '0.75',
+        'description': '`iw dev [device] scan` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Enhancements by Philipp Schmitt (https://pschmitt.dev/)',
+        'compatible': ['linux'],
+        'magic_commands': ['iw dev'],
+        'tags': ['command'],
+    },
+    'iwconfig': {
+        'version': '1.2',
+        'description': '`iwconfig` command parser',
+        'author': 'Thomas Vincent',
+        'author_email': 'vrince@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['iwconfig'],
+        'tags': ['command'],
+    },
+    'jar_manifest': {
+        'version': '0.01',
+        'description': 'Java MANIFEST.MF file parser',
+        'author': 'Matt J',
+        'author_email': 'https://github.com/listuser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'jobs': {
+        'version': '1.6',
+        'description': '`jobs` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['jobs'],
+        'tags': ['command'],
+    },
+    'jwt': {
+        'version': '1.1',
+        'description': 'JWT string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'kv': {
+        'version': '2.2',
+        'description': 'Key/Value file and string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the ini parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['generic', 'file', 'string'],
+    },
+    'kv_dup': {
+        'version': '1.1',
+        'description': 'Key/Value with duplicate key file and string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the ini-dup parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['generic', 'file', 'string'],
+    },
+    'last': {
+        'version': '1.10',
+        'description': '`last` and `lastb` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Enhancements by https://github.com/zerolagtime',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'magic_commands': ['last', 'lastb'],
+        'tags': ['command'],
+    },
+    'ls': {
+        'version': '1.13',
+        'description': '`ls` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['ls', 'vdir'],
+        'tags': ['command'],
+    },
+    'ls_s': {
+        'version': '1.2',
+        'description': '`ls` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'lsattr': {
+        'version': '1.0',
+        'description': '`lsattr` command parser',
+        'author': 'Mark Rotner',
+        'author_email': 'rotner.mr@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['lsattr'],
+        'tags': ['command'],
+    },
+    'lsb_release': {
+        'version': '1.2',
+        'description': '`lsb_release` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the ini parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['lsb_release'],
+        'tags': ['command'],
+    },
+    'lsblk': {
+        'version': '1.10',
+        'description': '`lsblk` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['lsblk'],
+        'tags': ['command'],
+    },
+    'lsmod': {
+        'version': '1.7',
+        'description': '`lsmod` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['lsmod'],
+        'tags': ['command'],
+    },
+    'lsof': {
+        'version': '1.8',
+        'description': '`lsof` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'magic_commands': ['lsof'],
+        'tags': ['command'],
+        'chunkable': True,
+        'incremental': True,
+    },
+    'lspci': {
+        'version': '1.1',
+        'description': '`lspci -mmv` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['lspci'],
+        'tags': ['command'],
+    },
+    'lsusb': {
+        'version': '1.4',
+        'description': '`lsusb` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['lsusb'],
+        'tags': ['command'],
+    },
+    'm3u': {
+        'version': '1.0',
+        'description': 'M3U and M3U8 file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'mdadm': {
+        'version': '1.0',
+        'description': '`mdadm` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['mdadm'],
+        'tags': ['command'],
+    },
+    'mount': {
+        'version': '1.11',
+        'description': '`mount` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd', 'aix'],
+        'magic_commands': ['mount'],
+        'tags': ['command'],
+    },
+    'mpstat': {
+        'version': '1.1',
+        'description': '`mpstat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['mpstat'],
+        'tags': ['command'],
+    },
+    'mpstat_s': {
+        'version': '1.1',
+        'description': '`mpstat` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'needrestart': {
+        'version': '1.0',
+        'description': '`needrestart -b` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['needrestart -b'],
+    },
+    'netstat': {
+        'version': '1.16',
+        'description': '`netstat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd', 'win32'],
+        'magic_commands': ['netstat'],
+        'tags': ['command'],
+    },
+    'nmcli': {
+        'version': '1.1',
+        'description': '`nmcli` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['nmcli'],
+        'tags': ['command'],
+    },
+    'nsd_control': {
+        'version': '1.2',
+        'description': '`nsd-control` command parser',
+        'author': 'Pettai',
+        'author_email': 'pettai@sunet.se',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['nsd-control'],
+    },
+    'ntpq': {
+        'version': '1.7',
+        'description': '`ntpq -p` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'freebsd'],
+        'magic_commands': ['ntpq'],
+        'tags': ['command'],
+    },
+    'openvpn': {
+        'version': '1.0',
+        'description': 'openvpn-status.log file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'os_prober': {
+        'version': '1.2',
+        'description': '`os-prober` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['os-prober'],
+        'tags': ['command', 'slurpable'],
+    },
+    'os_release': {
+        'version': '1.2',
+        'description': '`/etc/os-release` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the ini parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file', 'standard', 'string'],
+    },
+    'pacman': {
+        'version': '1.0',
+        'description': '`pacman` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command', 'file'],
+        'magic_commands': ['pacman'],
+    },
+    'passwd': {
+        'version': '1.4',
+        'description': '`/etc/passwd` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'path': {
+        'version': '1.0',
+        'description': 'POSIX path string parser',
+        'author': 'Michael Nietzold',
+        'author_email': 'https://github.com/muescha',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'path_list': {
+        'version': '1.0',
+        'description': 'POSIX path list string parser',
+        'author': 'Michael Nietzold',
+        'author_email': 'https://github.com/muescha',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'pci_ids': {
+        'version': '1.1',
+        'description': '`pci.ids` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'pgpass': {
+        'version': '1.0',
+        'description': 'PostgreSQL password file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'pidstat': {
+        'version': '1.3',
+        'description': '`pidstat -H` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['pidstat'],
+        'tags': ['command'],
+    },
+    'pidstat_s': {
+        'version': '1.3',
+        'description': '`pidstat -H` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'ping': {
+        'version': '1.11',
+        'description': '`ping` and `ping6` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['ping', 'ping6'],
+        'tags': ['command'],
+    },
+    'ping_s': {
+        'version': '1.6',
+        'description': '`ping` and `ping6` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'pip_list': {
+        'version': '1.5',
+        'description': '`pip list` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['pip list', 'pip3 list'],
+        'tags': ['command'],
+    },
+    'pip_show': {
+        'version': '1.5',
+        'description': '`pip show` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'magic_commands': ['pip show', 'pip3 show'],
+        'tags': ['command'],
+    },
+    'pkg_index_apk': {
+        'version': '1.0',
+        'description': 'Alpine Linux Package Index file parser',
+        'author': 'Roey Darwish Dror',
+        'author_email': 'roey.ghost@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'pkg_index_deb': {
+        'version': '1.2',
+        'description': 'Debian Package Index file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the rpm-qi parser',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'plist': {
+        'version': '1.2',
+        'description': 'PLIST file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the pbPlist library from https://github.com/samdmarshall/pbPlist/releases/tag/v1.0.4 for NeXTSTEP support',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string', 'binary'],
+    },
+    'postconf': {
+        'version': '1.0',
+        'description': '`postconf -M` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['postconf -M'],
+        'tags': ['command'],
+    },
+    'proc': {
+        'version': '1.5',
+        'description': '`/proc/` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file', 'slurpable'],
+    },
+    'proc_buddyinfo': {
+        'version': '1.0',
+        'description': '`/proc/buddyinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_cmdline': {
+        'version': '1.0',
+        'description': '`/proc/cmdline` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_consoles': {
+        'version': '1.0',
+        'description': '`/proc/consoles` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_cpuinfo': {
+        'version': '1.0',
+        'description': '`/proc/cpuinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_crypto': {
+        'version': '1.0',
+        'description': '`/proc/crypto` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_devices': {
+        'version': '1.0',
+        'description': '`/proc/devices` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_diskstats': {
+        'version': '1.0',
+        'description': '`/proc/diskstats` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_filesystems': {
+        'version': '1.0',
+        'description': '`/proc/filesystems` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_interrupts': {
+        'version': '1.0',
+        'description': '`/proc/interrupts` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_iomem': {
+        'version': '1.0',
+        'description': '`/proc/iomem` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_ioports': {
+        'version': '1.0',
+        'description': '`/proc/ioports` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_loadavg': {
+        'version': '1.0',
+        'description': '`/proc/loadavg` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_locks': {
+        'version': '1.0',
+        'description': '`/proc/locks` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_meminfo': {
+        'version': '1.0',
+        'description': '`/proc/meminfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_modules': {
+        'version': '1.0',
+        'description': '`/proc/modules` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_mtrr': {
+        'version': '1.0',
+        'description': '`/proc/mtrr` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pagetypeinfo': {
+        'version': '1.0',
+        'description': '`/proc/pagetypeinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_partitions': {
+        'version': '1.0',
+        'description': '`/proc/partitions` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_slabinfo': {
+        'version': '1.0',
+        'description': '`/proc/slabinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_softirqs': {
+        'version': '1.0',
+        'description': '`/proc/softirqs` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_stat': {
+        'version': '1.0',
+        'description': '`/proc/stat` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_swaps': {
+        'version': '1.0',
+        'description': '`/proc/swaps` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_uptime': {
+        'version': '1.0',
+        'description': '`/proc/uptime` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_version': {
+        'version': '1.0',
+        'description': '`/proc/version` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_vmallocinfo': {
+        'version': '1.0',
+        'description': '`/proc/vmallocinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_vmstat': {
+        'version': '1.0',
+        'description': '`/proc/vmstat` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_zoneinfo': {
+        'version': '1.0',
+        'description': '`/proc/zoneinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_driver_rtc': {
+        'version': '1.0',
+        'description': '`/proc/driver/rtc` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_arp': {
+        'version': '1.0',
+        'description': '`/proc/net/arp` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_dev': {
+        'version': '1.0',
+        'description': '`/proc/net/dev` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_dev_mcast': {
+        'version': '1.0',
+        'description': '`/proc/net/dev_mcast` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_if_inet6': {
+        'version': '1.0',
+        'description': '`/proc/net/if_inet6` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_igmp': {
+        'version': '1.0',
+        'description': '`/proc/net/igmp` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_igmp6': {
+        'version': '1.0',
+        'description': '`/proc/net/igmp6` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_ipv6_route': {
+        'version': '1.0',
+        'description': '`/proc/net/ipv6_route` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_netlink': {
+        'version': '1.0',
+        'description': '`/proc/net/netlink` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_netstat': {
+        'version': '1.0',
+        'description': '`/proc/net/netstat` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_packet': {
+        'version': '1.0',
+        'description': '`/proc/net/packet` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_protocols': {
+        'version': '1.0',
+        'description': '`/proc/net/protocols` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_route': {
+        'version': '1.0',
+        'description': '`/proc/net/route` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_tcp': {
+        'version': '1.2',
+        'description': '`/proc/net/tcp` and `/proc/net/tcp6` file parser',
+        'author': 'Alvin Solomon',
+        'author_email': 'alvinms01@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_net_unix': {
+        'version': '1.0',
+        'description': '`/proc/net/unix` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_fdinfo': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/fdinfo/<fd>` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_io': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/io` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_maps': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/maps` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_mountinfo': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/mountinfo` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_numa_maps': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/numa_maps` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_smaps': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/smaps` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_stat': {
+        'version': '1.2',
+        'description': '`/proc/<pid>/stat` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_statm': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/statm` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'proc_pid_status': {
+        'version': '1.0',
+        'description': '`/proc/<pid>/status` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['file'],
+        'hidden': True,
+    },
+    'ps': {
+        'version': '1.10',
+        'description': '`ps` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['ps'],
+        'tags': ['command'],
+        'chunkable': True,
+        'incremental': True,
+    },
+    'resolve_conf': {
+        'version': '1.0',
+        'description': '`/etc/resolve.conf` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'route': {
+        'version': '1.9',
+        'description': '`route` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'win32'],
+        'magic_commands': ['route'],
+        'tags': ['command'],
+    },
+    'rpm_qi': {
+        'version': '1.9',
+        'description': '`rpm -qi` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['rpm -qi', 'rpm -qia', 'rpm -qai'],
+        'tags': ['command'],
+    },
+    'rsync': {
+        'version': '1.2',
+        'description': '`rsync` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['rsync -i', 'rsync --itemize-changes'],
+        'tags': ['command'],
+    },
+    'rsync_s': {
+        'version': '1.3',
+        'description': '`rsync` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'semver': {
+        'version': '1.1',
+        'description': 'Semantic Version string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'sfdisk': {
+        'version': '1.3',
+        'description': '`sfdisk` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['sfdisk'],
+        'tags': ['command'],
+    },
+    'shadow': {
+        'version': '1.5',
+        'description': '`/etc/shadow` file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'aix', 'freebsd'],
+        'tags': ['file'],
+    },
+    'srt': {
+        'version': '1.0',
+        'description': 'SRT file parser',
+        'author': 'Mark Rotner',
+        'author_email': 'rotner.mr@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'ss': {
+        'version': '1.8',
+        'description': '`ss` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['ss'],
+        'tags': ['command'],
+    },
+    'ssh_conf': {
+        'version': '1.0',
+        'description': '`ssh` config file and `ssh -G` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['ssh -G'],
+        'tags': ['command', 'file'],
+    },
+    'sshd_conf': {
+        'version': '1.1',
+        'description': '`sshd` config file and `sshd -T` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['sshd -T'],
+        'tags': ['command', 'file'],
+    },
+    'stat': {
+        'version': '1.14',
+        'description': '`stat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['stat'],
+        'tags': ['command'],
+    },
+    'stat_s': {
+        'version': '1.3',
+        'description': '`stat` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'swapon': {
+        'version': '1.0',
+        'description': '`swapon` command parser',
+        'author': 'Roey Darwish Dror',
+        'author_email': 'roey.ghost@gmail.com',
+        'compatible': ['linux', 'freebsd'],
+        'magic_commands': ['swapon'],
+        'tags': ['command'],
+    },
+    'sysctl': {
+        'version': '1.2',
+        'description': '`sysctl` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['sysctl'],
+        'tags': ['command'],
+    },
+    'syslog': {
+        'version': '1.0',
+        'description': 'Syslog RFC 5424 string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'syslog_s': {
+        'version': '1.0',
+        'description': 'Syslog RFC 5424 string streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+        'streaming': True,
+    },
+    'syslog_bsd': {
+        'version': '1.0',
+        'description': 'Syslog RFC 3164 string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'syslog_bsd_s': {
+        'version': '1.0',
+        'description': 'Syslog RFC 3164 string streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+        'streaming': True,
+    },
+    'systemctl': {
+        'version': '1.5',
+        'description': '`systemctl` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['systemctl'],
+        'tags': ['command'],
+    },
+    'systemctl_lj': {
+        'version': '1.7',
+        'description': '`systemctl list-jobs` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['systemctl list-jobs'],
+        'tags': ['command'],
+    },
+    'systemctl_ls': {
+        'version': '1.5',
+        'description': '`systemctl list-sockets` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['systemctl list-sockets'],
+        'tags': ['command'],
+    },
+    'systemctl_luf': {
+        'version': '1.5',
+        'description': '`systemctl list-unit-files` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['systemctl list-unit-files'],
+        'tags': ['command'],
+    },
+    'systeminfo': {
+        'version': '1.3',
+        'description': '`systeminfo` command parser',
+        'author': 'Jon Smith',
+        'author_email': 'jon@rebelliondefense.com',
+        'compatible': ['win32'],
+        'magic_commands': ['systeminfo'],
+        'tags': ['command'],
+    },
+    'time': {
+        'version': '1.5',
+        'description': '`/usr/bin/time` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'tags': ['command'],
+    },
+    'timedatectl': {
+        'version': '1.8',
+        'description': '`timedatectl status` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['timedatectl', 'timedatectl status'],
+        'tags': ['command'],
+    },
+    'timestamp': {
+        'version': '1.1',
+        'description': 'Unix Epoch Timestamp string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'aix', 'freebsd', 'darwin', 'win32', 'cygwin'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'toml': {
+        'version': '1.0',
+        'description': 'TOML file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the tomli library at https://github.com/hukkin/tomli.',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'top': {
+        'version': '1.2',
+        'description': '`top -b` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['top -b'],
+        'tags': ['command'],
+    },
+    'top_s': {
+        'version': '1.2',
+        'description': '`top -b` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'tracepath': {
+        'version': '1.4',
+        'description': '`tracepath` and `tracepath6` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['tracepath', 'tracepath6'],
+        'tags': ['command'],
+    },
+    'traceroute': {
+        'version': '1.8',
+        'description': '`traceroute` and `traceroute6` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the trparse library by Luis Benitez at https://github.com/lbenitez000/trparse',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['traceroute', 'traceroute6'],
+        'tags': ['command'],
+    },
+    'tune2fs': {
+        'version': '1.0',
+        'description': '`tune2fs -l` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'magic_commands': ['tune2fs -l'],
+    },
+    'udevadm': {
+        'version': '1.0',
+        'description': '`udevadm info` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['udevadm info'],
+        'tags': ['command'],
+    },
+    'ufw': {
+        'version': '1.2',
+        'description': '`ufw status` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['ufw status'],
+        'tags': ['command'],
+    },
+    'ufw_appinfo': {
+        'version': '1.3',
+        'description': '`ufw app info [application]` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['ufw app'],
+        'tags': ['command'],
+    },
+    'uname': {
+        'version': '1.8',
+        'description': '`uname -a` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'magic_commands': ['uname'],
+        'tags': ['command', 'slurpable'],
+    },
+    'update_alt_gs': {
+        'version': '1.0',
+        'description': '`update-alternatives --get-selections` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['update-alternatives --get-selections'],
+        'tags': ['command'],
+    },
+    'update_alt_q': {
+        'version': '1.2',
+        'description': '`update-alternatives --query` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['update-alternatives --query'],
+        'tags': ['command'],
+    },
+    'upower': {
+        'version': '1.4',
+        'description': '`upower` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['upower'],
+        'tags': ['command'],
+    },
+    'uptime': {
+        'version': '1.10',
+        'description': '`uptime` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['uptime'],
+        'tags': ['command', 'slurpable'],
+    },
+    'url': {
+        'version': '1.1',
+        'description': 'URL string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'string', 'slurpable'],
+    },
+    'ver': {
+        'version': '1.2',
+        'description': 'Version string parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Based on distutils/version.py from CPython 3.9.5.',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['generic', 'string', 'slurpable'],
+    },
+    'veracrypt': {
+        'version': '1.0',
+        'description': '`veracrypt` command parser',
+        'author': 'Jake Ob',
+        'author_email': 'iakopap at gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['veracrypt'],
+        'tags': ['command'],
+    },
+    'vmstat': {
+        'version': '1.4',
+        'description': '`vmstat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'magic_commands': ['vmstat'],
+        'tags': ['command'],
+    },
+    'vmstat_s': {
+        'version': '1.3',
+        'description': '`vmstat` command streaming parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux'],
+        'tags': ['command'],
+        'streaming': True,
+    },
+    'w': {
+        'version': '1.6',
+        'description': '`w` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['w'],
+        'tags': ['command'],
+    },
+    'wc': {
+        'version': '1.4',
+        'description': '`wc` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['wc'],
+        'tags': ['command'],
+    },
+    'wg_show': {
+        'version': '1.0',
+        'description': '`wg show` command parser',
+        'author': 'Hamza Saht',
+        'author_email': 'hamzasaht01@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['wg show'],
+    },
+    'who': {
+        'version': '1.8',
+        'description': '`who` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['who'],
+        'tags': ['command'],
+    },
+    'x509_cert': {
+        'version': '1.4',
+        'description': 'X.509 PEM and DER certificate file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the asn1crypto library at https://github.com/wbond/asn1crypto/releases/tag/1.5.1',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string', 'binary'],
+    },
+    'x509_csr': {
+        'version': '1.0',
+        'description': 'X.509 PEM and DER certificate request file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the asn1crypto library at https://github.com/wbond/asn1crypto/releases/tag/1.5.1',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string', 'binary'],
+    },
+    'xml': {
+        'version': '1.10',
+        'description': 'XML file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the xmltodict library at https://github.com/martinblech/xmltodict',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'xrandr': {
+        'version': '2.1',
+        'description': '`xrandr` command parser',
+        'author': 'Kevin Lyter',
+        'author_email': 'code (at) lyterk.com',
+        'details': 'Using parts of the pyedid library at https://github.com/jojonas/pyedid.',
+        'compatible': ['linux', 'darwin', 'cygwin', 'aix', 'freebsd'],
+        'magic_commands': ['xrandr'],
+        'tags': ['command'],
+    },
+    'yaml': {
+        'version': '1.8',
+        'description': 'YAML file parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'details': 'Using the ruamel.yaml library at https://pypi.org/project/ruamel.yaml',
+        'compatible': ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd'],
+        'tags': ['standard', 'file', 'string'],
+    },
+    'zipinfo': {
+        'version': '1.2',
+        'description': '`zipinfo` command parser',
+        'author': 'Matt J',
+        'author_email': 'https://github.com/listuser',
+        'compatible': ['linux', 'darwin'],
+        'magic_commands': ['zipinfo'],
+        'tags': ['command'],
+    },
+    'zpool_iostat': {
+        'version': '1.0',
+        'description': '`zpool iostat` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['zpool iostat'],
+    },
+    'zpool_status': {
+        'version': '1.2',
+        'description': '`zpool status` command parser',
+        'author': 'Kelly Brazil',
+        'author_email': 'kellyjonbrazil@gmail.com',
+        'compatible': ['linux', 'darwin', 'freebsd'],
+        'tags': ['command'],
+        'magic_commands': ['zpool status'],
+    },
+}
@@ -117,6 +117,7 @@ Examples:
     ]
 """
 import re
+import sys
 from functools import lru_cache
 from typing import List, Dict
 import jc.utils
@@ -125,7 +126,7 @@ from jc.parsers.universal import sparse_table_parse
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.2'
+    version = '1.3'
     description = 'ASCII and Unicode table parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -235,13 +236,19 @@ def _is_separator(line: str) -> bool:
     return False
 
 
+_SPECIAL_CHARS = re.compile(r'[^a-zA-Z0-9� ]')
+_WORD_SPACES = re.compile(r'\b \b')
+_CONSECUTIVE_UNDERSCORES = re.compile(r'__+')
+_TRAILING_UNDERSCORES = re.compile(r'_+$')
+
+
 def _snake_case(line: str) -> str:
     """
     Replace spaces between words and special characters with an underscore.
     Ignore the replacement char (�) used for header padding.
     """
-    line = re.sub(r'[^a-zA-Z0-9� ]', '_', line)  # special characters
-    line = re.sub(r'\b \b', '_', line)           # spaces between words
+    line = _SPECIAL_CHARS.sub('_', line)  # special characters
+    line = _WORD_SPACES.sub('_', line)    # spaces between words
     return line
 
 
@@ -304,19 +311,23 @@ def _normalize_rows(table: str) -> List[str]:
     return result
 
 
+@lru_cache(maxsize=1024)
+def _fixup_header(header: str) -> str:
+    """remove the replacement character, consecutive and trailing underscores"""
+    # This function is cacheable since every row has the same headers
+    header = header.replace('�', '')
+    header = _CONSECUTIVE_UNDERSCORES.sub('_', header)
+    header = _TRAILING_UNDERSCORES.sub('', header)
+    return sys.intern(header)
+
+
 def _fixup_headers(table: List[Dict]) -> List[Dict]:
     """remove consecutive underscores and any trailing underscores"""
     new_table = []
     for row in table:
         new_row = row.copy()
         for k in row:
-            # remove replacement character
-            k_new = k.replace('�', '')
-            # remove consecutive underscores
-            k_new = re.sub(r'__+', '_', k_new)
-            # remove trailing underscores
-            k_new = re.sub(r'_+$', '', k_new)
-            new_row[k_new] = new_row.pop(k)
+            new_row[_fixup_header(k)] = new_row.pop(k)
         new_table.append(new_row)
 
     return new_table
@@ -102,6 +102,7 @@ Examples:
     ]
 """
 import re
+import sys
 from functools import lru_cache
 from typing import Iterable, Tuple, List, Dict, Optional
 import jc.utils
@@ -110,7 +111,7 @@ from jc.exceptions import ParseError
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.2'
+    version = '1.3'
     description = 'multi-line ASCII and Unicode table parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -136,12 +137,17 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
     # normalize keys: convert to lowercase
     for item in proc_data:
         for key in item.copy():
-            k_new = key.lower()
-            item[k_new] = item.pop(key)
+            item[_lower_key(key)] = item.pop(key)
 
     return proc_data
 
 
+@lru_cache(maxsize=1024)
+def _lower_key(key: str) -> str:
+    # This function is cacheable since every row has the same headers
+    return sys.intern(key.lower())
+
+
 def _remove_ansi(string: str) -> str:
     ansi_escape = re.compile(r'(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]')
     return ansi_escape.sub('', string)
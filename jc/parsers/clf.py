@@ -174,7 +174,7 @@ import jc.utils
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.0'
+    version = '1.1'
     description = 'Common and Combined Log Format file parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -210,11 +210,12 @@ def _process(proc_data: List[JSONDictType]) -> List[JSONDictType]:
             if val == '-' or val == '':
                 log[key] = None
 
-        # add unix timestamps
-        if 'date' in log:
-            ts = jc.utils.timestamp(log['date'], format_hint=(1800,))
-            log['epoch'] = ts.naive
-            log['epoch_utc'] = ts.utc
+    # add unix timestamps
+    dated = [log for log in proc_data if 'date' in log]
+    ts_list = jc.utils.timestamps([log['date'] for log in dated], format_hint=(1800,))
+    for log, ts in zip(dated, ts_list):
+        log['epoch'] = ts.naive
+        log['epoch_utc'] = ts.utc
 
     return proc_data
 
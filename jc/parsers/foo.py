@@ -57,6 +57,15 @@ class info():
     deprecated = False
     hidden = False
 
+    # enable if the first line is a header row and each following line is
+    # parsed independently. Allows large inputs to be parsed in chunks by
+    # worker processes (--workers)
+    chunkable = False
+
+    # enable if parse() accepts a `sink` function that is called with each
+    # record as soon as it is processed (jc.parse(..., sink=func) and --jsonl)
+    incremental = False
+
 
 __version__ = info.version
 
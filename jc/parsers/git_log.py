@@ -223,7 +223,7 @@ changes_pattern = re.compile(r'\s(?P<files>\d+)\s+(files? changed)(?:,\s+(?P<ins
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.5'
+    version = '1.6'
     description = '`git log` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -249,12 +249,13 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
     """
     int_list = {'files_changed', 'insertions', 'deletions', 'lines_changed'}
 
-    for entry in proc_data:
-        if 'date' in entry:
-            ts = jc.utils.timestamp(entry['date'], format_hint=(1100,))
-            entry['epoch'] = ts.naive
-            entry['epoch_utc'] = ts.utc
+    dated = [entry for entry in proc_data if 'date' in entry]
+    ts_list = jc.utils.timestamps([entry['date'] for entry in dated], format_hint=(1100,))
+    for entry, ts in zip(dated, ts_list):
+        entry['epoch'] = ts.naive
+        entry['epoch_utc'] = ts.utc
 
+    for entry in proc_data:
         if 'stats' in entry:
             for key in entry['stats']:
                 if key in int_list:
@@ -98,6 +98,7 @@ Examples:
     {"device":"sda","tps":"0.24","kb_read_s":"5.28","kb_wrtn_s":"1.10"...}
     ...
 """
+from functools import lru_cache
 import jc.utils
 from jc.streaming import (
     add_jc_meta, streaming_input_type_check, streaming_line_input_type_check, raise_or_yield
@@ -108,7 +109,7 @@ import jc.parsers.universal
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.3'
+    version = '1.4'
     description = '`iostat` command streaming parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -154,8 +155,13 @@ def _process(proc_data):
     return proc_data
 
 
+_HEADER_TRANSLATION = str.maketrans({'%': 'percent_', '/': '_', '-': '_'})
+
+
+@lru_cache(maxsize=32)
 def _normalize_headers(line):
-    return line.replace('%', 'percent_').replace('/', '_').replace('-', '_').lower()
+    # This function is cacheable since every block repeats the same header line
+    return line.translate(_HEADER_TRANSLATION).lower()
 
 
 def _create_obj_list(section_list, section_name):
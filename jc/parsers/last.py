@@ -110,7 +110,7 @@ LOGOUT_IGNORED_EVENTS = ['down', 'crash']
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.9'
+    version = '1.10'
     description = '`last` and `lastb` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -135,6 +135,12 @@ def _process(proc_data):
 
         List of Dictionaries. Structured data to conform to the schema.
     """
+    date_strings = [
+        entry[key] for entry in proc_data for key in ('login', 'logout')
+        if key in entry and LOGIN_LOGOUT_EPOCH_RE.match(entry[key])
+    ]
+    epochs = {ts.string: ts.naive for ts in jc.utils.timestamps(date_strings)}
+
     for entry in proc_data:
         if 'user' in entry and entry['user'] == 'boot_time':
             entry['user'] = 'boot time'
@@ -154,13 +160,11 @@ def _process(proc_data):
         if 'logout' in entry and entry['logout'] == 'gone_-_no_logout':
             entry['logout'] = 'gone - no logout'
 
-        if 'login' in entry and LOGIN_LOGOUT_EPOCH_RE.match(entry['login']):
-            timestamp = jc.utils.timestamp(entry['login'])
-            entry['login_epoch'] = timestamp.naive
+        if 'login' in entry and entry['login'] in epochs:
+            entry['login_epoch'] = epochs[entry['login']]
 
-        if 'logout' in entry and LOGIN_LOGOUT_EPOCH_RE.match(entry['logout']):
-            timestamp = jc.utils.timestamp(entry['logout'])
-            entry['logout_epoch'] = timestamp.naive
+        if 'logout' in entry and entry['logout'] in epochs:
+            entry['logout_epoch'] = epochs[entry['logout']]
 
         if 'login_epoch' in entry and 'logout_epoch' in entry:
             entry['duration_seconds'] = entry['logout_epoch'] - entry['login_epoch']
@@ -118,7 +118,7 @@ import jc.utils
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.12'
+    version = '1.13'
     description = '`ls` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -144,6 +144,8 @@ def _process(proc_data):
     """
     int_list = {'links', 'size'}
 
+    dated = []
+
     for entry in proc_data:
         for key in entry:
             if key in int_list:
@@ -152,9 +154,12 @@ def _process(proc_data):
         if 'date' in entry:
             # to speed up processing only try to convert the date if it's not the default format
             if not re.match(r'[a-zA-Z]{3}\s{1,2}\d{1,2}\s{1,2}[0-9:]{4,5}', entry['date']):
-                ts = jc.utils.timestamp(entry['date'], format_hint=(7200,))
-                entry['epoch'] = ts.naive
-                entry['epoch_utc'] = ts.utc
+                dated.append(entry)
+
+    ts_list = jc.utils.timestamps([entry['date'] for entry in dated], format_hint=(7200,))
+    for entry, ts in zip(dated, ts_list):
+        entry['epoch'] = ts.naive
+        entry['epoch_utc'] = ts.utc
 
     return proc_data
 
@@ -120,13 +120,15 @@ import jc.parsers.universal
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.6'
+    version = '1.8'
     description = '`lsof` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
     compatible = ['linux', 'darwin', 'aix', 'freebsd']
     magic_commands = ['lsof']
     tags = ['command']
+    chunkable = True
+    incremental = True
 
 
 __version__ = info.version
@@ -154,7 +156,7 @@ def _process(proc_data):
     return proc_data
 
 
-def parse(data, raw=False, quiet=False):
+def parse(data, raw=False, quiet=False, sink=None):
     """
     Main text parsing function
 
@@ -163,10 +165,14 @@ def parse(data, raw=False, quiet=False):
         data:        (string)  text data to parse
         raw:         (boolean) unprocessed output if True
         quiet:       (boolean) suppress warning messages if True
+        sink:        (callable) optional function that is called with each
+                                record as soon as it is processed instead
+                                of returning the list of records
 
     Returns:
 
-        List of Dictionaries. Raw or processed structured data.
+        List of Dictionaries. Raw or processed structured data. None if
+        sink is used.
     """
     jc.utils.compatibility(__name__, info.compatible, quiet)
     jc.utils.input_type_check(data)
@@ -181,8 +187,17 @@ def parse(data, raw=False, quiet=False):
         cleandata[0] = cleandata[0].lower()
         cleandata[0] = cleandata[0].replace('/', '_')
 
+        if sink is not None:
+            for entry in jc.parsers.universal.sparse_table_parse_iter(cleandata):
+                sink(entry if raw else _process([entry])[0])
+
+            return None
+
         raw_output = jc.parsers.universal.sparse_table_parse(cleandata)
 
+    if sink is not None:
+        return None
+
     if raw:
         return raw_output
     else:
@@ -76,6 +76,7 @@ Examples:
     {"time":"1646859134","uid":"0","pid":"9","percent_usr":"0.00","perc...}
     ...
 """
+from functools import lru_cache
 from typing import List, Dict, Iterable, Union
 import jc.utils
 from jc.streaming import (
@@ -87,7 +88,7 @@ from jc.exceptions import ParseError
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.2'
+    version = '1.3'
     description = '`pidstat -H` command streaming parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -132,12 +133,13 @@ def _process(proc_data: Dict) -> Dict:
     return proc_data
 
 
+_HEADER_TRANSLATION = str.maketrans({'#': ' ', '-': '_', '/': '_', '%': 'percent_'})
+
+
+@lru_cache(maxsize=32)
 def normalize_header(header: str) -> str:
-    return header.replace('#', ' ')\
-                 .replace('-', '_')\
-                 .replace('/', '_')\
-                 .replace('%', 'percent_')\
-                 .lower()
+    # This function is cacheable since every block repeats the same header line
+    return header.translate(_HEADER_TRANSLATION).lower()
 
 
 @add_jc_meta
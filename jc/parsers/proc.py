@@ -10,7 +10,8 @@ When multiple files are selected (e.g. `jc /proc/*/stat`) all of the output
 will be wrapped inside an array. Also, a `_file` field will be included in
 the output which helps correlate the input and output. The `--meta-out`
 option can also be used to list the `/proc` input files for correlation with
-the output list.
+the output list. Known `/proc` files are identified by their path instead of
+their contents when using the magic syntax.
 
 Specific Proc file parsers can also be called directly, if desired, and have
 a naming convention of `proc-<name>` (cli) or `proc_<name>` (module). To see
@@ -33,6 +34,11 @@ Usage (module):
     import jc
     result = jc.parse('proc', proc_file)
 
+or
+
+    import jc
+    result = jc.parse('proc', proc_file, filename='/proc/meminfo')
+
 Schema:
 
 See the specific Proc parser for the schema:
@@ -118,7 +124,8 @@ Examples:
     ]
 """
 import re
-from typing import List, Dict, Union
+from functools import lru_cache
+from typing import List, Dict, Optional, Pattern, Tuple, Union
 import jc.utils
 from jc.lib import get_parser
 from jc.exceptions import ParseError
@@ -126,7 +133,7 @@ from jc.exceptions import ParseError
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.4'
+    version = '1.5'
     description = '`/proc/` file parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -137,10 +144,182 @@ class info():
 __version__ = info.version
 
 
+# Signatures are tried in this order. Each entry is a tuple of (first
+# character pattern, signature pattern, parser module name). The first
+# character pattern must match the first character of the data for the
+# signature to be tried. A first character pattern of None means the
+# signature is always tried.
+_SIGNATURES: Tuple[Tuple[Optional[str], Pattern, str], ...] = (
+    ('N', re.compile(r'^Node \d+, zone\s+\w+\s+(?:\d+\s+){11}\n'), 'proc_buddyinfo'),
+    ('B', re.compile(r'^BOOT_IMAGE='), 'proc_cmdline'),
+    (r'\w', re.compile(r'^\w+\s+[\-WUR]{3} \([ECBpba ]+\)\s+\d+:\d+\n'), 'proc_consoles'),
+    ('p', re.compile(r'^processor\t+: \d+.*bogomips\t+: \d+.\d\d\n', re.DOTALL), 'proc_cpuinfo'),
+    ('n', re.compile(r'^name\s+:.*\ndriver\s+:.*\nmodule\s+:.*\n'), 'proc_crypto'),
+    ('C', re.compile(r'^Character devices:\n\s+\d+ .*\n'), 'proc_devices'),
+    (r'[\s\d]', re.compile(r'^\s*\d+\s+\d\s\w+\s(?:\d+\s){10,16}\d+\n'), 'proc_diskstats'),
+    (r'[n\t]', re.compile(r'^(?:(?:nodev\t|\t)\w+\n){3}'), 'proc_filesystems'),
+    (r'\s', re.compile(r'^\s+(?:CPU\d+ +)+\n\s*\d+:\s+\d+'), 'proc_interrupts'),
+    ('0', re.compile(r'^00000000-[0-9a-f]{8} : .*\n[0-9a-f]{8}-[0-9a-f]{8} : '), 'proc_iomem'),
+    ('0', re.compile(r'^0000-[0-9a-f]{4} : .*\n\s*0000-[0-9a-f]{4} : '), 'proc_ioports'),
+    (r'\d', re.compile(r'^\d+.\d\d \d+.\d\d \d+.\d\d \d+/\d+ \d+$'), 'proc_loadavg'),
+    (r'\d', re.compile(r'^\d+: (?:POSIX|FLOCK|OFDLCK)\s+(?:ADVISORY|MANDATORY)\s+(?:READ|WRITE) '), 'proc_locks'),
+    ('M', re.compile(r'^MemTotal:.*\nMemFree:.*\nMemAvailable:.*\n'), 'proc_meminfo'),
+    (r'\w', re.compile(r'^\w+ \d+ \d+ (?:-|\w+,).*0x[0-9a-f]{16}\n'), 'proc_modules'),
+    ('r', re.compile(r'^reg\d+: base=0x[0-9a-f]+ \('), 'proc_mtrr'),
+    ('P', re.compile(r'^Page block order:\s+\d+\nPages per block:\s+\d+\n\n'), 'proc_pagetypeinfo'),
+    ('m', re.compile(r'^major minor  #blocks  name\n\n\s*\d+\s+\d+\s+\d+ \w+\n'), 'proc_partitions'),
+    ('s', re.compile(r'^slabinfo - version: \d+.\d+\n'), 'proc_slabinfo'),
+    (r'\s', re.compile(r'^\s+(CPU\d+\s+)+\n\s+HI:\s+\d'), 'proc_softirqs'),
+    ('c', re.compile(r'^cpu\s+(?: \d+){7,10}.*intr ', re.DOTALL), 'proc_stat'),
+    ('F', re.compile(r'^Filename\t\t\t\tType\t\tSize\t\tUsed\t\tPriority\n'), 'proc_swaps'),
+    (r'\d', re.compile(r'^\d+.\d\d \d+.\d\d$'), 'proc_uptime'),
+    ('.', re.compile(r'^.+\sversion\s[^\n]+$'), 'proc_version'),
+    ('0', re.compile(r'^0x[0-9a-f]{16}-0x[0-9a-f]{16}\s+\d+ \w+\+\w+/\w+ '), 'proc_vmallocinfo'),
+    ('N', re.compile(r'^Node \d+, zone\s+\w+\n'), 'proc_zoneinfo'),           # before vmstat
+    (None, re.compile(r'nr_free_pages \d+\n.* \d$', re.DOTALL), 'proc_vmstat'),  # after zoneinfo
+
+    ('r', re.compile(r'^rtc_time\t: .*\nrtc_date\t: .*\nalrm_time\t: .*\n'), 'proc_driver_rtc'),
+
+    ('I', re.compile(r'^IP address\s+HW type\s+Flags\s+HW address\s+Mask\s+Device\n'), 'proc_net_arp'),
+    ('I', re.compile(r'^Inter-\|\s+Receive\s+\|\s+Transmit\n'), 'proc_net_dev'),
+    ('[0-9a-f]', re.compile(r'^[0-9a-f]{32} \d\d \d\d \d\d \d\d\s+\w+'), 'proc_net_if_inet6'),
+    ('I', re.compile(r'^Idx\tDevice\s+:\s+Count\s+Querier\tGroup\s+Users\s+Timer\tReporter\n'), 'proc_net_igmp'),
+    (r'\d', re.compile(r'^\d+\s+\w+\s+[0-9a-f]{32}\s+\d+\s+[0-9A-F]{8}\s+\d+'), 'proc_net_igmp6'),
+    ('s', re.compile(r'^sk\s+Eth Pid\s+Groups\s+Rmem\s+Wmem'), 'proc_net_netlink'),
+    ('T', re.compile(r'^TcpExt: SyncookiesSent SyncookiesRecv SyncookiesFailed'), 'proc_net_netstat'),
+    ('s', re.compile(r'^sk       RefCnt Type Proto  Iface R Rmem   User   Inode\n'), 'proc_net_packet'),
+    ('p', re.compile(r'^protocol  size sockets  memory press maxhdr  slab module     cl co di ac io in de sh ss gs se re sp bi br ha uh gp em\n'), 'proc_net_protocols'),
+    ('I', re.compile(r'^Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\s+\n'), 'proc_net_route'),
+    (r'\s', re.compile(r'^\s+sl\s+local_address\s+(?:rem_address|remote_address)\s+st\s+tx_queue\s+rx_queue\s+tr\s+tm->when\s+retrnsmt\s+uid\s+timeout\s+inode'), 'proc_net_tcp'),
+    ('N', re.compile(r'^Num       RefCount Protocol Flags    Type St Inode Path\n'), 'proc_net_unix'),
+    ('[0-9a-f]', re.compile(r'^[0-9a-f]{32} \d\d [0-9a-f]{32} \d\d [0-9a-f]{32} (?:[0-9a-f]{8} ){4}\s+\w+'), 'proc_net_ipv6_route'),  # before net_dev_mcast
+    (r'\d', re.compile(r'^\d+\s+\w+\s+\d+\s+\d+\s+[0-9a-f]{12}'), 'proc_net_dev_mcast'),  # after net_ipv6_route
+
+    ('p', re.compile(r'^pos:\t\d+\nflags:\t\d+\nmnt_id:\t\d+\n'), 'proc_pid_fdinfo'),
+    ('r', re.compile(r'^rchar: \d+\nwchar: \d+\nsyscr: \d+\n'), 'proc_pid_io'),
+    (r'\d', re.compile(r'^\d+ \d+ \d+:\d+ /.+\n'), 'proc_pid_mountinfo'),
+    ('[a-f0-9]', re.compile(r'^[a-f0-9]{12} default [^\n]+\n'), 'proc_pid_numa_maps'),
+    (r'\d', re.compile(r'^\d+ \(.+\) \S \d+ \d+ \d+ \d+ -?\d+ (?:\d+ ){43}\d+$', re.DOTALL), 'proc_pid_stat'),
+    (r'\d', re.compile(r'^\d+ \d+ \d+\s\d+\s\d+\s\d+\s\d+$'), 'proc_pid_statm'),
+    ('N', re.compile(r'^Name:\t.+\n(?:Umask:\t\d+\n)?State:\t.+\nTgid:\t\d+\n'), 'proc_pid_status'),
+    ('[0-9a-f]', re.compile(r'^[0-9a-f]{12}-[0-9a-f]{12} [rwxsp\-]{4} [0-9a-f]{8} [0-9a-f]{2}:[0-9a-f]{2} \d+ [^\n]+\nSize:\s+\d+ \S\S\n'), 'proc_pid_smaps'),  # before pid_maps
+    ('[0-9a-f]', re.compile(r'^[0-9a-f]{12}-[0-9a-f]{12} [rwxsp\-]{4} [0-9a-f]{8} [0-9a-f]{2}:[0-9a-f]{2} \d+ '), 'proc_pid_maps'),  # after pid_smaps
+
+    # (None, re.compile(r"^'\w+' '.+' 0x\d+"), 'proc_scsi_device_info'),
+    # ('A', re.compile(r'^Attached devices:\nHost: \w+ '), 'proc_scsi_scsi'),
+)
+
+# /proc file paths and their parser module names. Per-process files can also
+# be found under /proc/self, /proc/thread-self, and /proc/<pid>/task/<tid>.
+_PID_DIR = r'/proc/(?:\d+|self|thread-self)(?:/task/\d+)?'
+_NET_DIR = r'/proc(?:/(?:\d+|self|thread-self)(?:/task/\d+)?)?/net'
+
+_FILE_SIGNATURES: Tuple[Tuple[Pattern, str], ...] = (
+    (re.compile(r'/proc/buddyinfo'), 'proc_buddyinfo'),
+    (re.compile(r'/proc/cmdline'), 'proc_cmdline'),
+    (re.compile(r'/proc/consoles'), 'proc_consoles'),
+    (re.compile(r'/proc/cpuinfo'), 'proc_cpuinfo'),
+    (re.compile(r'/proc/crypto'), 'proc_crypto'),
+    (re.compile(r'/proc/devices'), 'proc_devices'),
+    (re.compile(r'/proc/diskstats'), 'proc_diskstats'),
+    (re.compile(r'/proc/filesystems'), 'proc_filesystems'),
+    (re.compile(r'/proc/interrupts'), 'proc_interrupts'),
+    (re.compile(r'/proc/iomem'), 'proc_iomem'),
+    (re.compile(r'/proc/ioports'), 'proc_ioports'),
+    (re.compile(r'/proc/loadavg'), 'proc_loadavg'),
+    (re.compile(r'/proc/locks'), 'proc_locks'),
+    (re.compile(r'/proc/meminfo'), 'proc_meminfo'),
+    (re.compile(r'/proc/modules'), 'proc_modules'),
+    (re.compile(r'/proc/mtrr'), 'proc_mtrr'),
+    (re.compile(r'/proc/pagetypeinfo'), 'proc_pagetypeinfo'),
+    (re.compile(r'/proc/partitions'), 'proc_partitions'),
+    (re.compile(r'/proc/slabinfo'), 'proc_slabinfo'),
+    (re.compile(r'/proc/softirqs'), 'proc_softirqs'),
+    (re.compile(r'/proc/stat'), 'proc_stat'),
+    (re.compile(r'/proc/swaps'), 'proc_swaps'),
+    (re.compile(r'/proc/uptime'), 'proc_uptime'),
+    (re.compile(r'/proc/version'), 'proc_version'),
+    (re.compile(r'/proc/vmallocinfo'), 'proc_vmallocinfo'),
+    (re.compile(r'/proc/vmstat'), 'proc_vmstat'),
+    (re.compile(r'/proc/zoneinfo'), 'proc_zoneinfo'),
+
+    (re.compile(r'/proc/driver/rtc'), 'proc_driver_rtc'),
+
+    (re.compile(_NET_DIR + r'/arp'), 'proc_net_arp'),
+    (re.compile(_NET_DIR + r'/dev'), 'proc_net_dev'),
+    (re.compile(_NET_DIR + r'/dev_mcast'), 'proc_net_dev_mcast'),
+    (re.compile(_NET_DIR + r'/if_inet6'), 'proc_net_if_inet6'),
+    (re.compile(_NET_DIR + r'/igmp'), 'proc_net_igmp'),
+    (re.compile(_NET_DIR + r'/igmp6'), 'proc_net_igmp6'),
+    (re.compile(_NET_DIR + r'/ipv6_route'), 'proc_net_ipv6_route'),
+    (re.compile(_NET_DIR + r'/netlink'), 'proc_net_netlink'),
+    (re.compile(_NET_DIR + r'/netstat'), 'proc_net_netstat'),
+    (re.compile(_NET_DIR + r'/packet'), 'proc_net_packet'),
+    (re.compile(_NET_DIR + r'/protocols'), 'proc_net_protocols'),
+    (re.compile(_NET_DIR + r'/route'), 'proc_net_route'),
+    (re.compile(_NET_DIR + r'/(?:tcp|tcp6)'), 'proc_net_tcp'),
+    (re.compile(_NET_DIR + r'/unix'), 'proc_net_unix'),
+
+    (re.compile(_PID_DIR + r'/fdinfo/\d+'), 'proc_pid_fdinfo'),
+    (re.compile(_PID_DIR + r'/io'), 'proc_pid_io'),
+    (re.compile(_PID_DIR + r'/maps'), 'proc_pid_maps'),
+    (re.compile(_PID_DIR + r'/mountinfo'), 'proc_pid_mountinfo'),
+    (re.compile(_PID_DIR + r'/numa_maps'), 'proc_pid_numa_maps'),
+    (re.compile(_PID_DIR + r'/smaps'), 'proc_pid_smaps'),
+    (re.compile(_PID_DIR + r'/stat'), 'proc_pid_stat'),
+    (re.compile(_PID_DIR + r'/statm'), 'proc_pid_statm'),
+    (re.compile(_PID_DIR + r'/status'), 'proc_pid_status'),
+)
+
+
+# This function is cacheable since the signatures do not change
+@lru_cache(maxsize=256)
+def _candidates(first_char: str) -> Tuple[Tuple[Pattern, str], ...]:
+    """
+    Return the (signature pattern, parser module name) tuples, in order,
+    that can match data starting with `first_char`.
+    """
+    return tuple(
+        (signature, module)
+        for first_char_pattern, signature, module in _SIGNATURES
+        if first_char_pattern is None or re.fullmatch(first_char_pattern, first_char)
+    )
+
+
+def parser_from_filename(filename: str) -> Optional[str]:
+    """
+    Return the Proc file parser module name for a `/proc` file path, or None
+    if the path is not a known Proc file.
+
+    Parameters:
+
+        filename:    (string)  path to the Proc file (e.g. `/proc/meminfo`)
+
+    Returns:
+
+        String or None. Parser module name (e.g. `proc_meminfo`)
+    """
+    for file_pattern, module in _FILE_SIGNATURES:
+        if file_pattern.fullmatch(filename):
+            return module
+
+    return None
+
+
+def _parser_from_data(data: str) -> Optional[str]:
+    """Return the Proc file parser module name for the data, or None."""
+    for signature, module in _candidates(data[0]):
+        if signature.search(data):
+            return module
+
+    return None
+
+
 def parse(
     data: str,
     raw: bool = False,
-    quiet: bool = False
+    quiet: bool = False,
+    filename: Optional[str] = None
 ) -> Union[List[Dict], Dict]:
     """
     Main text parsing function
@@ -150,6 +329,9 @@ def parse(
         data:        (string)  text data to parse
         raw:         (boolean) unprocessed output if True
         quiet:       (boolean) suppress warning messages if True
+        filename:    (string)  optional path of the Proc file. If this is
+                               a known Proc file path then the file type is
+                               not detected from the data.
 
     Returns:
 
@@ -158,131 +340,13 @@ def parse(
     jc.utils.input_type_check(data)
 
     if jc.utils.has_data(data):
-        # signatures
-        buddyinfo_p = re.compile(r'^Node \d+, zone\s+\w+\s+(?:\d+\s+){11}\n')
-        cmdline_p = re.compile(r'^BOOT_IMAGE=')
-        consoles_p = re.compile(r'^\w+\s+[\-WUR]{3} \([ECBpba ]+\)\s+\d+:\d+\n')
-        cpuinfo_p = re.compile(r'^processor\t+: \d+.*bogomips\t+: \d+.\d\d\n', re.DOTALL)
-        crypto_p = re.compile(r'^name\s+:.*\ndriver\s+:.*\nmodule\s+:.*\n')
-        devices_p = re.compile(r'^Character devices:\n\s+\d+ .*\n')
-        diskstats_p = re.compile(r'^\s*\d+\s+\d\s\w+\s(?:\d+\s){10,16}\d+\n')
-        filesystems_p = re.compile(r'^(?:(?:nodev\t|\t)\w+\n){3}')
-        interrupts_p = re.compile(r'^\s+(?:CPU\d+ +)+\n\s*\d+:\s+\d+')
-        iomem_p = re.compile(r'^00000000-[0-9a-f]{8} : .*\n[0-9a-f]{8}-[0-9a-f]{8} : ')
-        ioports_p = re.compile(r'^0000-[0-9a-f]{4} : .*\n\s*0000-[0-9a-f]{4} : ')
-        loadavg_p = re.compile(r'^\d+.\d\d \d+.\d\d \d+.\d\d \d+/\d+ \d+$')
-        locks_p = re.compile(r'^\d+: (?:POSIX|FLOCK|OFDLCK)\s+(?:ADVISORY|MANDATORY)\s+(?:READ|WRITE) ')
-        meminfo_p = re.compile(r'^MemTotal:.*\nMemFree:.*\nMemAvailable:.*\n')
-        modules_p = re.compile(r'^\w+ \d+ \d+ (?:-|\w+,).*0x[0-9a-f]{16}\n')
-        mtrr_p = re.compile(r'^reg\d+: base=0x[0-9a-f]+ \(')
-        pagetypeinfo_p = re.compile(r'^Page block order:\s+\d+\nPages per block:\s+\d+\n\n')
-        partitions_p = re.compile(r'^major minor  #blocks  name\n\n\s*\d+\s+\d+\s+\d+ \w+\n')
-        slabinfo_p = re.compile(r'^slabinfo - version: \d+.\d+\n')
-        softirqs_p = re.compile(r'^\s+(CPU\d+\s+)+\n\s+HI:\s+\d')
-        stat_p = re.compile(r'^cpu\s+(?: \d+){7,10}.*intr ', re.DOTALL)
-        swaps_p = re.compile(r'^Filename\t\t\t\tType\t\tSize\t\tUsed\t\tPriority\n')
-        uptime_p = re.compile(r'^\d+.\d\d \d+.\d\d$')
-        version_p = re.compile(r'^.+\sversion\s[^\n]+$')
-        vmallocinfo_p = re.compile(r'^0x[0-9a-f]{16}-0x[0-9a-f]{16}\s+\d+ \w+\+\w+/\w+ ')
-        vmstat_p = re.compile(r'nr_free_pages \d+\n.* \d$', re.DOTALL)
-        zoneinfo_p = re.compile(r'^Node \d+, zone\s+\w+\n')
-
-        driver_rtc_p = re.compile(r'^rtc_time\t: .*\nrtc_date\t: .*\nalrm_time\t: .*\n')
-
-        net_arp_p = re.compile(r'^IP address\s+HW type\s+Flags\s+HW address\s+Mask\s+Device\n')
-        net_dev_p = re.compile(r'^Inter-\|\s+Receive\s+\|\s+Transmit\n')
-        net_dev_mcast_p = re.compile(r'^\d+\s+\w+\s+\d+\s+\d+\s+[0-9a-f]{12}')
-        net_if_inet6_p = re.compile(r'^[0-9a-f]{32} \d\d \d\d \d\d \d\d\s+\w+')
-        net_igmp_p = re.compile(r'^Idx\tDevice\s+:\s+Count\s+Querier\tGroup\s+Users\s+Timer\tReporter\n')
-        net_igmp6_p = re.compile(r'^\d+\s+\w+\s+[0-9a-f]{32}\s+\d+\s+[0-9A-F]{8}\s+\d+')
-        net_ipv6_route_p = re.compile(r'^[0-9a-f]{32} \d\d [0-9a-f]{32} \d\d [0-9a-f]{32} (?:[0-9a-f]{8} ){4}\s+\w+')
-        net_netlink_p = re.compile(r'^sk\s+Eth Pid\s+Groups\s+Rmem\s+Wmem')
-        net_netstat_p = re.compile(r'^TcpExt: SyncookiesSent SyncookiesRecv SyncookiesFailed')
-        net_packet_p = re.compile(r'^sk       RefCnt Type Proto  Iface R Rmem   User   Inode\n')
-        net_protocols_p = re.compile(r'^protocol  size sockets  memory press maxhdr  slab module     cl co di ac io in de sh ss gs se re sp bi br ha uh gp em\n')
-        net_route_p = re.compile(r'^Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\s+\n')
-        net_tcp_p = re.compile(r'^\s+sl\s+local_address\s+(?:rem_address|remote_address)\s+st\s+tx_queue\s+rx_queue\s+tr\s+tm->when\s+retrnsmt\s+uid\s+timeout\s+inode')
-        net_unix_p = re.compile(r'^Num       RefCount Protocol Flags    Type St Inode Path\n')
-
-        pid_fdinfo_p = re.compile(r'^pos:\t\d+\nflags:\t\d+\nmnt_id:\t\d+\n')
-        pid_io_p = re.compile(r'^rchar: \d+\nwchar: \d+\nsyscr: \d+\n')
-        pid_maps_p = re.compile(r'^[0-9a-f]{12}-[0-9a-f]{12} [rwxsp\-]{4} [0-9a-f]{8} [0-9a-f]{2}:[0-9a-f]{2} \d+ ')
-        pid_mountinfo_p = re.compile(r'^\d+ \d+ \d+:\d+ /.+\n')
-        pid_numa_maps_p = re.compile(r'^[a-f0-9]{12} default [^\n]+\n')
-        pid_smaps_p = re.compile(r'^[0-9a-f]{12}-[0-9a-f]{12} [rwxsp\-]{4} [0-9a-f]{8} [0-9a-f]{2}:[0-9a-f]{2} \d+ [^\n]+\nSize:\s+\d+ \S\S\n')
-        pid_stat_p = re.compile(r'^\d+ \(.+\) \S \d+ \d+ \d+ \d+ -?\d+ (?:\d+ ){43}\d+$', re.DOTALL)
-        pid_statm_p = re.compile(r'^\d+ \d+ \d+\s\d+\s\d+\s\d+\s\d+$')
-        pid_status_p = re.compile(r'^Name:\t.+\n(?:Umask:\t\d+\n)?State:\t.+\nTgid:\t\d+\n')
-
-        # scsi_device_info = re.compile(r"^'\w+' '.+' 0x\d+")
-        # scsi_scsi_p = re.compile(r'^Attached devices:\nHost: \w+ ')
-
-        procmap = {
-            buddyinfo_p: 'proc_buddyinfo',
-            cmdline_p: 'proc_cmdline',
-            consoles_p: 'proc_consoles',
-            cpuinfo_p: 'proc_cpuinfo',
-            crypto_p: 'proc_crypto',
-            devices_p: 'proc_devices',
-            diskstats_p: 'proc_diskstats',
-            filesystems_p: 'proc_filesystems',
-            interrupts_p: 'proc_interrupts',
-            iomem_p: 'proc_iomem',
-            ioports_p: 'proc_ioports',
-            loadavg_p: 'proc_loadavg',
-            locks_p: 'proc_locks',
-            meminfo_p: 'proc_meminfo',
-            modules_p: 'proc_modules',
-            mtrr_p: 'proc_mtrr',
-            pagetypeinfo_p: 'proc_pagetypeinfo',
-            partitions_p: 'proc_partitions',
-            slabinfo_p: 'proc_slabinfo',
-            softirqs_p: 'proc_softirqs',
-            stat_p: 'proc_stat',
-            swaps_p: 'proc_swaps',
-            uptime_p: 'proc_uptime',
-            version_p: 'proc_version',
-            vmallocinfo_p: 'proc_vmallocinfo',
-            zoneinfo_p: 'proc_zoneinfo',  # before vmstat
-            vmstat_p: 'proc_vmstat',      # after zoneinfo
-
-            driver_rtc_p: 'proc_driver_rtc',
-
-            net_arp_p: 'proc_net_arp',
-            net_dev_p: 'proc_net_dev',
-            net_if_inet6_p: 'proc_net_if_inet6',
-            net_igmp_p: 'proc_net_igmp',
-            net_igmp6_p: 'proc_net_igmp6',
-            net_netlink_p: 'proc_net_netlink',
-            net_netstat_p: 'proc_net_netstat',
-            net_packet_p: 'proc_net_packet',
-            net_protocols_p: 'proc_net_protocols',
-            net_route_p: 'proc_net_route',
-            net_tcp_p: 'proc_net_tcp',
-            net_unix_p: 'proc_net_unix',
-            net_ipv6_route_p: 'proc_net_ipv6_route',  # before net_dev_mcast
-            net_dev_mcast_p: 'proc_net_dev_mcast',    # after net_ipv6_route
-
-            pid_fdinfo_p: 'proc_pid_fdinfo',
-            pid_io_p: 'proc_pid_io',
-            pid_mountinfo_p: 'proc_pid_mountinfo',
-            pid_numa_maps_p: 'proc_pid_numa_maps',
-            pid_stat_p: 'proc_pid_stat',
-            pid_statm_p: 'proc_pid_statm',
-            pid_status_p: 'proc_pid_status',
-            pid_smaps_p: 'proc_pid_smaps',  # before pid_maps
-            pid_maps_p: 'proc_pid_maps',    # after pid_smaps
-
-            # scsi_device_info: 'proc_scsi_device_info',
-            # scsi_scsi_p: 'proc_scsi_scsi'
-        }
-
-        for reg_pattern, parse_mod in procmap.items():
-            if reg_pattern.search(data):
-                try:
-                    procparser = get_parser(parse_mod)
-                    return procparser.parse(data, quiet=quiet, raw=raw)
-                except ModuleNotFoundError:
-                    raise ParseError('Proc file type not yet implemented.')
+        parse_mod = (filename and parser_from_filename(filename)) or _parser_from_data(data)
+
+        if parse_mod:
+            try:
+                procparser = get_parser(parse_mod)
+                return procparser.parse(data, quiet=quiet, raw=raw)
+            except ModuleNotFoundError:
+                raise ParseError('Proc file type not yet implemented.')
 
     raise ParseError('Proc file could not be identified.')
@@ -171,7 +171,7 @@ import jc.utils
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.1'
+    version = '1.2'
     description = '`/proc/net/tcp` and `/proc/net/tcp6` file parser'
     author = 'Alvin Solomon'
     author_email = 'alvinms01@gmail.com'
@@ -239,9 +239,7 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
                 entry['opposite_endian_local_address'] = opp_endian_local_addr
                 entry['opposite_endian_remote_address'] = opp_endian_remote_addr
 
-        for item in int_list:
-            if item in entry:
-                entry[item] = jc.utils.convert_to_int(entry[item])
+    jc.utils.convert_fields(proc_data, int_keys=int_list)
 
     return proc_data
 
@@ -207,13 +207,15 @@ import jc.parsers.universal
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.7'
+    version = '1.10'
     description = '`ps` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
     compatible = ['linux', 'darwin', 'cygwin', 'aix', 'freebsd']
     magic_commands = ['ps']
     tags = ['command']
+    chunkable = True
+    incremental = True
 
 
 __version__ = info.version
@@ -243,14 +245,6 @@ def _process(proc_data):
         if '%mem' in entry:
             entry['mem_percent'] = entry.pop('%mem')
 
-        # convert ints and floats
-        for key in entry:
-            if key in int_list:
-                entry[key] = jc.utils.convert_to_int(entry[key])
-
-            if key in float_list:
-                entry[key] = jc.utils.convert_to_float(entry[key])
-
         # clean up other fields
         if 'tty' in entry:
             if entry['tty'] == '?' or entry['tty'] == '??':
@@ -260,10 +254,13 @@ def _process(proc_data):
             if entry['tt'] == '??':
                 entry['tt'] = None
 
+    # convert ints and floats
+    jc.utils.convert_fields(proc_data, int_list, float_list)
+
     return proc_data
 
 
-def parse(data, raw=False, quiet=False):
+def parse(data, raw=False, quiet=False, sink=None):
     """
     Main text parsing function
 
@@ -272,10 +269,14 @@ def parse(data, raw=False, quiet=False):
         data:        (string)  text data to parse
         raw:         (boolean) unprocessed output if True
         quiet:       (boolean) suppress warning messages if True
+        sink:        (callable) optional function that is called with each
+                                record as soon as it is processed instead
+                                of returning the list of records
 
     Returns:
 
-        List of Dictionaries. Raw or processed structured data.
+        List of Dictionaries. Raw or processed structured data. None if
+        sink is used.
     """
     jc.utils.compatibility(__name__, info.compatible, quiet)
     jc.utils.input_type_check(data)
@@ -286,8 +287,17 @@ def parse(data, raw=False, quiet=False):
     if jc.utils.has_data(data):
 
         cleandata[0] = cleandata[0].lower()
+        if sink is not None:
+            for entry in jc.parsers.universal.simple_table_parse_iter(cleandata):
+                sink(entry if raw else _process([entry])[0])
+
+            return None
+
         raw_output = jc.parsers.universal.simple_table_parse(cleandata)
 
+    if sink is not None:
+        return None
+
     if raw:
         return raw_output
     else:
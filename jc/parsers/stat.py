@@ -171,7 +171,7 @@ import jc.utils
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.13'
+    version = '1.14'
     description = '`stat` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -195,6 +195,8 @@ def _process(proc_data):
 
         List of Dictionaries. Structured data to conform to the schema.
     """
+    time_fields = []
+
     for entry in proc_data:
         int_list = {'size', 'blocks', 'io_blocks', 'inode', 'links', 'uid', 'gid',
                     'unix_device', 'rdev', 'block_size'}
@@ -209,9 +211,14 @@ def _process(proc_data):
             if key in null_list:
                 if entry[key] == '-':
                     entry[key] = None
-                ts = jc.utils.timestamp(entry[key], format_hint=(7100, 7200))
-                entry[key + '_epoch'] = ts.naive
-                entry[key + '_epoch_utc'] = ts.utc
+                entry[key + '_epoch'] = None
+                entry[key + '_epoch_utc'] = None
+                time_fields.append((entry, key))
+
+    ts_list = jc.utils.timestamps([entry[key] for entry, key in time_fields], format_hint=(7100, 7200))
+    for (entry, key), ts in zip(time_fields, ts_list):
+        entry[key + '_epoch'] = ts.naive
+        entry[key + '_epoch_utc'] = ts.utc
 
     return proc_data
 
@@ -1,5 +1,19 @@
 r"""jc - JSON Convert universal parsers"""
-from typing import Iterable, List, Dict
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+HEADER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _header_names(header_text: str) -> Tuple[str, ...]:
+    """
+    Split a header row into interned header names. Results are cached so
+    streaming parsers that parse one row at a time reuse the same keys.
+    """
+    return tuple(sys.intern(h) for h in header_text.split())
 
 
 def simple_table_parse(data: Iterable[str]) -> List[Dict]:
@@ -40,13 +54,44 @@ def simple_table_parse(data: Iterable[str]) -> List[Dict]:
     # cast iterable to a list. Also keeps from mutating the caller's list
     data = list(data)
 
-    headers = [h for h in ' '.join(data[0].strip().split()).split() if h]
+    headers = _header_names(data[0])
     raw_data = map(lambda s: s.strip().split(None, len(headers) - 1), data[1:])
     raw_output = [dict(zip(headers, r)) for r in raw_data]
 
     return raw_output
 
 
+def simple_table_parse_iter(data: Iterable[str]) -> Iterator[Dict]:
+    """
+    Lazily parse simple tables. Same as `simple_table_parse()`, but rows
+    are read from the iterable one at a time and each row dictionary is
+    yielded as soon as it is parsed. Any iterable of lines can be used,
+    including a file object or `sys.stdin`.
+
+    Parameters:
+
+        data:   (iter)   Text data to parse as an iterable of lines. Item 0
+                         must be the header row. See `simple_table_parse()`
+                         for header requirements. Line endings are ignored.
+
+                         Also, ensure there are no blank rows in the data.
+
+    Returns:
+
+        Iterator of Dictionaries
+    """
+    data_iter = iter(data)
+    header_text = next(data_iter, None)
+    if header_text is None:
+        return
+
+    headers = _header_names(header_text)
+    maxsplit = len(headers) - 1
+
+    for line in data_iter:
+        yield dict(zip(headers, line.strip().split(None, maxsplit)))
+
+
 def sparse_table_parse(data: Iterable[str], delim: str = '\u2063') -> List[Dict]:
     """
     Parse tables with missing column data or with spaces in column data.
@@ -91,67 +136,154 @@ def sparse_table_parse(data: Iterable[str], delim: str = '\u2063') -> List[Dict]
     # cast iterable to a list. Also keeps from mutating the caller's list
     data = list(data)
 
-    # find the longest line and pad all lines with spaces to match
+    # find the longest line. Shorter lines are treated as if they were
+    # padded with spaces to this length
     max_len = max([len(x) for x in data])
 
-    new_data = []
-    for line in data:
-        new_data.append(line + ' ' * (max_len - len(line)))
+    return list(_sparse_table_rows(data[0], islice(data, 1, None), delim, max_len))
 
-    data = new_data
 
-    # find header
-    output: List = []
-    header_text: str = data.pop(0)
-    header_text = header_text + ' '
-    header_list: List = header_text.split()
+def sparse_table_parse_iter(data: Iterable[str], delim: str = '\u2063') -> Iterator[Dict]:
+    """
+    Lazily parse tables with missing column data or with spaces in column
+    data. Same as `sparse_table_parse()`, but rows are read from the
+    iterable one at a time and each row dictionary is yielded as soon as it
+    is parsed. Any iterable of lines can be used, including a file object
+    or `sys.stdin`.
+
+    Column positions are taken from the header row. Since the rest of the
+    input is not read in advance, rows are not padded to the longest line:
+    a row that is longer than the header row simply extends the last
+    column, and a row that is shorter has empty cells at the end.
+
+    Parameters:
+
+        data:   (iter)   An iterable of string lines. Item 0 must be the
+                         header row. See `sparse_table_parse()` for header
+                         requirements. Line endings are ignored.
 
-    # find each column index and end position
-    header_search = [header_list[0]]
-    for h in header_list[1:]:
-        header_search.append(' ' + h + ' ')
+                         Also, ensure there are no blank line items.
+
+        delim:  (string) Delimiter to use. See `sparse_table_parse()`.
+
+    Returns:
+
+        Iterator of Dictionaries
+    """
+    data_iter = (line.rstrip('\r\n') for line in data)
+    header_text = next(data_iter, None)
+    if header_text is None:
+        return
+
+    yield from _sparse_table_rows(header_text, data_iter, delim)
+
+
+def _sparse_table_rows(
+    header_text: str,
+    data: Iterable[str],
+    delim: str,
+    max_len: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Yield the row dictionaries of a sparse table. Rows are treated as if
+    they were padded with spaces to max_len. If max_len is not known, rows
+    are padded to the length of the header row.
+    """
+    if max_len is None:
+        max_len = len(header_text)
+
+    # find header
+    header_text = header_text + ' ' * (max_len - len(header_text)) + ' '
+    header_list: List = list(_header_names(header_text))
 
-    header_spec_list = []
-    for i, column in enumerate(header_list[0:len(header_list) - 1]):
-        header_spec = {
-            'name': column,
-            'end': header_text.find(header_search[i + 1])
-        }
+    # find the end position of each column (except the last one)
+    header_ends = _header_ends(header_text, header_list)
 
-        header_spec_list.append(header_spec)
+    # the column boundaries can be computed from the original row in one
+    # pass unless duplicate header names or header names that are not space
+    # separated are found
+    fast_columns = len(set(header_list)) == len(header_list) \
+        and all(0 <= a < b for a, b in zip([0] + header_ends, header_ends))
+    reversed_ends = header_ends[::-1]
 
     # parse lines
-    if data:
-        for entry in data:
-            output_line = {}
-
-            # insert new separator since data can contain spaces
-            for col in reversed(header_list):
-                # find the right header_spec
-                for h_spec in header_spec_list:
-                    if h_spec['name'] == col:
-                        h_end = h_spec['end']
-                        # check if the location contains whitespace. if not
-                        # then move to the left until a space is found
-                        while h_end > 0 and not entry[h_end].isspace():
-                            h_end -= 1
-
-                        # insert custom delimiter
-                        entry = entry[:h_end] + delim + entry[h_end + 1:]
-
-            # create the entry list from the new custom delimiter
-            entry_list = entry.split(delim, maxsplit=len(header_list) - 1)
-
-            # clean up leading and trailing spaces in entry
-            clean_entry_list = []
-            for col in entry_list:
-                clean_entry = col.strip()
-                if clean_entry == '':
-                    clean_entry = None
-
-                clean_entry_list.append(clean_entry)
-
-            output_line = dict(zip(header_list, clean_entry_list))
-            output.append(output_line)
-
-    return output
+    for entry in data:
+        if fast_columns and delim not in entry:
+            entry_list = _split_columns(entry, reversed_ends)
+        else:
+            entry_list = _delimit_columns(entry + ' ' * (max_len - len(entry)), header_list, header_ends, delim)
+
+        # clean up leading and trailing spaces in entry
+        clean_entry_list = [col.strip() or None for col in entry_list]
+
+        yield dict(zip(header_list, clean_entry_list))
+
+
+def _header_ends(header_text: str, header_list: List[str]) -> List[int]:
+    """
+    Return the end position of each column except the last one. A column
+    ends at the space before the next header name.
+    """
+    return [header_text.find(' ' + h + ' ') for h in header_list[1:]]
+
+
+def _split_columns(entry: str, reversed_ends: List[int]) -> List[str]:
+    """
+    Split a row at the column boundaries, given the column end positions
+    from right to left. If a value extends past the end of its column, the
+    boundary moves left to the nearest whitespace. Positions past the end
+    of the row are treated as spaces.
+    """
+    entry_len = len(entry)
+    entry_list: List[str] = []
+    field_end = entry_len
+    boundary = entry_len + reversed_ends[0] + 1 if reversed_ends else 0
+
+    for h_end in reversed_ends:
+        # a value to the right already overflowed past this column end
+        if h_end >= boundary:
+            if boundary == 0:
+                continue
+            h_end = boundary - 1
+
+        while 0 < h_end < entry_len and not entry[h_end].isspace():
+            h_end -= 1
+
+        entry_list.append(entry[h_end + 1:field_end])
+        field_end = boundary = h_end
+
+    entry_list.append(entry[:field_end])
+    entry_list.reverse()
+    return entry_list
+
+
+def _delimit_columns(
+    entry: str,
+    header_list: List[str],
+    header_ends: List[int],
+    delim: str
+) -> List[str]:
+    """
+    Split a padded row by inserting a delimiter at each column boundary.
+    Used for headers and rows that _split_columns() cannot handle.
+    """
+    header_spec_list = [
+        {'name': name, 'end': end} for name, end in zip(header_list, header_ends)
+    ]
+
+    # insert new separator since data can contain spaces
+    for col in reversed(header_list):
+        # find the right header_spec
+        for h_spec in header_spec_list:
+            if h_spec['name'] == col:
+                h_end = h_spec['end']
+                # check if the location contains whitespace. if not
+                # then move to the left until a space is found
+                while h_end > 0 and not entry[h_end].isspace():
+                    h_end -= 1
+
+                # insert custom delimiter
+                entry = entry[:h_end] + delim + entry[h_end + 1:]
+
+    # create the entry list from the new custom delimiter
+    return entry.split(delim, maxsplit=len(header_list) - 1)
@@ -0,0 +1,266 @@
+"""jc - JSON Convert server module
+
+Runs `jc` as a persistent server on a Unix domain socket so the python
+interpreter and any parser modules that have already been imported stay
+warm between requests. This removes interpreter startup and module import
+time from each parse, which can be much larger than the parse itself for
+small inputs.
+
+Start a server with the `--serve` cli option:
+
+    $ jc --serve /tmp/jc.sock
+
+And send input to it with the `--client` cli option:
+
+    $ dig example.com | jc --client /tmp/jc.sock --dig
+
+## Protocol
+
+Each connection carries one request. The client sends a single line
+containing a JSON request object:
+
+    {"parser": "dig", "options": {"raw": false, "quiet": false}}
+
+Supported options are `raw`, `quiet`, and `ignore_exceptions` (streaming
+parsers only) and have the same meaning as in `jc.parse()`.
+
+The input data can be included in the request object as a `data` string.
+Otherwise, the raw input data follows the request line and the client
+should shut down the write side of the socket when all data is sent. This
+allows streaming parsers to start yielding results before the input ends.
+
+The server replies with JSON Lines. Standard parsers reply with one line and
+streaming parsers reply with one line per record:
+
+    {"result": <parsed output>}
+
+If the request fails, an error line is sent and the connection is closed:
+
+    {"error": "<message>", "error_type": "ParseError"}
+
+Requests are handled concurrently in separate threads.
+"""
+import os
+import io
+import json
+import stat
+import socket
+import socketserver
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+from .jc_types import JSONDictType
+from .lib import get_parser, parse, _parser_is_streaming
+from .exceptions import ParseError
+
+
+class _JcRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single jc server request"""
+
+    def send_line(self, obj: Dict[str, Any]) -> None:
+        line = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str) + '\n'
+        self.wfile.write(line.encode('utf-8'))
+        self.wfile.flush()
+
+    def input_data(self, request: Dict[str, Any], streaming: bool) -> Union[str, bytes, Iterable[str]]:
+        """Return the request input data in the form the parser expects"""
+        if 'data' in request:
+            if streaming:
+                return io.StringIO(request['data'])
+            return request['data']
+
+        if streaming:
+            return (line.decode('utf-8', errors='replace') for line in self.rfile)
+
+        data: Union[str, bytes] = self.rfile.read()
+
+        # convert to UTF-8, if possible. Otherwise, leave as bytes
+        try:
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+
+        return data
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            options = request.get('options') or {}
+            jc_parser = get_parser(request['parser'])
+            streaming = _parser_is_streaming(jc_parser)
+
+            kwargs = {
+                'raw': bool(options.get('raw', False)),
+                'quiet': bool(options.get('quiet', False))
+            }
+
+            if streaming:
+                kwargs['ignore_exceptions'] = bool(options.get('ignore_exceptions', False))
+
+            result = parse(jc_parser, self.input_data(request, streaming), **kwargs)
+
+            if streaming:
+                for record in result:  # type: ignore
+                    self.send_line({'result': record})
+            else:
+                self.send_line({'result': result})
+
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+        except Exception as e:
+            try:
+                self.send_line({'error': str(e), 'error_type': e.__class__.__name__})
+            except OSError:
+                pass
+
+
+class _JcServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _socket_in_use(socket_path: str) -> bool:
+    """Return True if a server is already listening on the socket path"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def _create_server(socket_path: str) -> _JcServer:
+    """
+    Return a jc server bound to the socket path. A stale socket file left by
+    a previous server is replaced.
+    """
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise OSError(f'"{socket_path}" exists and is not a socket')
+
+        if _socket_in_use(socket_path):
+            raise OSError(f'"{socket_path}" is already in use by another server')
+
+        os.unlink(socket_path)
+
+    return _JcServer(socket_path, _JcRequestHandler)
+
+
+def serve(socket_path: str) -> None:
+    """
+    Run the jc server on a Unix domain socket until interrupted.
+
+    A stale socket file left by a previous server is replaced. An `OSError`
+    is raised if the path exists and is not a socket or if another server is
+    already listening on it.
+
+    Parameters:
+
+        socket_path:    (string)  path of the Unix domain socket to create
+
+    Returns:
+
+        None
+    """
+    with _create_server(socket_path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            try:
+                os.unlink(socket_path)
+            except OSError:
+                pass
+
+
+def _send_input(sock: socket.socket, data: Union[str, bytes, Iterable[str], Iterable[bytes]]) -> None:
+    """
+    Send the input data to the server and shut down the write side. Bytes
+    that STDIN decoded as surrogates are sent as the original bytes.
+    """
+    try:
+        if isinstance(data, str):
+            sock.sendall(data.encode('utf-8', errors='surrogateescape'))
+
+        elif isinstance(data, bytes):
+            sock.sendall(data)
+
+        else:
+            for line in data:
+                if isinstance(line, str):
+                    line = line.encode('utf-8', errors='surrogateescape')  # type: ignore
+                sock.sendall(line)  # type: ignore
+
+    except (OSError, UnicodeEncodeError):
+        pass
+
+    # always end the input so the server sends its response
+    try:
+        sock.shutdown(socket.SHUT_WR)
+    except OSError:
+        pass
+
+
+def request(
+    socket_path: str,
+    parser_mod_name: str,
+    data: Union[str, bytes, Iterable[str], Iterable[bytes]],
+    raw: bool = False,
+    quiet: bool = False,
+    ignore_exceptions: Optional[bool] = None
+) -> Iterator[JSONDictType]:
+    """
+    Send data to a jc server and yield the parsed results. Standard parsers
+    yield a single result and streaming parsers yield one result per record.
+
+    Iterable input (e.g. a file object) is sent in a separate thread as it is
+    read, so results from streaming parsers are yielded as soon as the
+    server returns them.
+
+    Parameters:
+
+        socket_path:        (string)     path of the jc server socket
+
+        parser_mod_name:    (string)     name of the parser module
+
+        data:               (string or   data to parse
+                            bytes or
+                            iterable)
+
+        raw:                (boolean)    output preprocessed JSON if True
+
+        quiet:              (boolean)    suppress warning messages if True
+
+        ignore_exceptions:  (boolean)    ignore parsing exceptions if True
+                                         (streaming parsers only)
+
+    Returns:
+
+        Generator Object containing the parsed results
+
+    Raises:
+
+        ParseError:  if the server returns an error
+    """
+    options: Dict[str, Any] = {'raw': raw, 'quiet': quiet}
+    if ignore_exceptions is not None:
+        options['ignore_exceptions'] = ignore_exceptions
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        request_line = json.dumps({'parser': parser_mod_name, 'options': options}) + '\n'
+        sock.sendall(request_line.encode('utf-8'))
+
+        sender = threading.Thread(target=_send_input, args=(sock, data), daemon=True)
+        sender.start()
+
+        with sock.makefile('rb') as response:
+            for line in response:
+                reply = json.loads(line)
+
+                if 'error' in reply:
+                    if reply.get('error_type') == 'ParseError':
+                        raise ParseError(reply['error'])
+
+                    raise ParseError(f"{reply.get('error_type')}: {reply['error']}")
+
+                yield reply['result']
@@ -1,15 +1,20 @@
 """jc - JSON Convert utils"""
+import io
+import os
 import sys
 import re
+import mmap
+import stat
 import locale
+import calendar
 import shutil
+from collections import deque
 from itertools import islice
-from collections import namedtuple
 from numbers import Number
 from datetime import datetime, timezone
 from textwrap import TextWrapper
 from functools import lru_cache
-from typing import Any, List, Dict, Iterable, Union, Optional, TextIO
+from typing import Any, List, Dict, Deque, FrozenSet, Iterable, Iterator, Pattern, Tuple, TypeVar, Union, Optional, TextIO
 from .jc_types import TimeStampFormatType
 
 CLI_QUIET = False
@@ -209,6 +214,11 @@ def remove_quotes(data: str) -> str:
     return data
 
 
+_KEY_SPECIAL_CHARS = r'''!"#$%&'()*+,-./:;<=>?@[\]^`{|}~ '''
+_KEY_TRANSLATION = str.maketrans(_KEY_SPECIAL_CHARS, '_' * len(_KEY_SPECIAL_CHARS))
+KEY_CACHE_SIZE = 4096
+
+
 def normalize_key(data: str) -> str:
     r"""
     Normalize a key name by shifting to lower-case and converting special
@@ -221,6 +231,10 @@ def normalize_key(data: str) -> str:
     This is a lossy algorithm. Repeating and trailing underscores are
     removed.
 
+    Results are cached and interned, so normalizing the same header names
+    for every table or record is cheap and the keys share one string
+    object.
+
     Parameters:
 
         data:       (string) Input value
@@ -229,12 +243,14 @@ def normalize_key(data: str) -> str:
 
         string
     """
-    special = r'''!"#$%&'()*+,-./:;<=>?@[\]^`{|}~ '''
-    initial_underscore = False
-    data = data.strip().lower()
+    return _normalize_key(data)
 
-    for special_char in special:
-        data = data.replace(special_char, '_')
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _normalize_key(data: str) -> str:
+    """normalize_key() implementation. Results are cached and interned."""
+    initial_underscore = False
+    data = data.strip().lower().translate(_KEY_TRANSLATION)
 
     if data.startswith('_'):
         initial_underscore = True
@@ -246,7 +262,24 @@ def normalize_key(data: str) -> str:
     if initial_underscore:
         data = '_' + data
 
-    return data
+    return sys.intern(data)
+
+
+class _NumericCharTable(dict):
+    """
+    str.translate() table that deletes every character except ASCII
+    digits, `-`, and `.`. Entries are added as characters are seen.
+    """
+    def __missing__(self, key: int) -> Optional[int]:
+        value = key if chr(key) in '0123456789-.' else None
+        self[key] = value
+        return value
+
+
+_NUMERIC_CHARS = _NumericCharTable()
+
+# plain ASCII digit strings are converted without stripping (python 3.7+)
+_FAST_INT = hasattr(str, 'isascii')
 
 
 def convert_to_int(value: object) -> Optional[int]:
@@ -263,7 +296,10 @@ def convert_to_int(value: object) -> Optional[int]:
         integer/None   Integer if successful conversion, otherwise None
     """
     if isinstance(value, str):
-        str_val = re.sub(r'[^0-9\-\.]', '', value)
+        if _FAST_INT and value.isdigit() and value.isascii():
+            return int(value)
+
+        str_val = value.translate(_NUMERIC_CHARS)
         try:
             return int(str_val)
         except (ValueError, TypeError):
@@ -294,7 +330,7 @@ def convert_to_float(value: object) -> Optional[float]:
     """
     if isinstance(value, str):
         try:
-            return float(re.sub(r'[^0-9\-\.]', '', value))
+            return float(value.translate(_NUMERIC_CHARS))
         except (ValueError, TypeError):
             return None
 
@@ -305,6 +341,42 @@ def convert_to_float(value: object) -> Optional[float]:
         return None
 
 
+def convert_fields(
+    rows: List[Dict[str, Any]],
+    int_keys: Iterable[str] = (),
+    float_keys: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Convert the values of the selected keys of every row (dictionary) in
+    place with `convert_to_int` and `convert_to_float`. Rows without a key
+    are left as-is. If a key is in both `int_keys` and `float_keys` it is
+    converted to an integer.
+
+    Parameters:
+
+        rows:          (list) dictionaries to convert
+
+        int_keys:      (iterable) keys to convert to integers
+
+        float_keys:    (iterable) keys to convert to floats
+
+    Returns:
+
+        the input rows
+    """
+    int_set = frozenset(int_keys)
+    float_set = frozenset(float_keys)
+
+    for row in rows:
+        for key in row:
+            if key in int_set:
+                row[key] = convert_to_int(row[key])
+            elif key in float_set:
+                row[key] = convert_to_float(row[key])
+
+    return rows
+
+
 def convert_to_bool(value: object) -> bool:
     """
     Converts string, integer, or float input to boolean by checking
@@ -365,6 +437,30 @@ def convert_to_bool(value: object) -> bool:
 # LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# size unit prefixes and binary unit names by power
+_SIZE_UNITS: Tuple[Tuple[str, str], ...] = (
+    ('k', 'kibibyte'), ('m', 'mebibyte'), ('g', 'gibibyte'), ('t', 'tebibyte'),
+    ('p', 'pebibyte'), ('e', 'exbibyte'), ('z', 'zebibyte'), ('y', 'yobibyte')
+)
+
+# binary size units that are never ambiguous (kib, kibibyte, etc.)
+_BINARY_SIZE_UNITS: Dict[str, int] = {
+    name: 1024**power
+    for power, (prefix, binary_name) in enumerate(_SIZE_UNITS, start=1)
+    for name in (prefix + 'ib', binary_name)
+}
+
+# decimal and binary dividers by the first letter of a size unit
+_SIZE_UNIT_PREFIXES: Dict[str, Tuple[int, int]] = {
+    prefix: (1000**power, 1024**power)
+    for power, (prefix, _) in enumerate(_SIZE_UNITS, start=1)
+}
+
+_SIZE_TOKEN_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_SIZE_FLOAT_RE = re.compile(r'\d+\.\d+')
+SIZE_CACHE_SIZE = 4096
+
+
 def convert_size_to_int(
     size: str,
     binary: bool = False,
@@ -415,41 +511,35 @@ def convert_size_to_int(
         >>> convert_size_to_int('1.5 GB', binary=True)
         1610612736
     """
-    # normalize input by removing commas
-    size = size.replace(',', '')
-
-    def tokenize(text: str) -> List[str]:
-        tokenized_input: List = []
-        for token in re.split(r'(\d+(?:\.\d+)?)', text):
-            token = token.strip()
-            if re.match(r'\d+\.\d+', token):
-                tokenized_input.append(float(token))
-            elif token.isdigit():
-                tokenized_input.append(int(token))
-            elif token:
-                tokenized_input.append(token)
-        return tokenized_input
-
-    SizeUnit = namedtuple('SizeUnit', 'divider, symbol, name')
-    CombinedUnit = namedtuple('CombinedUnit', 'decimal, binary')
-    disk_size_units = (
-        CombinedUnit(SizeUnit(1000**1, 'KB', 'kilobyte'), SizeUnit(1024**1, 'KiB', 'kibibyte')),
-        CombinedUnit(SizeUnit(1000**2, 'MB', 'megabyte'), SizeUnit(1024**2, 'MiB', 'mebibyte')),
-        CombinedUnit(SizeUnit(1000**3, 'GB', 'gigabyte'), SizeUnit(1024**3, 'GiB', 'gibibyte')),
-        CombinedUnit(SizeUnit(1000**4, 'TB', 'terabyte'), SizeUnit(1024**4, 'TiB', 'tebibyte')),
-        CombinedUnit(SizeUnit(1000**5, 'PB', 'petabyte'), SizeUnit(1024**5, 'PiB', 'pebibyte')),
-        CombinedUnit(SizeUnit(1000**6, 'EB', 'exabyte'), SizeUnit(1024**6, 'EiB', 'exbibyte')),
-        CombinedUnit(SizeUnit(1000**7, 'ZB', 'zettabyte'), SizeUnit(1024**7, 'ZiB', 'zebibyte')),
-        CombinedUnit(SizeUnit(1000**8, 'YB', 'yottabyte'), SizeUnit(1024**8, 'YiB', 'yobibyte')),
-    )
-    tokens = tokenize(size)
+    return _convert_size_to_int(size.replace(',', ''), binary, posix_mode, decimal_bias)
+
+
+@lru_cache(maxsize=SIZE_CACHE_SIZE)
+def _convert_size_to_int(
+    size: str,
+    binary: bool,
+    posix_mode: bool,
+    decimal_bias: bool
+) -> Optional[int]:
+    """convert_size_to_int() without comma removal. Results are cached."""
+    tokens: List[Union[int, float, str]] = []
+    for token in _SIZE_TOKEN_RE.split(size):
+        token = token.strip()
+        if _SIZE_FLOAT_RE.match(token):
+            tokens.append(float(token))
+        elif token.isdigit():
+            tokens.append(int(token))
+        elif token:
+            tokens.append(token)
+
     if tokens and isinstance(tokens[0], Number):
+        number: Union[int, float] = tokens[0]  # type: ignore
         # Get the normalized unit (if any) from the tokenized input.
         normalized_unit = tokens[1].lower() if len(tokens) == 2 and isinstance(tokens[1], str) else ''
         # If the input contains only a number, it's assumed to be the number of
         # bytes. The second token can also explicitly reference the unit bytes.
         if len(tokens) == 1 or normalized_unit.startswith('b'):
-            return int(tokens[0])
+            return int(number)
         # Otherwise we expect two tokens: A number and a unit.
         if normalized_unit:
             # Convert plural units to singular units, for details:
@@ -470,34 +560,76 @@ def convert_size_to_int(
                 else:
                     normalized_unit = normalized_unit + 'b'
 
-            for unit in disk_size_units:
-                # First we check for unambiguous symbols (KiB, MiB, GiB, etc)
-                # and names (kibibyte, mebibyte, gibibyte, etc) because their
-                # handling is always the same.
-                if normalized_unit in (unit.binary.symbol.lower(), unit.binary.name.lower()):
-                    return int(tokens[0] * unit.binary.divider)
-
-                # Now we will deal with ambiguous prefixes (K, M, G, etc),
-                # symbols (KB, MB, GB, etc) and names (kilobyte, megabyte,
-                # gigabyte, etc) according to the caller's preference.
-                if (normalized_unit in (unit.decimal.symbol.lower(), unit.decimal.name.lower())
-                    or normalized_unit.startswith(unit.decimal.symbol[0].lower())):
-                    return int(tokens[0] * (unit.binary.divider if binary else unit.decimal.divider))
+            # First we check for unambiguous symbols (KiB, MiB, GiB, etc)
+            # and names (kibibyte, mebibyte, gibibyte, etc) because their
+            # handling is always the same.
+            if normalized_unit in _BINARY_SIZE_UNITS:
+                return int(number * _BINARY_SIZE_UNITS[normalized_unit])
+
+            # Now we will deal with ambiguous prefixes (K, M, G, etc),
+            # symbols (KB, MB, GB, etc) and names (kilobyte, megabyte,
+            # gigabyte, etc) according to the caller's preference.
+            if normalized_unit and normalized_unit[0] in _SIZE_UNIT_PREFIXES:
+                decimal_divider, binary_divider = _SIZE_UNIT_PREFIXES[normalized_unit[0]]
+                return int(number * (binary_divider if binary else decimal_divider))
     # We failed to parse the size specification.
     return None
 
 
+def convert_sizes_to_int(
+    sizes: Iterable[Optional[str]],
+    binary: bool = False,
+    posix_mode: bool = False,
+    decimal_bias: bool = False
+) -> List[Optional[int]]:
+    """
+    Convert a column of human readable data sizes to numbers of bytes.
+    None values are returned as None. See `convert_size_to_int` for the
+    parameters.
+
+    Parameters:
+
+        sizes:          (iterable) human readable file sizes to parse.
+        binary:         (boolean) see `convert_size_to_int`
+        posix_mode:     (boolean) see `convert_size_to_int`
+        decimal_bias:   (boolean) see `convert_size_to_int`
+
+    Returns:
+
+        List of integers or None values in the same order as the input
+    """
+    seen: Dict[str, Optional[int]] = {}
+    results: List[Optional[int]] = []
+
+    for size in sizes:
+        if size is None:
+            results.append(None)
+            continue
+
+        if size not in seen:
+            seen[size] = _convert_size_to_int(size.replace(',', ''), binary, posix_mode, decimal_bias)
+
+        results.append(seen[size])
+
+    return results
+
+
 def input_type_check(data: object) -> None:
     """Ensure input data is a string. Raises `TypeError` if not."""
     if not isinstance(data, str):
         raise TypeError("Input data must be a 'str' object.")
 
 
+_NEWLINES_RE = re.compile(r'\r\n|\r|\n')
+_NEWLINES_BYTES_RE = re.compile(rb'\r\n|\r|\n')
+_REVERSE_CHUNK_SIZE = 65536
+
+_LineType = TypeVar('_LineType')
+
+
 def _lazy_splitlines(text: str) -> Iterable[str]:
-    NEWLINES_PATTERN: str = r'(\r\n|\r|\n)'
-    NEWLINES_RE = re.compile(NEWLINES_PATTERN)
     start = 0
-    for m in NEWLINES_RE.finditer(text):
+    for m in _NEWLINES_RE.finditer(text):
         begin, end = m.span()
         if begin != start:
             yield text[start:begin]
@@ -509,66 +641,379 @@ def _lazy_splitlines(text: str) -> Iterable[str]:
         yield text[start:]
 
 
+def _lazy_splitlines_bytes(data: mmap.mmap) -> Iterable[bytes]:
+    start = 0
+    for m in _NEWLINES_BYTES_RE.finditer(data):  # type: ignore
+        begin, end = m.span()
+        yield data[start:begin]
+        start = end
+
+    if data[start:]:
+        yield data[start:]
+
+
+def _lazy_reverse_splitlines(
+    data: Union[str, mmap.mmap],
+    chunk_size: int = _REVERSE_CHUNK_SIZE
+) -> Iterator[Union[str, bytes]]:
+    """
+    Yield the same lines as _lazy_splitlines() or _lazy_splitlines_bytes()
+    from last to first. Only the chunks at the end of the data that hold
+    the requested lines are read.
+    """
+    if isinstance(data, str):
+        newlines_re, crlf = _NEWLINES_RE, '\r\n'
+    else:
+        newlines_re, crlf = _NEWLINES_BYTES_RE, b'\r\n'  # type: ignore
+    hi = len(data)
+    carry = data[0:0]  # start of a line that continues into the next chunk
+    at_end = True
+
+    while hi > 0:
+        lo = max(hi - chunk_size, 0)
+
+        # keep \r\n line endings in one chunk
+        if lo and data[lo - 1:lo + 1] == crlf:
+            lo -= 1
+
+        pieces = newlines_re.split(data[lo:hi])  # type: ignore
+        pieces[-1] += carry
+        carry = pieces.pop(0) if lo else data[0:0]
+
+        for piece in reversed(pieces):
+            # trailing text after the last newline is only a line if not blank
+            if at_end:
+                at_end = False
+                if not piece:
+                    continue
+
+            yield piece
+
+        hi = lo
+
+
+def _tail_lines(
+    reversed_lines: Iterable[_LineType],
+    slice_start: int,
+    slice_end: Optional[int]
+) -> List[_LineType]:
+    """
+    Return lines[slice_start:slice_end] for a negative start and a negative
+    or missing end, given the lines in reverse order.
+    """
+    tail = list(islice(reversed_lines, -slice_start))
+
+    if slice_end is not None:
+        tail = tail[-slice_end:]
+
+    tail.reverse()
+    return tail
+
+
+def _look_behind(lines: Iterable[_LineType], size: int) -> Iterator[_LineType]:
+    """Yield all but the last `size` lines, holding at most `size` lines"""
+    buffer: Deque[_LineType] = deque()
+
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) > size:
+            yield buffer.popleft()
+
+
+def _slice_lines(
+    lines: Iterable[_LineType],
+    slice_start: Optional[int],
+    slice_end: Optional[int]
+) -> Iterable[_LineType]:
+    """
+    Slice lines with a negative start and/or end in a single forward pass.
+    Memory use is proportional to the size of the slice, not the input.
+    """
+    start = slice_start or 0
+
+    # positive start, negative end: lazily hold back the last lines
+    if start >= 0:
+        return _look_behind(islice(lines, start, None), -slice_end)  # type: ignore
+
+    # negative start, negative or no end: ring buffer of the last lines
+    if slice_end is None or slice_end < 0:
+        tail = deque(lines, maxlen=-start)
+        for _ in range(min(-(slice_end or 0), len(tail))):
+            tail.pop()
+
+        return list(tail)
+
+    # negative start, positive end: only the first slice_end lines can be
+    # selected, but all lines must be counted to find the start
+    line_iter = iter(lines)
+    head: Deque[_LineType] = deque(maxlen=-start)
+    consumed = 0
+    for line in islice(line_iter, slice_end):
+        head.append(line)
+        consumed += 1
+
+    total = consumed + sum(1 for _ in line_iter)
+    first = max(total + start, 0)
+    return list(head)[max(first - (consumed - len(head)), 0):]
+
+
+def _tail_text_file(
+    data: TextIO,
+    slice_start: int,
+    slice_end: Optional[int]
+) -> Optional[List[str]]:
+    """
+    Return the sliced lines of a text file opened on a regular file by
+    scanning backwards for newlines from the end of the file. Returns None
+    if the file cannot be memory-mapped or is not read from the beginning.
+    """
+    try:
+        fileno = data.fileno()
+        if not stat.S_ISREG(os.fstat(fileno).st_mode) or data.tell() != 0 \
+                or '\n'.encode(data.encoding) != b'\n':
+            return None
+
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    except (AttributeError, OSError, ValueError, LookupError, io.UnsupportedOperation):
+        return None
+
+    try:
+        # find the start of the last -slice_start lines. Text files may also
+        # split lines on \r, so this offset holds at least as many lines
+        end = len(mapped) - 1 if mapped[-1:] == b'\n' else len(mapped)
+        offset = 0
+        for _ in range(-slice_start):
+            newline = mapped.rfind(b'\n', 0, end)
+            if newline == -1:
+                offset = 0
+                break
+
+            offset = newline + 1
+            end = newline
+
+    finally:
+        mapped.close()
+
+    data.seek(offset)
+    return _slice_lines(data, slice_start, slice_end)  # type: ignore
+
+
 def line_slice(
-        data: Union[str, Iterable[str], TextIO, bytes, None],
+        data: Union[str, Iterable[str], TextIO, bytes, mmap.mmap, None],
         slice_start: Optional[int] = None,
         slice_end: Optional[int] = None
-) -> Union[str, Iterable[str], TextIO, bytes, None]:
+) -> Union[str, Iterable[str], TextIO, bytes, mmap.mmap, None]:
     """
     Slice input data by lines - lazily, if possible.
 
-    Accepts a string (for normal parsers) or an iterable (for streaming
-    parsers). Uses normal start/stop slicing values, but will always slice
-    on lines instead of characters. Positive slices will use less memory as
-    the function will attempt to lazily iterate over the input. A negative
-    slice parameter will force the function to read in all of the data and
-    then slice, which will use more memory.
+    Accepts a string (for normal parsers), a memory-mapped file (for normal
+    parsers), or an iterable (for streaming parsers). Uses normal start/stop
+    slicing values, but will always slice on lines instead of characters.
+    Positive slices will lazily iterate over the input. Negative slices hold
+    at most the number of lines in the slice in memory: a ring buffer keeps
+    the last lines for a negative start and a look-behind buffer holds back
+    the last lines for a negative end.
+
+    Strings, memory-mapped files, and text files opened on regular files are
+    scanned backwards from the end for a negative start, so only the end of
+    the input is read. Only the selected lines of a memory-mapped file are
+    decoded.
 
     Parameters:
 
-        data:              (string or iterable) - input to slice by lines
+        data:              (string, mmap, or iterable) - input to slice by lines
         slice_start:       (int) - starting line
         slice_end:         (int) - ending line
 
     Returns:
-        string if input is a string.
+        string if input is a string or memory-mapped UTF-8 file.
         iterable of strings if input is an iterable (for streaming parsers)
     """
     if not slice_start is None or not slice_end is None:
+        positive_slice = (slice_start is None or slice_start >= 0) \
+            and (slice_end is None or slice_end >= 0)
+
+        # negative start with no end or a negative end: read from the end
+        tail_slice = slice_start is not None and slice_start < 0 \
+            and (slice_end is None or slice_end < 0)
+
+        # standard parsers memory-mapped input
+        if isinstance(data, mmap.mmap):
+            try:
+                if positive_slice:
+                    lines = islice(_lazy_splitlines_bytes(data), slice_start, slice_end)
+
+                elif tail_slice:
+                    lines = _tail_lines(_lazy_reverse_splitlines(data), slice_start, slice_end)  # type: ignore
+
+                else:
+                    lines = _slice_lines(_lazy_splitlines_bytes(data), slice_start, slice_end)  # type: ignore
+
+                return '\n'.join(line.decode('utf-8') for line in lines)  # type: ignore
+
+            except UnicodeDecodeError:
+                raise ValueError('Cannot slice bytes data.')
+
         # standard parsers UTF-8 input
         if isinstance(data, str):
-            data_iter = _lazy_splitlines(data)
-
-            # positive slices
-            if (slice_start is None or slice_start >= 0) \
-                and (slice_end is None or slice_end >= 0):
+            if positive_slice:
+                return '\n'.join(islice(_lazy_splitlines(data), slice_start, slice_end))
 
-                return '\n'.join(islice(data_iter, slice_start, slice_end))
+            if tail_slice:
+                return '\n'.join(_tail_lines(_lazy_reverse_splitlines(data), slice_start, slice_end))  # type: ignore
 
-            # negative slices found (non-lazy, uses more memory)
-            else:
-                return '\n'.join(list(data_iter)[slice_start:slice_end])
+            return '\n'.join(_slice_lines(_lazy_splitlines(data), slice_start, slice_end))
 
         # standard parsers bytes input
         elif isinstance(data, bytes):
             raise ValueError('Cannot slice bytes data.')
 
         # streaming parsers UTF-8 input
-        else:
-            # positive slices
-            if (slice_start is None or slice_start >= 0) \
-                and (slice_end is None or slice_end >= 0) \
-                and data:
-
+        elif data:
+            if positive_slice:
                 return islice(data, slice_start, slice_end)
 
-            # negative slices found (non-lazy, uses more memory)
-            elif data:
-                return list(data)[slice_start:slice_end]
+            if tail_slice:
+                tail = _tail_text_file(data, slice_start, slice_end)  # type: ignore
+                if tail is not None:
+                    return tail
+
+            return _slice_lines(data, slice_start, slice_end)
 
     return data
 
 
+# timestamp formats in the order they are tried
+_TIMESTAMP_FORMATS: Tuple[TimeStampFormatType, ...] = (
+    {'id': 1000, 'format': '%a %b %d %H:%M:%S %Y', 'locale': None},  # manual C locale format conversion: Tue Mar 23 16:12:11 2021 or Tue Mar 23 16:12:11 IST 2021
+    {'id': 1100, 'format': '%a %b %d %H:%M:%S %Y %z', 'locale': None}, # git date output: Thu Mar 5 09:17:40 2020 -0800
+    {'id': 1300, 'format': '%Y-%m-%dT%H:%M:%S.%f%Z', 'locale': None}, # ISO Format with UTC (found in syslog 5424): 2003-10-11T22:14:15.003Z
+    {'id': 1310, 'format': '%Y-%m-%dT%H:%M:%S.%f', 'locale': None}, # ISO Format without TZ (found in syslog 5424): 2003-10-11T22:14:15.003
+    {'id': 1400, 'format': '%b %d %Y %H:%M:%S.%f UTC', 'locale': None}, # CEF Format with UTC: Nov 08 2022 12:30:00.111 UTC
+    {'id': 1410, 'format': '%b %d %Y %H:%M:%S.%f', 'locale': None}, # CEF Format without TZ: Nov 08 2022 12:30:00.111
+    {'id': 1420, 'format': '%b %d %Y %H:%M:%S UTC', 'locale': None}, # CEF Format with UTC without microseconds: Nov 08 2022 12:30:00 UTC
+    {'id': 1430, 'format': '%b %d %Y %H:%M:%S', 'locale': None}, # CEF Format without TZ or microseconds: Nov 08 2022 12:30:00
+    {'id': 1500, 'format': '%Y-%m-%d %H:%M', 'locale': None},  # en_US.UTF-8 local format (found in who cli output): 2021-03-23 00:14
+    {'id': 1600, 'format': '%m/%d/%Y %I:%M %p', 'locale': None},  # Windows english format (found in dir cli output): 12/07/2019 02:09 AM
+    {'id': 1700, 'format': '%m/%d/%Y, %I:%M:%S %p', 'locale': None},  # Windows english format wint non-UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC-0600)
+    {'id': 1705, 'format': '%m/%d/%Y, %I:%M:%S %p %Z', 'locale': None},  # Windows english format with UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC)
+    {'id': 1710, 'format': '%m/%d/%Y, %I:%M:%S %p UTC%z', 'locale': None},  # Windows english format with UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC+0000)
+    {'id': 1720, 'format': '%A, %B %d, %Y %I:%M:%S %p', 'locale': None},  # ipconfig cli output format: Thursday, June 22, 2023 10:39:04 AM
+    {'id': 1750, 'format': '%Y/%m/%d-%H:%M:%S.%f', 'locale': None},  # Google Big Table format with no timezone: 1970/01/01-01:00:00.000000
+    {'id': 1755, 'format': '%Y/%m/%d-%H:%M:%S.%f%z', 'locale': None},  # Google Big Table format with timezone: 1970/01/01-01:00:00.000000+00:00
+    {'id': 1760, 'format': '%Y-%m-%d %H:%M:%S%z', 'locale': None},  # certbot format with timezone: 2023-06-12 01:35:30+00:00
+    {'id': 1800, 'format': '%d/%b/%Y:%H:%M:%S %z', 'locale': None},  # Common Log Format: 10/Oct/2000:13:55:36 -0700
+    {'id': 2000, 'format': '%a %d %b %Y %I:%M:%S %p %Z', 'locale': None},  # en_US.UTF-8 local format (found in upower cli output): Tue 23 Mar 2021 04:12:11 PM UTC
+    {'id': 3000, 'format': '%a %d %b %Y %I:%M:%S %p', 'locale': None},  # en_US.UTF-8 local format with non-UTC tz (found in upower cli output): Tue 23 Mar 2021 04:12:11 PM IST
+    {'id': 3100, 'format': '%a %d %b %Y %I:%M:%S %p %z', 'locale': None},  # pacman format - append 00 to end to make it work: # Sat 11 May 2024 06:14:19 AM +0800
+    {'id': 3500, 'format': '%a, %d %b %Y %H:%M:%S %Z', 'locale': None},  # HTTP header time format (always GMT so assume UTC): Wed, 31 Jan 2024 00:39:28 GMT
+    {'id': 4000, 'format': '%A %d %B %Y %I:%M:%S %p %Z', 'locale': None},  # European-style local format (found in upower cli output): Tuesday 01 October 2019 12:50:41 PM UTC
+    {'id': 5000, 'format': '%A %d %B %Y %I:%M:%S %p', 'locale': None},  # European-style local format with non-UTC tz (found in upower cli output): Tuesday 01 October 2019 12:50:41 PM IST
+    {'id': 6000, 'format': '%a %b %d %I:%M:%S %p %Z %Y', 'locale': None},  # en_US.UTF-8 format (found in date cli): Wed Mar 24 06:16:19 PM UTC 2021
+    {'id': 7000, 'format': '%a %b %d %H:%M:%S %Z %Y', 'locale': None},  # C locale format (found in date cli): Wed Mar 24 11:11:30 UTC 2021
+    {'id': 7100, 'format': '%b %d %H:%M:%S %Y', 'locale': None},  # C locale format (found in stat cli output - osx): # Mar 29 11:49:05 2021
+    {'id': 7200, 'format': '%Y-%m-%d %H:%M:%S.%f %z', 'locale': None},  # C locale format (found in stat cli output - linux): 2019-08-13 18:13:43.555604315 -0400
+    {'id': 7250, 'format': '%Y-%m-%d %H:%M:%S', 'locale': None},  # C locale format with non-UTC tz (found in modified vmstat cli output): # 2021-09-16 20:32:28 PDT
+    {'id': 7255, 'format': '%Y-%m-%d %H:%M:%S %Z', 'locale': None},  # C locale format (found in modified vmstat cli output): # 2021-09-16 20:32:28 UTC
+    {'id': 7300, 'format': '%a %Y-%m-%d %H:%M:%S %Z', 'locale': None},  # C locale format (found in timedatectl cli output): # Wed 2020-03-11 00:53:21 UTC
+    # attempt locale changes last
+    {'id': 8000, 'format': '%a %d %b %Y %H:%M:%S %Z', 'locale': ''},  # current locale format (found in upower cli output): # mar. 23 mars 2021 23:12:11 UTC
+    {'id': 8100, 'format': '%a %d %b %Y %H:%M:%S', 'locale': ''},  # current locale format with non-UTC tz (found in upower cli output): # mar. 23 mars 2021 19:12:11 EDT
+    {'id': 8200, 'format': '%A %d %B %Y, %H:%M:%S UTC%z', 'locale': ''},  # fr_FR.utf8 locale format (found in date cli output): vendredi 26 mars 2021, 13:26:46 (UTC+0000)
+    {'id': 8300, 'format': '%A %d %B %Y, %H:%M:%S', 'locale': ''},  # fr_FR.utf8 locale format with non-UTC tz (found in date cli output): vendredi 26 mars 2021, 13:26:46 (UTC-0400)
+    {'id': 9000, 'format': '%c', 'locale': ''}  # locally configured locale format conversion: Could be anything :) this is a last-gasp attempt
+)
+
+# from https://www.timeanddate.com/time/zones/
+# only removed UTC & GMT timezones and added known non-UTC offsets
+_TZ_ABBR: FrozenSet[str] = frozenset({
+    'A', 'ACDT', 'ACST', 'ACT', 'ACWST', 'ADT', 'AEDT', 'AEST', 'AET', 'AFT', 'AKDT',
+    'AKST', 'ALMT', 'AMST', 'AMT', 'ANAST', 'ANAT', 'AQTT', 'ART', 'AST', 'AT', 'AWDT',
+    'AWST', 'AZOST', 'AZOT', 'AZST', 'AZT', 'AoE', 'B', 'BNT', 'BOT', 'BRST', 'BRT', 'BST',
+    'BTT', 'C', 'CAST', 'CAT', 'CCT', 'CDT', 'CEST', 'CET', 'CHADT', 'CHAST', 'CHOST',
+    'CHOT', 'CHUT', 'CIDST', 'CIST', 'CKT', 'CLST', 'CLT', 'COT', 'CST', 'CT', 'CVT', 'CXT',
+    'ChST', 'D', 'DAVT', 'DDUT', 'E', 'EASST', 'EAST', 'EAT', 'ECT', 'EDT', 'EEST', 'EET',
+    'EGST', 'EGT', 'EST', 'ET', 'F', 'FET', 'FJST', 'FJT', 'FKST', 'FKT', 'FNT', 'G',
+    'GALT', 'GAMT', 'GET', 'GFT', 'GILT', 'GST', 'GYT', 'H', 'HDT', 'HKT', 'HOVST',
+    'HOVT', 'HST', 'I', 'ICT', 'IDT', 'IOT', 'IRDT', 'IRKST', 'IRKT', 'IRST', 'IST', 'JST',
+    'K', 'KGT', 'KOST', 'KRAST', 'KRAT', 'KST', 'KUYT', 'L', 'LHDT', 'LHST', 'LINT', 'M',
+    'MAGST', 'MAGT', 'MART', 'MAWT', 'MDT', 'MHT', 'MMT', 'MSD', 'MSK', 'MST', 'MT', 'MUT',
+    'MVT', 'MYT', 'N', 'NCT', 'NDT', 'NFDT', 'NFT', 'NOVST', 'NOVT', 'NPT', 'NRT', 'NST',
+    'NUT', 'NZDT', 'NZST', 'O', 'OMSST', 'OMST', 'ORAT', 'P', 'PDT', 'PET', 'PETST', 'PETT',
+    'PGT', 'PHOT', 'PHT', 'PKT', 'PMDT', 'PMST', 'PONT', 'PST', 'PT', 'PWT', 'PYST', 'PYT',
+    'Q', 'QYZT', 'R', 'RET', 'ROTT', 'S', 'SAKT', 'SAMT', 'SAST', 'SBT', 'SCT', 'SGT',
+    'SRET', 'SRT', 'SST', 'SYOT', 'T', 'TAHT', 'TFT', 'TJT', 'TKT', 'TLT', 'TMT', 'TOST',
+    'TOT', 'TRT', 'TVT', 'U', 'ULAST', 'ULAT', 'UYST', 'UYT', 'UZT', 'V', 'VET', 'VLAST',
+    'VLAT', 'VOST', 'VUT', 'W', 'WAKT', 'WARST', 'WAST', 'WAT', 'WEST', 'WET', 'WFT',
+    'WGST', 'WGT', 'WIB', 'WIT', 'WITA', 'WST', 'WT', 'X', 'Y', 'YAKST', 'YAKT', 'YAPT',
+    'YEKST', 'YEKT', 'UTC-1200', 'UTC-1100', 'UTC-1000', 'UTC-0930', 'UTC-0900',
+    'UTC-0800', 'UTC-0700', 'UTC-0600', 'UTC-0500', 'UTC-0400', 'UTC-0300', 'UTC-0230',
+    'UTC-0200', 'UTC-0100', 'UTC+0100', 'UTC+0200', 'UTC+0300', 'UTC+0400', 'UTC+0430',
+    'UTC+0500', 'UTC+0530', 'UTC+0545', 'UTC+0600', 'UTC+0630', 'UTC+0700', 'UTC+0800',
+    'UTC+0845', 'UTC+0900', 'UTC+1000', 'UTC+1030', 'UTC+1100', 'UTC+1200', 'UTC+1300',
+    'UTC+1345', 'UTC+1400'
+})
+
+_OFFSET_SUFFIXES: Tuple[str, ...] = (
+    '-12:00', '-11:00', '-10:00', '-09:30', '-09:00',
+    '-08:00', '-07:00', '-06:00', '-05:00', '-04:00', '-03:00', '-02:30',
+    '-02:00', '-01:00', '+01:00', '+02:00', '+03:00', '+04:00', '+04:30',
+    '+05:00', '+05:30', '+05:45', '+06:00', '+06:30', '+07:00', '+08:00',
+    '+08:45', '+09:00', '+10:00', '+10:30', '+11:00', '+12:00', '+13:00',
+    '+13:45', '+14:00'
+)
+
+_SUBSECOND_RE = re.compile(r'(\W\d\d:\d\d:\d\d\.\d{6})\d+\W')
+
+# digits are replaced with zeros to get the "shape" of a datetime string
+_TIMESTAMP_SHAPE_TABLE = str.maketrans('123456789', '000000000')
+
+# permissive regex patterns for strptime directives. A string that does not
+# match the pattern built for a format can never be parsed by that format.
+_LOOSE_DIRECTIVES: Dict[str, str] = {
+    'a': '.*?', 'A': '.*?', 'b': '.*?', 'B': '.*?', 'p': '.*?', 'Z': '.*?', 'z': '.*?',
+    'd': r'\s?\d{1,2}', 'm': r'\s?\d{1,2}', 'H': r'\s?\d{1,2}', 'I': r'\s?\d{1,2}',
+    'M': r'\s?\d{1,2}', 'S': r'\s?\d{1,2}', 'Y': r'\d{4}', 'f': r'\d{1,6}', '%': '%'
+}
+
+
+def _loose_format_re(fmt: str) -> Optional[Pattern[str]]:
+    """
+    Return a regex that matches a superset of the strings strptime accepts
+    for the format. Returns None if the format cannot be translated (e.g.
+    `%c`), so the format is always tried.
+    """
+    pattern = ''
+    i = 0
+
+    while i < len(fmt):
+        char = fmt[i]
+        if char == '%':
+            directive = fmt[i + 1:i + 2]
+            if directive not in _LOOSE_DIRECTIVES:
+                return None
+            pattern += _LOOSE_DIRECTIVES[directive]
+            i += 2
+            continue
+
+        if char.isspace():
+            if not pattern.endswith(r'\s+'):
+                pattern += r'\s+'
+        else:
+            pattern += re.escape(char)
+        i += 1
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_LOOSE_FORMAT_RES: Dict[int, Optional[Pattern[str]]] = {
+    fmt['id']: _loose_format_re(fmt['format']) for fmt in _TIMESTAMP_FORMATS
+}
+
+TIMESTAMP_CACHE_SIZE = 2048
+
+
 class timestamp:
     __slots__ = ('string', 'format', 'naive', 'utc', 'iso')
 
@@ -621,11 +1066,65 @@ class timestamp:
         self.utc = dt['timestamp_utc']
         self.iso = dt['iso']
 
+    @classmethod
+    def _from_parsed(cls, datetime_string: Optional[str], dt: Dict[str, Any]) -> 'timestamp':
+        """Create a timestamp object from a _parse_dt() style dictionary"""
+        obj = cls.__new__(cls)
+        obj.string = datetime_string
+        obj.format = dt['format']
+        obj.naive = dt['timestamp_naive']
+        obj.utc = dt['timestamp_utc']
+        obj.iso = dt['iso']
+        return obj
+
     def __repr__(self) -> str:
         return f'timestamp(string={self.string!r}, format={self.format}, naive={self.naive}, utc={self.utc}, iso={self.iso!r})'
 
+    @classmethod
+    def set_cache_size(cls, maxsize: Optional[int] = TIMESTAMP_CACHE_SIZE) -> None:
+        """
+        Set the number of datetime strings and string shapes to cache. Use
+        None for an unbounded cache or 0 to disable caching. The caches are
+        cleared.
+        """
+        cls._parse_dt = staticmethod(lru_cache(maxsize=maxsize)(cls._parse_dt.__wrapped__))  # type: ignore
+        cls._candidate_formats = staticmethod(lru_cache(maxsize=maxsize)(cls._candidate_formats.__wrapped__))  # type: ignore
+
     @staticmethod
-    @lru_cache(maxsize=2048)
+    @lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def _candidate_formats(
+        shape: str,
+        format_hint: Tuple[int, ...] = ()
+    ) -> Tuple[TimeStampFormatType, ...]:
+        """
+        Return the formats that can parse a datetime string of this shape in
+        the order they should be tried. The result is cached, so the formats
+        are matched once per shape and call site (format hint).
+        """
+        hint_formats = [fmt for fmt_id in format_hint for fmt in _TIMESTAMP_FORMATS if fmt['id'] == fmt_id]
+        other_formats = [fmt for fmt in _TIMESTAMP_FORMATS if fmt['id'] not in format_hint]
+
+        return tuple(
+            fmt for fmt in hint_formats + other_formats
+            if _LOOSE_FORMAT_RES[fmt['id']] is None
+            or _LOOSE_FORMAT_RES[fmt['id']].fullmatch(shape)  # type: ignore
+        )
+
+    @staticmethod
+    def _strptime(dt_string: str, fmt: TimeStampFormatType) -> datetime:
+        """Run strptime with the locale of the format and restore the locale after"""
+        if fmt['locale'] is None:
+            return datetime.strptime(dt_string, fmt['format'])
+
+        saved_locale = locale.setlocale(locale.LC_TIME)
+        try:
+            locale.setlocale(locale.LC_TIME, fmt['locale'])
+            return datetime.strptime(dt_string, fmt['format'])
+        finally:
+            locale.setlocale(locale.LC_TIME, saved_locale)
+
+    @staticmethod
+    @lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
     def _parse_dt(
         dt_string: Optional[str],
         format_hint: Optional[Iterable[int]] = None
@@ -682,85 +1181,6 @@ class timestamp:
 
                 If the conversion completely fails, all fields will be None.
         """
-        formats: tuple[TimeStampFormatType, ...] = (
-            {'id': 1000, 'format': '%a %b %d %H:%M:%S %Y', 'locale': None},  # manual C locale format conversion: Tue Mar 23 16:12:11 2021 or Tue Mar 23 16:12:11 IST 2021
-            {'id': 1100, 'format': '%a %b %d %H:%M:%S %Y %z', 'locale': None}, # git date output: Thu Mar 5 09:17:40 2020 -0800
-            {'id': 1300, 'format': '%Y-%m-%dT%H:%M:%S.%f%Z', 'locale': None}, # ISO Format with UTC (found in syslog 5424): 2003-10-11T22:14:15.003Z
-            {'id': 1310, 'format': '%Y-%m-%dT%H:%M:%S.%f', 'locale': None}, # ISO Format without TZ (found in syslog 5424): 2003-10-11T22:14:15.003
-            {'id': 1400, 'format': '%b %d %Y %H:%M:%S.%f UTC', 'locale': None}, # CEF Format with UTC: Nov 08 2022 12:30:00.111 UTC
-            {'id': 1410, 'format': '%b %d %Y %H:%M:%S.%f', 'locale': None}, # CEF Format without TZ: Nov 08 2022 12:30:00.111
-            {'id': 1420, 'format': '%b %d %Y %H:%M:%S UTC', 'locale': None}, # CEF Format with UTC without microseconds: Nov 08 2022 12:30:00 UTC
-            {'id': 1430, 'format': '%b %d %Y %H:%M:%S', 'locale': None}, # CEF Format without TZ or microseconds: Nov 08 2022 12:30:00
-            {'id': 1500, 'format': '%Y-%m-%d %H:%M', 'locale': None},  # en_US.UTF-8 local format (found in who cli output): 2021-03-23 00:14
-            {'id': 1600, 'format': '%m/%d/%Y %I:%M %p', 'locale': None},  # Windows english format (found in dir cli output): 12/07/2019 02:09 AM
-            {'id': 1700, 'format': '%m/%d/%Y, %I:%M:%S %p', 'locale': None},  # Windows english format wint non-UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC-0600)
-            {'id': 1705, 'format': '%m/%d/%Y, %I:%M:%S %p %Z', 'locale': None},  # Windows english format with UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC)
-            {'id': 1710, 'format': '%m/%d/%Y, %I:%M:%S %p UTC%z', 'locale': None},  # Windows english format with UTC tz (found in systeminfo cli output): 3/22/2021, 1:15:51 PM (UTC+0000)
-            {'id': 1720, 'format': '%A, %B %d, %Y %I:%M:%S %p', 'locale': None},  # ipconfig cli output format: Thursday, June 22, 2023 10:39:04 AM
-            {'id': 1750, 'format': '%Y/%m/%d-%H:%M:%S.%f', 'locale': None},  # Google Big Table format with no timezone: 1970/01/01-01:00:00.000000
-            {'id': 1755, 'format': '%Y/%m/%d-%H:%M:%S.%f%z', 'locale': None},  # Google Big Table format with timezone: 1970/01/01-01:00:00.000000+00:00
-            {'id': 1760, 'format': '%Y-%m-%d %H:%M:%S%z', 'locale': None},  # certbot format with timezone: 2023-06-12 01:35:30+00:00
-            {'id': 1800, 'format': '%d/%b/%Y:%H:%M:%S %z', 'locale': None},  # Common Log Format: 10/Oct/2000:13:55:36 -0700
-            {'id': 2000, 'format': '%a %d %b %Y %I:%M:%S %p %Z', 'locale': None},  # en_US.UTF-8 local format (found in upower cli output): Tue 23 Mar 2021 04:12:11 PM UTC
-            {'id': 3000, 'format': '%a %d %b %Y %I:%M:%S %p', 'locale': None},  # en_US.UTF-8 local format with non-UTC tz (found in upower cli output): Tue 23 Mar 2021 04:12:11 PM IST
-            {'id': 3100, 'format': '%a %d %b %Y %I:%M:%S %p %z', 'locale': None},  # pacman format - append 00 to end to make it work: # Sat 11 May 2024 06:14:19 AM +0800
-            {'id': 3500, 'format': '%a, %d %b %Y %H:%M:%S %Z', 'locale': None},  # HTTP header time format (always GMT so assume UTC): Wed, 31 Jan 2024 00:39:28 GMT
-            {'id': 4000, 'format': '%A %d %B %Y %I:%M:%S %p %Z', 'locale': None},  # European-style local format (found in upower cli output): Tuesday 01 October 2019 12:50:41 PM UTC
-            {'id': 5000, 'format': '%A %d %B %Y %I:%M:%S %p', 'locale': None},  # European-style local format with non-UTC tz (found in upower cli output): Tuesday 01 October 2019 12:50:41 PM IST
-            {'id': 6000, 'format': '%a %b %d %I:%M:%S %p %Z %Y', 'locale': None},  # en_US.UTF-8 format (found in date cli): Wed Mar 24 06:16:19 PM UTC 2021
-            {'id': 7000, 'format': '%a %b %d %H:%M:%S %Z %Y', 'locale': None},  # C locale format (found in date cli): Wed Mar 24 11:11:30 UTC 2021
-            {'id': 7100, 'format': '%b %d %H:%M:%S %Y', 'locale': None},  # C locale format (found in stat cli output - osx): # Mar 29 11:49:05 2021
-            {'id': 7200, 'format': '%Y-%m-%d %H:%M:%S.%f %z', 'locale': None},  # C locale format (found in stat cli output - linux): 2019-08-13 18:13:43.555604315 -0400
-            {'id': 7250, 'format': '%Y-%m-%d %H:%M:%S', 'locale': None},  # C locale format with non-UTC tz (found in modified vmstat cli output): # 2021-09-16 20:32:28 PDT
-            {'id': 7255, 'format': '%Y-%m-%d %H:%M:%S %Z', 'locale': None},  # C locale format (found in modified vmstat cli output): # 2021-09-16 20:32:28 UTC
-            {'id': 7300, 'format': '%a %Y-%m-%d %H:%M:%S %Z', 'locale': None},  # C locale format (found in timedatectl cli output): # Wed 2020-03-11 00:53:21 UTC
-            # attempt locale changes last
-            {'id': 8000, 'format': '%a %d %b %Y %H:%M:%S %Z', 'locale': ''},  # current locale format (found in upower cli output): # mar. 23 mars 2021 23:12:11 UTC
-            {'id': 8100, 'format': '%a %d %b %Y %H:%M:%S', 'locale': ''},  # current locale format with non-UTC tz (found in upower cli output): # mar. 23 mars 2021 19:12:11 EDT
-            {'id': 8200, 'format': '%A %d %B %Y, %H:%M:%S UTC%z', 'locale': ''},  # fr_FR.utf8 locale format (found in date cli output): vendredi 26 mars 2021, 13:26:46 (UTC+0000)
-            {'id': 8300, 'format': '%A %d %B %Y, %H:%M:%S', 'locale': ''},  # fr_FR.utf8 locale format with non-UTC tz (found in date cli output): vendredi 26 mars 2021, 13:26:46 (UTC-0400)
-            {'id': 9000, 'format': '%c', 'locale': ''}  # locally configured locale format conversion: Could be anything :) this is a last-gasp attempt
-        )
-
-        # from https://www.timeanddate.com/time/zones/
-        # only removed UTC & GMT timezones and added known non-UTC offsets
-        tz_abbr: set[str] = {
-            'A', 'ACDT', 'ACST', 'ACT', 'ACWST', 'ADT', 'AEDT', 'AEST', 'AET', 'AFT', 'AKDT',
-            'AKST', 'ALMT', 'AMST', 'AMT', 'ANAST', 'ANAT', 'AQTT', 'ART', 'AST', 'AT', 'AWDT',
-            'AWST', 'AZOST', 'AZOT', 'AZST', 'AZT', 'AoE', 'B', 'BNT', 'BOT', 'BRST', 'BRT', 'BST',
-            'BTT', 'C', 'CAST', 'CAT', 'CCT', 'CDT', 'CEST', 'CET', 'CHADT', 'CHAST', 'CHOST',
-            'CHOT', 'CHUT', 'CIDST', 'CIST', 'CKT', 'CLST', 'CLT', 'COT', 'CST', 'CT', 'CVT', 'CXT',
-            'ChST', 'D', 'DAVT', 'DDUT', 'E', 'EASST', 'EAST', 'EAT', 'ECT', 'EDT', 'EEST', 'EET',
-            'EGST', 'EGT', 'EST', 'ET', 'F', 'FET', 'FJST', 'FJT', 'FKST', 'FKT', 'FNT', 'G',
-            'GALT', 'GAMT', 'GET', 'GFT', 'GILT', 'GST', 'GYT', 'H', 'HDT', 'HKT', 'HOVST',
-            'HOVT', 'HST', 'I', 'ICT', 'IDT', 'IOT', 'IRDT', 'IRKST', 'IRKT', 'IRST', 'IST', 'JST',
-            'K', 'KGT', 'KOST', 'KRAST', 'KRAT', 'KST', 'KUYT', 'L', 'LHDT', 'LHST', 'LINT', 'M',
-            'MAGST', 'MAGT', 'MART', 'MAWT', 'MDT', 'MHT', 'MMT', 'MSD', 'MSK', 'MST', 'MT', 'MUT',
-            'MVT', 'MYT', 'N', 'NCT', 'NDT', 'NFDT', 'NFT', 'NOVST', 'NOVT', 'NPT', 'NRT', 'NST',
-            'NUT', 'NZDT', 'NZST', 'O', 'OMSST', 'OMST', 'ORAT', 'P', 'PDT', 'PET', 'PETST', 'PETT',
-            'PGT', 'PHOT', 'PHT', 'PKT', 'PMDT', 'PMST', 'PONT', 'PST', 'PT', 'PWT', 'PYST', 'PYT',
-            'Q', 'QYZT', 'R', 'RET', 'ROTT', 'S', 'SAKT', 'SAMT', 'SAST', 'SBT', 'SCT', 'SGT',
-            'SRET', 'SRT', 'SST', 'SYOT', 'T', 'TAHT', 'TFT', 'TJT', 'TKT', 'TLT', 'TMT', 'TOST',
-            'TOT', 'TRT', 'TVT', 'U', 'ULAST', 'ULAT', 'UYST', 'UYT', 'UZT', 'V', 'VET', 'VLAST',
-            'VLAT', 'VOST', 'VUT', 'W', 'WAKT', 'WARST', 'WAST', 'WAT', 'WEST', 'WET', 'WFT',
-            'WGST', 'WGT', 'WIB', 'WIT', 'WITA', 'WST', 'WT', 'X', 'Y', 'YAKST', 'YAKT', 'YAPT',
-            'YEKST', 'YEKT', 'UTC-1200', 'UTC-1100', 'UTC-1000', 'UTC-0930', 'UTC-0900',
-            'UTC-0800', 'UTC-0700', 'UTC-0600', 'UTC-0500', 'UTC-0400', 'UTC-0300', 'UTC-0230',
-            'UTC-0200', 'UTC-0100', 'UTC+0100', 'UTC+0200', 'UTC+0300', 'UTC+0400', 'UTC+0430',
-            'UTC+0500', 'UTC+0530', 'UTC+0545', 'UTC+0600', 'UTC+0630', 'UTC+0700', 'UTC+0800',
-            'UTC+0845', 'UTC+0900', 'UTC+1000', 'UTC+1030', 'UTC+1100', 'UTC+1200', 'UTC+1300',
-            'UTC+1345', 'UTC+1400'
-        }
-
-        offset_suffixes: tuple[str, ...] = (
-            '-12:00', '-11:00', '-10:00', '-09:30', '-09:00',
-            '-08:00', '-07:00', '-06:00', '-05:00', '-04:00', '-03:00', '-02:30',
-            '-02:00', '-01:00', '+01:00', '+02:00', '+03:00', '+04:00', '+04:30',
-            '+05:00', '+05:30', '+05:45', '+06:00', '+06:30', '+07:00', '+08:00',
-            '+08:45', '+09:00', '+10:00', '+10:30', '+11:00', '+12:00', '+13:00',
-            '+13:45', '+14:00'
-        )
-
         data: str = dt_string or ''
         normalized_datetime: str = ''
         utc_tz: bool = False
@@ -805,44 +1225,28 @@ class timestamp:
 
         # normalize the timezone by taking out any timezone reference, except UTC
         cleandata = data.replace('(', '').replace(')', '')
-        normalized_datetime_list: List[str] = []
-        for term in cleandata.split():
-            if term not in tz_abbr:
-                normalized_datetime_list.append(term)
-
-        normalized_datetime = ' '.join(normalized_datetime_list)
+        normalized_datetime = ' '.join(term for term in cleandata.split() if term not in _TZ_ABBR)
 
         # remove non UTC offset suffixes at the end of the string
-        for suffix in offset_suffixes:
-            if normalized_datetime.endswith(suffix):
-                normalized_datetime = normalized_datetime[0:-len(suffix)]
-                break
+        if normalized_datetime.endswith(_OFFSET_SUFFIXES):
+            normalized_datetime = normalized_datetime[0:-6]
 
         # normalize further by converting any greater-than 6-digit subsecond to 6-digits
-        p = re.compile(r'(\W\d\d:\d\d:\d\d\.\d{6})\d+\W')
-        normalized_datetime = p.sub(r'\g<1> ', normalized_datetime)
-
-        # try format hints first, then fall back to brute-force method
-        hint_obj_list: List[TimeStampFormatType] = []
-        for fmt_id in format_hint:
-            for fmt in formats:
-                if fmt_id == fmt['id']:
-                    hint_obj_list.append(fmt)
+        if '.' in normalized_datetime:
+            normalized_datetime = _SUBSECOND_RE.sub(r'\g<1> ', normalized_datetime)
 
-        remaining_formats = [fmt for fmt in formats if not fmt['id'] in format_hint]
-        optimized_formats = hint_obj_list + remaining_formats
+        # only try the formats that can match the shape of the string: format
+        # hints first, then the rest in order
+        shape = normalized_datetime.translate(_TIMESTAMP_SHAPE_TABLE)
 
-        for fmt in optimized_formats:
+        for fmt in timestamp._candidate_formats(shape, format_hint):
             try:
-                locale.setlocale(locale.LC_TIME, fmt['locale'])
-                dt = datetime.strptime(normalized_datetime, fmt['format'])
+                dt = timestamp._strptime(normalized_datetime, fmt)
                 timestamp_obj['format'] = fmt['id']
                 timestamp_naive = int(dt.replace(tzinfo=None).timestamp())
                 iso_string = dt.replace(tzinfo=None).isoformat()
-                locale.setlocale(locale.LC_TIME, None)
                 break
             except Exception:
-                locale.setlocale(locale.LC_TIME, None)
                 continue
 
         if dt and utc_tz:
@@ -856,3 +1260,210 @@ class timestamp:
             timestamp_obj['iso'] = iso_string
 
         return timestamp_obj
+
+
+# strict regex patterns for the strptime directives handled by timestamps().
+# They match a subset of the strings strptime accepts.
+_FAST_DIRECTIVES: Dict[str, str] = {
+    'Y': '([0-9]{4})', 'm': '([0-9]{1,2})', 'd': '([0-9]{1,2})', 'H': '([0-9]{1,2})',
+    'M': '([0-9]{1,2})', 'S': '([0-9]{1,2})', 'f': '([0-9]{1,6})', 'a': '([A-Za-z]+)',
+    'b': '([A-Za-z]+)', 'z': '[+-](?:[01][0-9]|2[0-3])[0-5][0-9]'
+}
+
+# datetime() argument positions of the numeric directives
+_FAST_ARGS: Dict[str, int] = {'Y': 0, 'm': 1, 'd': 2, 'H': 3, 'M': 4, 'S': 5}
+
+# regex, [(datetime argument, group)], weekday group, month name group, fraction group
+FastFormatType = Tuple[Pattern[str], List[Tuple[int, int]], Optional[int], Optional[int], Optional[int]]
+
+
+@lru_cache(maxsize=None)
+def _fast_timestamp_format(format_id: int) -> Optional[FastFormatType]:
+    """
+    Return a strict regex and the regex group of each datetime field for a
+    format ID. Returns None if the format is not supported by the fast
+    path of timestamps().
+    """
+    fmt = next((f for f in _TIMESTAMP_FORMATS if f['id'] == format_id), None)
+    if fmt is None or fmt['locale'] is not None:
+        return None
+
+    pattern = ''
+    args: List[Tuple[int, int]] = []
+    groups: Dict[str, int] = {}
+    fmt_string = fmt['format']
+    i = 0
+
+    while i < len(fmt_string):
+        char = fmt_string[i]
+        if char == '%':
+            directive = fmt_string[i + 1:i + 2]
+            if directive not in _FAST_DIRECTIVES or directive in groups:
+                return None
+            pattern += _FAST_DIRECTIVES[directive]
+            if directive in _FAST_ARGS:
+                args.append((_FAST_ARGS[directive], len(groups)))
+            if directive != 'z':
+                groups[directive] = len(groups)
+            i += 2
+            continue
+
+        pattern += re.escape(char)
+        i += 1
+
+    return re.compile(pattern), args, groups.get('a'), groups.get('b'), groups.get('f')
+
+
+def _fast_timestamp(
+    datetime_string: str,
+    format_id: int,
+    fast_format: FastFormatType,
+    day_names: FrozenSet[str],
+    month_names: Dict[str, int],
+    shapes: Dict[str, bool],
+    format_hint: Tuple[int, ...]
+) -> Optional[timestamp]:
+    """
+    Convert a datetime string with a known format without trying other
+    formats. Returns None if the string needs the full conversion in
+    timestamp() to get the same result.
+    """
+    # only strings that are not changed by the timestamp normalization
+    if 'Z' in datetime_string \
+       or 'GMT' in datetime_string \
+       or '+00:00' in datetime_string \
+       or datetime_string.endswith(_OFFSET_SUFFIXES):
+        return None
+
+    normalized_datetime = datetime_string
+    if '.' in normalized_datetime:
+        normalized_datetime = _SUBSECOND_RE.sub(r'\g<1> ', normalized_datetime)
+
+    regex, args, day_group, month_group, fraction_group = fast_format
+    match = regex.fullmatch(normalized_datetime)
+    if not match:
+        return None
+
+    # a format tried before this one could also match the string
+    shape = normalized_datetime.translate(_TIMESTAMP_SHAPE_TABLE)
+    if shape not in shapes:
+        candidates = timestamp._candidate_formats(shape, format_hint)
+        shapes[shape] = bool(candidates) and candidates[0]['id'] == format_id
+    if not shapes[shape]:
+        return None
+
+    groups = match.groups()
+    dt_args = [1900, 1, 1, 0, 0, 0, 0]  # strptime defaults
+
+    for arg, group in args:
+        dt_args[arg] = int(groups[group])
+
+    if day_group is not None and groups[day_group].lower() not in day_names:
+        return None
+
+    if month_group is not None:
+        month = month_names.get(groups[month_group].lower())
+        if month is None:
+            return None
+        dt_args[1] = month
+
+    if fraction_group is not None:
+        fraction = groups[fraction_group]
+        dt_args[6] = int(fraction + '0' * (6 - len(fraction)))
+
+    try:
+        dt = datetime(*dt_args)
+        timestamp_naive: Optional[int] = int(dt.timestamp())
+        iso_string: Optional[str] = dt.isoformat()
+        timestamp_utc: Optional[int] = None
+
+        if 'UTC' in datetime_string:
+            utc_tz = True
+            if 'UTC+' in datetime_string or 'UTC-' in datetime_string:
+                utc_tz = bool('UTC+0000' in datetime_string or 'UTC-0000' in datetime_string)
+        else:
+            utc_tz = '+0000' in datetime_string or '-0000' in datetime_string or '-00:00' in datetime_string
+
+        if utc_tz:
+            dt_utc = dt.replace(tzinfo=timezone.utc)
+            timestamp_utc = int(dt_utc.timestamp())
+            iso_string = dt_utc.isoformat()
+
+    except (ValueError, OverflowError, OSError):
+        return None
+
+    if not timestamp_naive:
+        timestamp_utc = None
+        iso_string = None
+
+    return timestamp._from_parsed(datetime_string, {
+        'format': format_id,
+        'timestamp_naive': timestamp_naive or None,
+        'timestamp_utc': timestamp_utc,
+        'iso': iso_string
+    })
+
+
+def timestamps(
+    datetime_strings: Iterable[Optional[str]],
+    format_hint: Optional[Iterable[int]] = None
+) -> List[timestamp]:
+    """
+    Convert a column of datetime text strings to timestamp objects.
+
+    The format is detected from the first string that can be converted
+    and the following strings of the same format are converted directly
+    without trying the other formats. Strings in other formats fall back
+    to the detection done by `timestamp`. Repeated strings are converted
+    once. The results are the same as calling `timestamp` on each string.
+
+    Parameters:
+
+        datetime_strings:  (iterable) datetime strings to convert
+
+        format_hint:       (iterable) an optional iterable of format ID
+                           integers to try first. (see `timestamp`)
+
+    Returns:
+
+        List of timestamp objects in the same order as the input. The same
+        object is returned for repeated strings.
+    """
+    format_hint = tuple(format_hint) if format_hint else ()
+    results: List[timestamp] = []
+    seen: Dict[Optional[str], timestamp] = {}
+    shapes: Dict[str, bool] = {}
+    format_id: Optional[int] = None
+    fast_format: Optional[FastFormatType] = None
+    day_names: FrozenSet[str] = frozenset()
+    month_names: Dict[str, int] = {}
+
+    for datetime_string in datetime_strings:
+        ts = seen.get(datetime_string)
+
+        if ts is None:
+            if fast_format and datetime_string:
+                ts = _fast_timestamp(datetime_string, format_id, fast_format,  # type: ignore
+                                     day_names, month_names, shapes, format_hint)
+
+            if ts is None:
+                ts = timestamp(datetime_string, format_hint=format_hint)
+
+                # detect the format once
+                if format_id is None and ts.format is not None:
+                    format_id = ts.format
+                    fast_format = _fast_timestamp_format(format_id)
+                    # strptime matches the names of the current locale
+                    day_names = frozenset(
+                        name.lower() for name in calendar.day_abbr if name not in _TZ_ABBR
+                    )
+                    month_names = {
+                        name.lower(): i for i, name in enumerate(calendar.month_abbr)
+                        if name and name not in _TZ_ABBR
+                    }
+
+            seen[datetime_string] = ts
+
+        results.append(ts)
+
+    return results
@@ -0,0 +1,297 @@
+"""jc - JSON Convert YAML encoder backend
+
+Serializes `jc` output as a YAML document with the `ruamel.yaml` round-trip
+dumper in block style with an explicit document start and without aliases.
+The `ruamel.yaml` instance is configured once and reused.
+
+Dictionaries, lists, strings, integers, floats, booleans, and None are
+written by a built-in emitter that produces the same output as
+`ruamel.yaml`. The items of a top-level list or dictionary are written one
+at a time. An item the built-in emitter cannot write exactly the same way
+(e.g. one with other types, strings that need double quotes, or lines
+that `ruamel.yaml` would wrap) is written by `ruamel.yaml` instead.
+"""
+import io
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple
+from .exceptions import LibraryNotInstalled
+
+# ruamel.yaml wraps scalars at this column
+LINE_WIDTH = 80
+
+# ruamel.yaml writes longer keys as complex keys (`? key`)
+MAX_KEY_LENGTH = 100
+
+# number of encoded key names kept by the built-in emitter
+KEY_CACHE_SIZE = 4096
+
+# characters that are not printable or are line breaks (double quoted)
+ASCII_SPECIAL = r'[^\x20-\x7e]'
+UNICODE_SPECIAL = r'[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]'
+
+# plain scalars cannot start with an indicator, a space, or a document
+# marker, contain `: ` or ` #`, or end with a space or colon
+NOT_PLAIN = r'''\A(?:[ #,\[\]{}&*!|>'"%@`]|[-?:](?: |\Z)|---|\.\.\.)|: | #|[ :]\Z'''
+
+# YAML 1.2 implicit resolvers of ruamel.yaml. Plain strings that match are
+# read as other types, so they are quoted. ruamel.yaml only tries the
+# resolvers for the first character of the string, so the integer pattern
+# does not match strings that start with an underscore.
+IMPLICIT_RE = re.compile(r'''^(?:
+     true|True|TRUE|false|False|FALSE
+    |[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN)
+    |[-+]?0b[0-1_]+
+    |[-+]?0o?[0-7_]+
+    |[-+][0-9_]+|[0-9][0-9_]*
+    |[-+]?0x[0-9a-fA-F_]+
+    |<<
+    |~|null|Null|NULL|
+    |[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+    |[0-9][0-9][0-9][0-9]-[0-9][0-9]?-[0-9][0-9]?
+     (?:[Tt]|[ \t]+)[0-9][0-9]?
+     :[0-9][0-9]:[0-9][0-9](?:\.[0-9]*)?
+     (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?
+    |=
+    )$''', re.X)
+
+INFINITY = float('inf')
+
+
+class _Unsupported(Exception):
+    """Raised when the built-in emitter cannot write a value"""
+
+
+@lru_cache(maxsize=None)
+def get_yaml(ascii_only: bool = False) -> Any:
+    """
+    Return a configured `ruamel.yaml` YAML instance or None if the library
+    is not installed.
+    """
+    # This function is cacheable since the instance is only used to dump
+    try:
+        from ruamel.yaml import YAML, representer
+    except Exception:
+        return None
+
+    # monkey patch to disable plugins since we don't use them and in
+    # ruamel.yaml versions prior to 0.17.0 the use of __file__ in the
+    # plugin code is incompatible with the pyoxidizer packager
+    YAML.official_plug_ins = lambda a: []  # type: ignore
+
+    # monkey patch to disable aliases
+    representer.RoundTripRepresenter.ignore_aliases = lambda x, y: True  # type: ignore
+
+    yaml = YAML()
+    yaml.default_flow_style = False
+    yaml.explicit_start = True  # type: ignore
+    yaml.allow_unicode = not ascii_only
+    yaml.encoding = 'utf-8'
+    return yaml
+
+
+def _ruamel_dumps(data: Any, ascii_only: bool) -> str:
+    """Return the YAML document written by ruamel.yaml"""
+    y_string_buf = io.BytesIO()
+    get_yaml(ascii_only).dump(data, y_string_buf)
+    return y_string_buf.getvalue().decode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _writers(ascii_only: bool) -> Any:
+    """Return the sequence and mapping writers of the built-in emitter"""
+    # This function is cacheable since the writers only depend on ascii_only
+    special = ASCII_SPECIAL if ascii_only else UNICODE_SPECIAL
+    special_re = re.compile(special)
+    not_plain_re = re.compile(special + '|' + NOT_PLAIN)
+    keys: Dict[Tuple[str, int], str] = {}
+
+    def _string(s: str, column: int, key: bool = False) -> str:
+        if s and not not_plain_re.search(s) and not IMPLICIT_RE.match(s):
+            pass
+
+        elif special_re.search(s):
+            raise _Unsupported
+
+        # ruamel.yaml uses double quotes if the string has a single quote
+        elif "'" in s or (key and not s):
+            raise _Unsupported
+
+        else:
+            s = "'" + s + "'"
+
+        if column + len(s) > LINE_WIDTH or (key and len(s) >= MAX_KEY_LENGTH):
+            raise _Unsupported
+
+        return s
+
+    def _scalar(o: Any, column: int) -> str:
+        o_type = type(o)
+
+        if o_type is str:
+            return _string(o, column)
+
+        if o is None:
+            return ''
+
+        if o is True:
+            value = 'true'
+
+        elif o is False:
+            value = 'false'
+
+        elif o_type is int:
+            value = int.__repr__(o)
+
+        elif o_type is float:
+            if o != o:
+                value = '.nan'
+            elif o == INFINITY:
+                value = '.inf'
+            elif o == -INFINITY:
+                value = '-.inf'
+            else:
+                value = float.__repr__(o).lower()
+
+        elif o_type is list and not o:
+            return '[]'
+
+        elif o_type is dict and not o:
+            return '{}'
+
+        else:
+            raise _Unsupported
+
+        if column + len(value) > LINE_WIDTH:
+            raise _Unsupported
+
+        return value
+
+    def _item(o: Any, indent: int, out: List[str]) -> None:
+        # the `- ` of the item has been written
+        o_type = type(o)
+
+        if o_type is dict and o:
+            _mapping(o, indent, out, True)
+        elif o_type is list and o:
+            _sequence(o, indent, out, True)
+        else:
+            out.append(_scalar(o, indent) + '\n')
+
+    def _sequence(seq: List[Any], indent: int, out: List[str], inline: bool = False) -> None:
+        pad = ' ' * indent
+
+        for o in seq:
+            out.append('- ' if inline else pad + '- ')
+            inline = False
+            _item(o, indent + 2, out)
+
+    def _mapping(d: Any, indent: int, out: List[str], inline: bool = False) -> None:
+        pad = ' ' * indent
+
+        for k, v in d.items():
+            if type(k) is not str:
+                raise _Unsupported
+
+            k_string = keys.get((k, indent))
+            if k_string is None:
+                k_string = _string(k, indent, key=True)
+                if len(keys) < KEY_CACHE_SIZE:
+                    keys[(k, indent)] = k_string
+
+            out.append(k_string + ':' if inline else pad + k_string + ':')
+            inline = False
+            v_type = type(v)
+
+            if v_type is dict and v:
+                out.append('\n')
+                _mapping(v, indent + 2, out)
+            elif v_type is list and v:
+                out.append('\n')
+                _sequence(v, indent, out)
+            elif v is None:
+                out.append('\n')
+            else:
+                out.append(' ' + _scalar(v, indent + len(k_string) + 2) + '\n')
+
+    return _sequence, _mapping
+
+
+def iterdumps(data: Any, ascii_only: bool = False) -> Iterator[str]:
+    """
+    Lazily encode the data as a YAML document in pieces. The joined pieces
+    are the same as the output of `ruamel.yaml`, including the final
+    newline.
+
+    Parameters:
+
+        data:        (any)      data to encode
+        ascii_only:  (boolean)  escape non-ASCII characters if True
+
+    Returns:
+
+        Iterator     YAML string pieces
+
+    Raises:
+
+        LibraryNotInstalled     ruamel.yaml library is not installed
+    """
+    if get_yaml(ascii_only) is None:
+        raise LibraryNotInstalled('ruamel.yaml library is not installed.')
+
+    return _iterdumps(data, ascii_only)
+
+
+def _iterdumps(data: Any, ascii_only: bool) -> Iterator[str]:
+    data_type = type(data)
+
+    if not data or data_type not in (list, dict):
+        yield _ruamel_dumps(data, ascii_only)
+        return
+
+    sequence, mapping = _writers(ascii_only)
+    yield '---\n'
+
+    # items that cannot be written by the built-in emitter are written by
+    # ruamel.yaml as a one item document without the document start
+    if data_type is list:
+        for item in data:
+            out: List[str] = []
+            try:
+                sequence([item], 0, out)
+                yield ''.join(out)
+            except _Unsupported:
+                yield _ruamel_dumps([item], ascii_only)[4:]
+
+    else:
+        for key, value in data.items():
+            out = []
+            try:
+                mapping({key: value}, 0, out)
+                yield ''.join(out)
+            except _Unsupported:
+                yield _ruamel_dumps({key: value}, ascii_only)[4:]
+
+
+def dumps(data: Any, ascii_only: bool = False) -> str:
+    """
+    Return the data as a YAML document without the final newline.
+
+    Parameters:
+
+        data:        (any)      data to encode
+        ascii_only:  (boolean)  escape non-ASCII characters if True
+
+    Returns:
+
+        string       YAML document
+
+    Raises:
+
+        LibraryNotInstalled     ruamel.yaml library is not installed
+    """
+    return ''.join(iterdumps(data, ascii_only))[:-1]
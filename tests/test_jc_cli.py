@@ -1,4 +1,7 @@
 import os
+import sys
+import mmap
+import tempfile
 import unittest
 from datetime import datetime, timezone
 
@@ -45,7 +48,11 @@ class MyTests(unittest.TestCase):
             'jc -v arp -a': ('--arp', ['v'], ['arp', '-a']),
             'jc --pretty dig': ('--dig', ['p'], ['dig']),
             'jc --pretty --monochrome --quiet --raw dig': ('--dig', ['p', 'm', 'q', 'r'], ['dig']),
-            'jc --about --yaml-out': (None, [], None)
+            'jc --about --yaml-out': (None, [], None),
+            'jc -u ping-s -c3 1.1.1.1': ('--ping-s', ['u'], ['ping', '-c3', '1.1.1.1']),
+            'jc git-s log': ('--git-log-s', [], ['git', 'log']),
+            'jc -u ping -c3 1.1.1.1': ('--ping', ['u'], ['ping', '-c3', '1.1.1.1']),
+            'jc dig-s example.com': (None, [], ['dig-s', 'example.com'])
         }
 
         for command, expected in commands.items():
@@ -55,6 +62,67 @@ class MyTests(unittest.TestCase):
             resulting_attributes = (cli.magic_found_parser, cli.magic_options, cli.magic_run_command)
             self.assertEqual(expected, resulting_attributes)
 
+    def test_cli_parse_value_options(self):
+        commands = {
+            'jc --serve /tmp/jc.sock': (['jc'], {'--serve': '/tmp/jc.sock'}),
+            'jc --client /tmp/jc.sock -p --dig': (['jc', '-p', '--dig'], {'--client': '/tmp/jc.sock'}),
+            'jc --client dig -p dig www.example.com': (['jc', '-p', 'dig', 'www.example.com'], {'--client': 'dig'}),
+            'jc -p ls --serve /tmp/jc.sock': (['jc', '-p', 'ls', '--serve', '/tmp/jc.sock'], {}),
+            'jc 1:5 --client /tmp/jc.sock --dig': (['jc', '1:5', '--dig'], {'--client': '/tmp/jc.sock'}),
+            'jc --dig --files a.out b.out': (['jc', '--dig'], {'--files': ['a.out', 'b.out']}),
+            'jc --files a.out b.out -p --dig --workers 2': (['jc', '-p', '--dig'], {'--files': ['a.out', 'b.out'], '--workers': '2'})
+        }
+
+        for command, expected in commands.items():
+            cli = JcCli()
+            cli.args = command.split()
+            cli.parse_value_options()
+            self.assertEqual((cli.args, cli.value_options), expected)
+
+    def test_cli_file_input(self):
+        data = 'line1\nline2 ü\nline3\n'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, 'input.txt')
+            with open(file, 'w', encoding='utf-8') as f:
+                f.write(data)
+
+            slices = {
+                '': data,
+                '1:': 'line2 ü\nline3',
+                '-1:': 'line3'
+            }
+
+            for slice_str, expected in slices.items():
+                cli = JcCli()
+                cli.input_file = file
+                cli.slice_str = slice_str
+                cli.set_standard_data_in()
+                self.assertIsInstance(cli.data_in, mmap.mmap)
+                cli.slicer()
+                self.assertEqual(cli.data_in, expected)
+
+            # non-UTF-8 input is left as bytes
+            with open(file, 'wb') as f:
+                f.write(b'\xff\xfe')
+
+            cli = JcCli()
+            cli.input_file = file
+            cli.set_standard_data_in()
+            cli.slicer()
+            self.assertEqual(cli.data_in, b'\xff\xfe')
+
+    def test_cli_open_input_file(self):
+        """Streaming --file input is decoded like STDIN"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, 'input.csv')
+            with open(file, 'wb') as f:
+                f.write(b'a,b\n\xff,\xc3\xbc\n')
+
+            cli = JcCli()
+            cli.input_file = file
+            with cli.open_input_file() as f:
+                self.assertEqual(f.readlines(), ['a,b\n', '\udcff,\u00fc\n'])
+
     @unittest.skipIf(not PYGMENTS_INSTALLED, 'pygments library not installed')
     def test_cli_set_env_colors(self):
         if pygments.__version__.startswith('2.3.'):
@@ -238,6 +306,26 @@ class MyTests(unittest.TestCase):
             cli.data_out = test_dict
             self.assertEqual(cli.json_out(), expected_json)
 
+    @unittest.skipIf(not PYGMENTS_INSTALLED, 'pygments library not installed')
+    def test_cli_json_out_pygments_colorizer(self):
+        test_dict = {"key1": [{"subkey1": "subvalue1"}, {"subkey2": [1, 2.5, None]}], "key2": True}
+
+        os.environ["JC_COLORS"] = "red,default,cyan,default"
+        cli = JcCli()
+        cli.set_custom_colors()
+        cli.data_out = test_dict
+        native_output = cli.json_out()
+
+        os.environ["JC_COLORIZER"] = "pygments"
+        try:
+            cli = JcCli()
+            cli.set_custom_colors()
+            cli.data_out = test_dict
+            self.assertIsNone(cli.colorizer)
+            self.assertEqual(cli.json_out(), native_output)
+        finally:
+            del os.environ["JC_COLORIZER"]
+
     @unittest.skipIf(PYGMENTS_INSTALLED, 'pygments library installed')
     def test_cli_json_out_pretty_no_pygments(self):
         test_input = [
@@ -328,6 +416,25 @@ class MyTests(unittest.TestCase):
         cli = JcCli()
         self.assertIsNot(cli.parsers_text, '')
 
+    def test_cli_run_user_command(self):
+        cli = JcCli()
+        cli.magic_found_parser = '--uname'
+        cli.magic_run_command = [sys.executable, '-c', 'import sys; print("Linux"); sys.exit(2)']
+        cli.run_user_command()
+        self.assertEqual(cli.magic_stdout, 'Linux\n')
+        self.assertEqual(cli.magic_returncode, 2)
+
+    def test_cli_run_user_command_streaming(self):
+        """Output for streaming parsers is read while it is parsed"""
+        cli = JcCli()
+        cli.magic_found_parser = '--ping-s'
+        cli.magic_run_command = [sys.executable, '-c', 'import sys; print("a"); print("b"); sys.exit(2)']
+        cli.run_user_command()
+        self.assertIsNone(cli.magic_stdout)
+        self.assertEqual(list(cli.magic_command.lines()), ['a\n', 'b\n'])
+        cli.wait_user_command()
+        self.assertEqual(cli.magic_returncode, 2)
+
     def test_add_meta_to_simple_dict(self):
         cli = JcCli()
         cli.data_out = {'a': 1, 'b': 2}
@@ -0,0 +1,121 @@
+import os
+import re
+import glob
+import json
+import unittest
+from datetime import datetime, timezone
+from jc.colorizer import JsonColorizer
+from jc.json_backend import iterdumps
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PYGMENTS_INSTALLED = False
+try:
+    import pygments
+    from pygments import highlight
+    from pygments.style import Style
+    from pygments.token import (Name, Number, String, Keyword)
+    from pygments.lexers.data import JsonLexer
+    from pygments.formatters import Terminal256Formatter
+    PYGMENTS_INSTALLED = True
+except Exception:
+    pass
+
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+FORMATS = {
+    'compact': (None, (',', ':'), False),
+    'pretty': (2, None, False),
+    'ascii_only': (None, (',', ':'), True)
+}
+
+
+class MyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = []
+        for file in sorted(glob.glob(os.path.join(THIS_DIR, 'fixtures', '**', '*.json'), recursive=True))[::10]:
+            with open(file, 'r', encoding='utf-8') as f:
+                try:
+                    cls.fixtures.append((file, json.load(f)))
+                except ValueError:
+                    pass
+
+    def test_colorizer_default_colors(self):
+        data = {"key1": "value1", "key2": 2, "key3": None, "key4": 3.14, "key5": True, "key6": [False, {}, []]}
+        expected = '{\x1b[34;01m"key1"\x1b[39;00m:\x1b[32m"value1"\x1b[39m,\x1b[34;01m"key2"\x1b[39;00m:\x1b[35m2\x1b[39m,\x1b[34;01m"key3"\x1b[39;00m:\x1b[90mnull\x1b[39m,\x1b[34;01m"key4"\x1b[39;00m:\x1b[35m3.14\x1b[39m,\x1b[34;01m"key5"\x1b[39;00m:\x1b[90mtrue\x1b[39m,\x1b[34;01m"key6"\x1b[39;00m:[\x1b[90mfalse\x1b[39m,{},[]]}'
+        self.assertEqual(JsonColorizer().dumps(data), expected)
+
+    def test_colorizer_custom_colors(self):
+        colorizer = JsonColorizer('red', 'default', 'white', 'brightcyan')
+        self.assertEqual(
+            colorizer.dumps({'a': [1, None, 'b']}, 2, None),
+            '{\n  \x1b[31;01m"a"\x1b[39;00m: [\n    \x1b[01m1\x1b[39m,\n    \x1b[90mnull\x1b[39m,\n    \x1b[96m"b"\x1b[39m\n  ]\n}'
+        )
+
+    def test_colorizer_same_as_json(self):
+        """Without the color codes the output is the same as json.dumps()"""
+        data = {
+            'string': 'caf\u00e9 \U0001f600 "quoted"\n',
+            'int': -2**70,
+            'float': [1e-07, 1e+20, -0.0, float('nan'), float('inf')],
+            1: 'int key',
+            2.5: 'float key',
+            None: 'null key',
+            True: 'bool key',
+            'tuple': (1, 2),
+            'bytes': b'\x00\xff',
+            'datetime': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            'empty': [{}, [], '']
+        }
+        colorizer = JsonColorizer()
+
+        for fmt, (indent, separators, ascii_only) in FORMATS.items():
+            with self.subTest(fmt):
+                expected = json.dumps(data, indent=indent, separators=separators, ensure_ascii=ascii_only, default=str)
+                self.assertEqual(ANSI_RE.sub('', colorizer.dumps(data, indent, separators, ascii_only)), expected)
+
+    def test_colorizer_invalid_key(self):
+        with self.assertRaises(TypeError):
+            JsonColorizer().dumps({(1, 2): 'tuple key'})
+
+    def test_colorizer_iterdumps(self):
+        """Split documents have colored key names"""
+        colorizer = JsonColorizer()
+        data = {'a': [{'b': i, 'c': str(i)} for i in range(3000)], 'd': None}
+
+        for fmt, (indent, separators, ascii_only) in FORMATS.items():
+            with self.subTest(fmt):
+                pieces = list(iterdumps(
+                    data, indent, separators, ascii_only,
+                    encoder=colorizer.dumps,
+                    key_encoder=colorizer.key_encoder(ascii_only)
+                ))
+                self.assertGreater(len(pieces), 1)
+                self.assertEqual(''.join(pieces), colorizer.dumps(data, indent, separators, ascii_only))
+
+    @unittest.skipIf(not PYGMENTS_INSTALLED or pygments.__version__.startswith('2.3.'), 'pygments 2.4+ library not installed')
+    def test_colorizer_same_as_pygments(self):
+        class JcStyle(Style):
+            styles = {
+                Name.Tag: 'bold ansiyellow',
+                Keyword: 'ansired',
+                Number: 'ansibrightblue',
+                String: 'ansigray'
+            }
+
+        colorizer = JsonColorizer('yellow', 'red', 'brightblue', 'gray')
+        formatter = Terminal256Formatter(style=JcStyle)
+
+        for file, data in self.fixtures:
+            for fmt, (indent, separators, ascii_only) in FORMATS.items():
+                j_string = json.dumps(data, indent=indent, separators=separators, ensure_ascii=ascii_only)
+                self.assertEqual(
+                    colorizer.dumps(data, indent, separators, ascii_only),
+                    highlight(j_string, JsonLexer(), formatter)[0:-1],
+                    msg=f'{fmt} output differs: {file}'
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import json
+import unittest
+from jc.emitter import StreamingEmitter, write_json
+
+
+class MyTests(unittest.TestCase):
+
+    def test_emitter_batches_records(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, flush_records=3, flush_interval=60)
+
+        emitter.emit({'a': 1})
+        emitter.emit({'b': 2})
+        self.assertEqual(stream.getvalue(), b'')
+
+        emitter.emit({'c': 3})
+        self.assertEqual(stream.getvalue(), b'{"a":1}\n{"b":2}\n{"c":3}\n')
+
+        emitter.emit({'d': 4})
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), b'{"a":1}\n{"b":2}\n{"c":3}\n{"d":4}\n')
+
+    def test_emitter_flush_interval(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, flush_records=1000, flush_interval=0)
+        emitter.emit({'a': 1})
+        self.assertEqual(stream.getvalue(), b'{"a":1}\n')
+
+    def test_emitter_unbuffer(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, flush_records=1000, flush_interval=60, unbuffer=True)
+        emitter.emit({'a': 1})
+        self.assertEqual(stream.getvalue(), b'{"a":1}\n')
+
+    def test_emitter_pretty_and_non_serializable(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, indent=2, separators=None)
+        emitter.emit({'a': b'x'})
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), b'{\n  "a": "b\'x\'"\n}\n')
+
+    def test_emitter_unicode(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream)
+        emitter.emit({'a': 'ü'})
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), '{"a":"ü"}\n'.encode('utf-8'))
+
+    def test_emitter_ascii_fallback(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, encoding='ascii')
+        emitter.emit({'a': 'ü'})
+        emitter.emit({'b': 'é'})
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), b'{"a":"\\u00fc"}\n{"b":"\\u00e9"}\n')
+
+    def test_emitter_colorize(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(stream, colorize=lambda x: f'<{x}>')
+        emitter.emit([1, 2])
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), b'<[1,2]>\n')
+
+    def test_emitter_write_json(self):
+        data = {'a': [{'b': i, 'c': 'ü'} for i in range(2000)]}
+        expected = json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+        stream = io.BytesIO()
+        write_json(stream, data, buffer_size=100)
+        self.assertEqual(stream.getvalue(), expected.encode('utf-8'))
+
+        stream = io.BytesIO()
+        write_json(stream, data, indent=2, separators=None)
+        self.assertEqual(stream.getvalue(), (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
+
+    def test_emitter_write_json_ascii_fallback(self):
+        stream = io.BytesIO()
+        write_json(stream, {'a': 'ü \U0001f600'}, encoding='ascii')
+        self.assertEqual(stream.getvalue(), b'{"a":"\\u00fc \\ud83d\\ude00"}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import glob
+import json
+import unittest
+from datetime import datetime, timezone
+import jc.json_backend
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FORMATS = {
+    'compact': (None, (',', ':'), False),
+    'pretty': (2, None, False),
+    'ascii_only': (None, (',', ':'), True)
+}
+
+
+class MyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = []
+        for file in sorted(glob.glob(os.path.join(THIS_DIR, 'fixtures', '**', '*.json'), recursive=True)):
+            with open(file, 'r', encoding='utf-8') as f:
+                try:
+                    cls.fixtures.append((file, json.load(f)))
+                except ValueError:
+                    pass
+
+    def assert_conforms(self, data, name='', formats=FORMATS):
+        for fmt in formats:
+            indent, separators, ascii_only = FORMATS[fmt]
+            expected = json.dumps(data, indent=indent, separators=separators, ensure_ascii=ascii_only, default=str)
+            for backend, dumps in jc.json_backend.backends.items():
+                if backend == 'json':
+                    continue
+
+                self.assertEqual(
+                    dumps(data, indent, separators, ascii_only),
+                    expected,
+                    msg=f'{backend} backend {fmt} output differs: {name}'
+                )
+
+    def test_json_backend_fixture_corpus(self):
+        self.assertGreater(len(self.fixtures), 1000)
+        # ascii_only output always uses the standard library
+        for file, data in self.fixtures:
+            self.assert_conforms(data, file, formats=('compact', 'pretty'))
+
+    def test_json_backend_non_serializable(self):
+        data = {
+            'bytes': b'\x00\xff',
+            'datetime': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            'set': {1},
+            'nested': [{'a': b'b'}]
+        }
+        self.assert_conforms(data)
+
+    def test_json_backend_edge_values(self):
+        data = {
+            'big_int': 2**70,
+            'neg_big_int': -2**64,
+            'floats': [1e16, 1.5e-7, 0.00001, 1e-4, 123456789012345680.0, -0.0, 2.0, 1e300],
+            'unicode': 'ü   \U0001f600 \x7f \x00 \x1f "\\/',
+            'empty': [{}, [], ''],
+            'bool_null': [True, False, None],
+            'non_finite': [float('nan'), float('inf'), -float('inf')]
+        }
+        self.assert_conforms(data)
+        self.assert_conforms(1e16)
+        self.assert_conforms(float('nan'))
+        self.assert_conforms({'a': None, 'b': {'c': [1.5, {'d': float('inf')}]}})
+        self.assert_conforms({float('nan'): None})
+        self.assert_conforms('top level string')
+
+    def test_json_backend_non_str_keys(self):
+        self.assert_conforms({1: 'a', None: 'b', True: 'c', 2.5: 'd'})
+
+    def test_json_backend_lone_surrogate(self):
+        self.assert_conforms({'a': '\udc80'})
+
+    def test_json_backend_iterdumps(self):
+        data = {
+            'records': [{'a': i, 'b': [1, 2], 'c': {'d': 'ü'}} for i in range(1500)],
+            'nested': {'x': {'y': list(range(2000))}},
+            'non_str_keys': {i: 'a' for i in range(1500)},
+            'tuple': tuple(range(1500)),
+            'empty': [{}, []]
+        }
+        for fmt, (indent, separators, ascii_only) in FORMATS.items():
+            for backend, dumps in jc.json_backend.backends.items():
+                pieces = list(jc.json_backend.iterdumps(data, indent, separators, ascii_only, encoder=dumps))
+                self.assertGreater(len(pieces), 1)
+                self.assertEqual(''.join(pieces), dumps(data, indent, separators, ascii_only),
+                                 msg=f'{backend} backend {fmt} output differs')
+
+    def test_json_backend_iterdumps_small(self):
+        self.assertEqual(list(jc.json_backend.iterdumps({'a': [1, 2]})), [jc.json_backend.dumps({'a': [1, 2]})])
+        self.assertEqual(list(jc.json_backend.iterdumps('a')), ['"a"'])
+
+    def test_json_backend_get_backend(self):
+        self.assertEqual(jc.json_backend.get_backend('json'), ('json', jc.json_backend.json_dumps))
+        self.assertIn(jc.json_backend.get_backend('not_a_backend')[0], jc.json_backend.backends)
+
+
+if __name__ == '__main__':
+    unittest.main()
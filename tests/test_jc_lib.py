@@ -1,8 +1,13 @@
 from copy import deepcopy
+import importlib.util
+import os
+import sys
+import tempfile
 import unittest
 from typing import Generator
 from types import ModuleType
 import jc.lib
+import jc.parser_index
 import jc.parsers.csv as csv_parser
 
 
@@ -151,6 +156,179 @@ class MyTests(unittest.TestCase):
 
         self.assertEqual(len(result), 1)
 
+    def test_lib_parser_index_matches_parser_info(self):
+        """Ensure the parser index is rebuilt (build-parser-index.py) after parser info changes"""
+        self.assertEqual(jc.parser_index.version, jc.lib.__version__)
+
+        for p in jc.lib.parsers:
+            if p in jc.lib.local_parsers:
+                continue
+
+            # load a fresh copy since alias parsers (e.g. kv) replace the info
+            # class of the parser they wrap at parse time
+            parser_mod_name = jc.lib._cliname_to_modname(p)
+            spec = importlib.util.find_spec(f'jc.parsers.{parser_mod_name}')
+            parser = importlib.util.module_from_spec(spec)  # type: ignore
+            spec.loader.exec_module(parser)  # type: ignore
+            info_attrs = {k: v for k, v in vars(parser.info).items() if not k.startswith('__')}
+
+            with self.subTest(parser=parser_mod_name):
+                self.assertEqual(jc.parser_index.parser_index.get(parser_mod_name), info_attrs)
+
+    def test_lib_parser_info_indexed_matches_module(self):
+        from_index = jc.lib.parser_info('ping-s')
+        from_module = jc.lib.parser_info(jc.lib.get_parser('ping_s'))
+        self.assertEqual(from_index, from_module)
+
+    def test_lib_parser_info_stale_index(self):
+        """A parser index built for another jc version is ignored"""
+        old_version = jc.parser_index.version
+        jc.parser_index.version = '0.0.0'
+        result = jc.lib._get_indexed_info('csv')
+        all_info = jc.lib.all_parser_info()
+        jc.parser_index.version = old_version
+
+        self.assertIsNone(result)
+        self.assertEqual(len(all_info), len(jc.lib.all_parser_info()))
+
+    def test_lib_plugin_manifest(self):
+        plugin_code = (
+            'class info():\n'
+            '    version = "1.0"\n'
+            '    description = "manifest test parser"\n'
+            '    hidden = True\n'
+            'def parse(data, raw=False, quiet=False):\n'
+            '    return {}\n'
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plugin_dir = os.path.join(tmp_dir, 'jcparsers')
+            manifest_path = os.path.join(tmp_dir, 'cache', 'jcparsers_manifest.json')
+            os.mkdir(plugin_dir)
+            with open(os.path.join(plugin_dir, 'manifest_test_plugin.py'), 'w') as f:
+                f.write(plugin_code)
+            with open(os.path.join(plugin_dir, 'manifest_test_invalid.py'), 'w') as f:
+                f.write('x = 1\n')
+
+            sys.path.append(tmp_dir)
+            old_check_parser_plugin = jc.lib._check_parser_plugin
+            try:
+                first_manifest = jc.lib._get_plugin_manifest(plugin_dir, manifest_path)
+
+                # unchanged plugins are not imported again
+                def fail_check(name, local_parsers_dir):
+                    raise AssertionError(f'{name} should not be checked')
+
+                jc.lib._check_parser_plugin = fail_check  # type: ignore
+                second_manifest = jc.lib._get_plugin_manifest(plugin_dir, manifest_path)
+
+                # changed plugins are checked again
+                jc.lib._check_parser_plugin = old_check_parser_plugin
+                with open(os.path.join(plugin_dir, 'manifest_test_invalid.py'), 'a') as f:
+                    f.write('y = 2\n')
+                third_manifest = jc.lib._get_plugin_manifest(plugin_dir, manifest_path)
+
+            finally:
+                jc.lib._check_parser_plugin = old_check_parser_plugin
+                sys.path.remove(tmp_dir)
+
+        self.assertTrue(first_manifest['manifest_test_plugin.py']['valid'])
+        self.assertEqual(
+            first_manifest['manifest_test_plugin.py']['info'],
+            {'version': '1.0', 'description': 'manifest test parser', 'hidden': True}
+        )
+        self.assertFalse(first_manifest['manifest_test_invalid.py']['valid'])
+        self.assertEqual(first_manifest, second_manifest)
+        self.assertEqual(third_manifest['manifest_test_invalid.py']['size'], 12)
+        self.assertFalse(third_manifest['manifest_test_invalid.py']['valid'])
+
+    def test_lib_parse_many(self):
+        fixtures_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+        files = [
+            os.path.join(fixtures_dir, 'centos-7.7', 'uname-a.out'),
+            os.path.join(fixtures_dir, 'osx-10.14.6', 'uname-a.out'),
+            os.path.join(fixtures_dir, 'ubuntu-18.04', 'uname-a.out')
+        ]
+
+        expected = []
+        for file in files:
+            with open(file, 'r') as f:
+                result = jc.lib.parse('uname', f.read(), quiet=True)
+            result['_file'] = file
+            expected.append(result)
+
+        self.assertEqual(jc.lib.parse_many('uname', files, workers=1, quiet=True), expected)
+        self.assertEqual(jc.lib.parse_many('uname', files, workers=2, quiet=True), expected)
+
+    def test_lib_parse_many_streaming(self):
+        with self.assertRaises(ValueError):
+            jc.lib.parse_many('ping_s', ['file.out'])
+
+    def test_lib_parse_items(self):
+        items = ['192.168.1.1', '10.0.0.1/8', '2001:db8::1', '127.0.0.1']
+        expected = [jc.lib.parse('ip_address', item, quiet=True) for item in items]
+
+        self.assertEqual(list(jc.lib.parse_items('ip_address', items, workers=1, quiet=True)), expected)
+        self.assertEqual(
+            list(jc.lib.parse_items('ip_address', iter(items), workers=2, quiet=True, batch_size=1)),
+            expected
+        )
+
+    def test_lib_parse_items_streaming(self):
+        with self.assertRaises(ValueError):
+            jc.lib.parse_items('ping_s', ['a'])
+
+    def test_lib_table_chunks(self):
+        data = 'header\nrow1\nrow2\nrow3\nrow4'
+        self.assertEqual(
+            list(jc.lib._table_chunks(data, 5)),
+            ['header\nrow1\n', 'header\nrow2\n', 'header\nrow3\n', 'header\nrow4']
+        )
+        self.assertEqual(list(jc.lib._table_chunks(data, 100)), [data])
+
+    def test_lib_parse_chunked(self):
+        fixtures_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+        for parser_name, fixture in [('ps', 'ps-axu.out'), ('lsof', 'lsof.out')]:
+            with open(os.path.join(fixtures_dir, 'centos-7.7', fixture), 'r') as f:
+                data = f.read()
+
+            for raw in (False, True):
+                with self.subTest(f'{parser_name} raw={raw}'):
+                    expected = jc.lib.parse(parser_name, data, raw=raw, quiet=True)
+                    parser = jc.lib.get_parser(parser_name)
+                    self.assertEqual(
+                        jc.lib._parse_chunked(parser, data, workers=2, quiet=True, raw=raw, chunk_size=1000),
+                        expected
+                    )
+
+    def test_lib_parse_chunked_not_chunkable(self):
+        self.assertFalse(jc.lib._parser_is_chunkable(jc.lib.get_parser('df')))
+        self.assertTrue(jc.lib._parser_is_chunkable(jc.lib.get_parser('lsof')))
+
+    def test_lib_parse_sink(self):
+        fixtures_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+        for parser_name, fixture in [('ps', 'ps-axu.out'), ('lsof', 'lsof.out'), ('df', 'df.out'), ('uptime', 'uptime.out')]:
+            with open(os.path.join(fixtures_dir, 'centos-7.7', fixture), 'r') as f:
+                data = f.read()
+
+            for raw in (False, True):
+                with self.subTest(f'{parser_name} raw={raw}'):
+                    expected = jc.lib.parse(parser_name, data, raw=raw, quiet=True)
+                    if isinstance(expected, dict):
+                        expected = [expected]
+
+                    records = []
+                    self.assertIsNone(jc.lib.parse(parser_name, data, raw=raw, quiet=True, sink=records.append))
+                    self.assertEqual(records, expected)
+
+    def test_lib_parse_sink_incremental(self):
+        data = 'PID TTY TIME CMD\n1 ? 00:00:01 systemd\n2 ? 00:00:00 kthreadd\n'
+        records = []
+        self.assertTrue(jc.lib._parser_is_incremental(jc.lib.get_parser('ps')))
+        self.assertFalse(jc.lib._parser_is_incremental(jc.lib.get_parser('df')))
+        jc.lib.parse('ps', data, quiet=True, sink=records.append)
+        self.assertEqual(records, jc.lib.parse('ps', data, quiet=True))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import io
+import sys
+import unittest
+from contextlib import redirect_stderr
+from jc.magic import MagicCommand, TIMEOUT_EXIT
+
+
+def python_command(code):
+    return [sys.executable, '-c', code]
+
+
+class MyTests(unittest.TestCase):
+
+    def test_magic_read(self):
+        command = MagicCommand(python_command('print("a\\r\\nb")'))
+        self.assertEqual(command.read(), 'a\nb\n')
+        self.assertEqual(command.wait(), 0)
+        self.assertFalse(command.timed_out)
+
+    def test_magic_read_bytes(self):
+        command = MagicCommand(python_command('import sys; sys.stdout.buffer.write(b"a\\xffb")'))
+        self.assertEqual(command.read(), b'a\xffb')
+        self.assertEqual(command.wait(), 0)
+
+    def test_magic_exit_code(self):
+        command = MagicCommand(python_command('import sys; sys.exit(3)'))
+        self.assertEqual(command.read(), '')
+        self.assertEqual(command.wait(), 3)
+        self.assertEqual(command.returncode, 3)
+
+    def test_magic_forward_stderr(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            command = MagicCommand(python_command('import sys; print("out"); print("err ü", file=sys.stderr)'))
+            output = command.read()
+            command.wait()
+
+        self.assertEqual(output, 'out\n')
+        self.assertEqual(stderr.getvalue(), 'err ü\n')
+
+    def test_magic_lines_before_exit(self):
+        """Lines can be read while the command is still running"""
+        command = MagicCommand(python_command(
+            'import sys, time\n'
+            'for i in range(3):\n'
+            '    print(i, flush=True)\n'
+            'time.sleep(30)'
+        ), timeout=20)
+        lines = command.lines()
+        self.assertEqual([next(lines) for _ in range(3)], ['0\n', '1\n', '2\n'])
+        self.assertIsNone(command.returncode)
+
+        command.proc.kill()
+        self.assertEqual(command.wait(), -9 if sys.platform != 'win32' else 1)
+
+    @unittest.skipIf(sys.platform.startswith('win32'), 'SIGPIPE not available')
+    def test_magic_stop_reading(self):
+        """A command is not an error if the output is not read to the end"""
+        command = MagicCommand(python_command(
+            'import signal, time\n'
+            'signal.signal(signal.SIGPIPE, signal.SIG_DFL)\n'
+            'while True:\n'
+            '    print("line", flush=True)\n'
+            '    time.sleep(0.01)'
+        ))
+        self.assertEqual(next(command.lines()), 'line\n')
+        self.assertEqual(command.wait(), 0)
+
+    def test_magic_timeout(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            command = MagicCommand(python_command('print("a", flush=True); import time; time.sleep(30)'), timeout=0.5)
+            self.assertEqual(command.read(), 'a\n')
+            self.assertEqual(command.wait(), TIMEOUT_EXIT)
+
+        self.assertTrue(command.timed_out)
+
+    def test_magic_not_found(self):
+        with self.assertRaises(OSError):
+            MagicCommand(['jc-command-that-does-not-exist'])
+
+
+if __name__ == '__main__':
+    unittest.main()
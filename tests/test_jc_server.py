@@ -0,0 +1,85 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import jc
+from jc.exceptions import ParseError
+
+if sys.platform.startswith('win32'):
+    raise unittest.SkipTest('Unix domain sockets are not available on Windows')
+
+import jc.server
+
+
+class MyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.tmp_dir.name, 'jc.sock')
+        cls.server = jc.server._create_server(cls.socket_path)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.tmp_dir.cleanup()
+
+    def test_server_standard_parser(self):
+        data = 'a,b,c\n1,2,3'
+        result = list(jc.server.request(self.socket_path, 'csv', data))
+        self.assertEqual(result, [jc.parse('csv', data)])
+
+    def test_server_standard_parser_raw(self):
+        data = 'Linux vm 6.1.0 #1 SMP x86_64 x86_64 x86_64 GNU/Linux'
+        result = list(jc.server.request(self.socket_path, 'uname', data, raw=True))
+        self.assertEqual(result, [jc.parse('uname', data, raw=True)])
+
+    def test_server_streaming_parser(self):
+        data = ['a,b,c\n', '1,2,3\n', '4,5,6\n']
+        result = list(jc.server.request(self.socket_path, 'csv_s', iter(data)))
+        self.assertEqual(result, list(jc.parse('csv_s', data)))
+
+    def test_server_streaming_parser_surrogates(self):
+        """Input decoded with surrogateescape does not stop the request"""
+        data = ['a,b\n', '\udcff,2\n']
+        result = list(jc.server.request(self.socket_path, 'csv_s', iter(data)))
+        self.assertEqual(result, list(jc.parse('csv_s', ['a,b\n', '�,2\n'])))
+
+    def test_server_streaming_parser_ignore_exceptions(self):
+        data = ['garbage\n']
+        result = list(jc.server.request(self.socket_path, 'ping_s', data, ignore_exceptions=True))
+        self.assertEqual(result, list(jc.parse('ping_s', data, ignore_exceptions=True)))
+
+    def test_server_streaming_parser_error(self):
+        with self.assertRaises(ParseError):
+            list(jc.server.request(self.socket_path, 'ping_s', ['garbage\n']))
+
+    def test_server_unknown_parser(self):
+        with self.assertRaises(ParseError):
+            list(jc.server.request(self.socket_path, 'not_a_parser', 'data'))
+
+    def test_server_concurrent_requests(self):
+        data = 'a,b,c\n1,2,3'
+        results = []
+
+        def client():
+            results.append(list(jc.server.request(self.socket_path, 'csv', data)))
+
+        clients = [threading.Thread(target=client) for _ in range(10)]
+        for c in clients:
+            c.start()
+        for c in clients:
+            c.join()
+
+        self.assertEqual(results, [[jc.parse('csv', data)]] * 10)
+
+    def test_server_socket_in_use(self):
+        with self.assertRaises(OSError):
+            jc.server._create_server(self.socket_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import unittest
+from jc.parsers.universal import (
+    simple_table_parse, simple_table_parse_iter, sparse_table_parse, sparse_table_parse_iter
+)
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class MyTests(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(THIS_DIR, 'fixtures/centos-7.7/ps-ef.out'), 'r', encoding='utf-8') as f:
+            self.ps_ef = f.read().lower().splitlines()
+
+        with open(os.path.join(THIS_DIR, 'fixtures/centos-7.7/lsof.out'), 'r', encoding='utf-8') as f:
+            self.lsof = f.read().lower().splitlines()
+
+
+    def test_simple_table_parse_iter_same_as_list(self):
+        self.assertEqual(list(simple_table_parse_iter(self.ps_ef)), simple_table_parse(self.ps_ef))
+
+
+    def test_sparse_table_parse_iter_same_as_list(self):
+        self.assertEqual(list(sparse_table_parse_iter(self.lsof)), sparse_table_parse(self.lsof))
+
+
+    def test_table_parse_iter_line_endings(self):
+        """Lines read from a file keep their line endings"""
+        data = [line + '\n' for line in self.lsof]
+        self.assertEqual(list(sparse_table_parse_iter(data)), sparse_table_parse(self.lsof))
+
+        data = [line + '\r\n' for line in self.ps_ef]
+        self.assertEqual(list(simple_table_parse_iter(data)), simple_table_parse(self.ps_ef))
+
+
+    def test_table_parse_iter_lazy(self):
+        """Only the lines needed for the requested rows are read"""
+        def lines(data):
+            yield from data[:3]
+            raise AssertionError('read too far')
+
+        for func, data in [(simple_table_parse_iter, self.ps_ef), (sparse_table_parse_iter, self.lsof)]:
+            with self.subTest(func.__name__):
+                rows = func(lines(data))
+                self.assertEqual(next(rows), func(data).__next__())
+                next(rows)
+
+
+    def test_table_parse_iter_nodata(self):
+        self.assertEqual(list(simple_table_parse_iter([])), [])
+        self.assertEqual(list(sparse_table_parse_iter([])), [])
+        self.assertEqual(list(sparse_table_parse_iter(['col_1  col_2'])), [])
+
+
+    def test_sparse_table_parse_iter_long_rows(self):
+        data = [
+            'col_1  col_2',
+            'a      b',
+            'apple  green beans and carrots',
+            'c'
+        ]
+        expected = [
+            {'col_1': 'a', 'col_2': 'b'},
+            {'col_1': 'apple', 'col_2': 'green beans and carrots'},
+            {'col_1': 'c', 'col_2': None}
+        ]
+        self.assertEqual(list(sparse_table_parse_iter(data)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
 import sys
+import os
+import mmap
+import tempfile
 import unittest
 import jc.utils
 
@@ -97,6 +100,62 @@ class MyTests(unittest.TestCase):
 
             self.assertEqual(ts_dict, expected_output)
 
+    def test_utils_timestamp_format_hint(self):
+        # hints change the order formats are tried, not the result
+        for input_string, format_hint in (
+            ('10/Oct/2000:13:55:36 -0700', (1800,)),
+            ('10/Oct/2000:13:55:36 -0700', (7100, 7200)),
+            ('2019-08-13 18:13:43.555604315 -0000', (7100, 7200)),
+            ('Wed, 31 Jan 2024 00:39:28 GMT', (1000, 3500)),
+            ('Aug 15 10:56', (7100,))
+        ):
+            ts = jc.utils.timestamp(input_string)
+            ts_hint = jc.utils.timestamp(input_string, format_hint=format_hint)
+            self.assertEqual(
+                (ts.format, ts.naive, ts.utc, ts.iso),
+                (ts_hint.format, ts_hint.naive, ts_hint.utc, ts_hint.iso)
+            )
+
+    def test_utils_timestamps(self):
+        # the first value sets the format. The rest include outliers that
+        # need the full conversion (UTC, other formats, bad values, None)
+        datetime_strings = [
+            '10/Oct/2000:13:55:36 -0700',
+            '11/Oct/2000:01:02:03 -0700',
+            '10/Oct/2000:13:55:36 -0000',
+            '10/Oct/2000:13:55:36 -0700',
+            '31/Feb/2000:13:55:36 -0700',
+            '10/Foo/2000:13:55:36 -0700',
+            'Thu Mar 5 09:17:40 2020 -0800',
+            '2019-08-13 18:13:43.555604315 -0400',
+            '',
+            None
+        ]
+
+        for format_hint in (None, (1800,), (1100,)):
+            ts_list = jc.utils.timestamps(datetime_strings, format_hint=format_hint)
+            self.assertEqual(len(ts_list), len(datetime_strings))
+
+            for input_string, ts in zip(datetime_strings, ts_list):
+                expected = jc.utils.timestamp(input_string, format_hint=format_hint)
+                self.assertEqual(
+                    (ts.string, ts.format, ts.naive, ts.utc, ts.iso),
+                    (expected.string, expected.format, expected.naive, expected.utc, expected.iso)
+                )
+
+        self.assertEqual(jc.utils.timestamps([]), [])
+
+    def test_utils_timestamp_set_cache_size(self):
+        try:
+            jc.utils.timestamp.set_cache_size(0)
+            self.assertEqual(jc.utils.timestamp('Mar 29 11:49:05 2021').format, 7100)
+            self.assertEqual(jc.utils.timestamp._parse_dt.cache_info().maxsize, 0)
+        finally:
+            jc.utils.timestamp.set_cache_size()
+
+        self.assertEqual(jc.utils.timestamp._parse_dt.cache_info().maxsize, jc.utils.TIMESTAMP_CACHE_SIZE)
+        self.assertEqual(jc.utils.timestamp('Mar 29 11:49:05 2021').format, 7100)
+
     def test_utils_convert_to_int(self):
         io_map = {
             None: None,
@@ -118,7 +177,13 @@ class MyTests(unittest.TestCase):
             0.1: 0,
             0.6: 0,
             -0.1: 0,
-            -0.6: 0
+            -0.6: 0,
+            '007': 7,
+            '1,234 kB': 1234,
+            ' 42 ': 42,
+            '12.7%': 12,
+            '\u0663': None,
+            '--5': None
         }
 
         for input_string, expected_output in io_map.items():
@@ -145,12 +210,30 @@ class MyTests(unittest.TestCase):
             0.1: 0.1,
             0.6: 0.6,
             -0.1: -0.1,
-            -0.6: -0.6
+            -0.6: -0.6,
+            '12.5%': 12.5,
+            '\u0663.5': 0.5,
+            'abc': None
         }
 
         for input_string, expected_output in io_map.items():
             self.assertEqual(jc.utils.convert_to_float(input_string), expected_output)
 
+    def test_utils_convert_fields(self):
+        rows = [
+            {'pid': '1', 'cpu': '0.5', 'name': 'init', 'both': '2.5'},
+            {'pid': '-', 'name': '42'},
+            {}
+        ]
+        result = jc.utils.convert_fields(rows, int_keys={'pid', 'both'}, float_keys=['cpu', 'both'])
+
+        self.assertIs(result, rows)
+        self.assertEqual(rows, [
+            {'pid': 1, 'cpu': 0.5, 'name': 'init', 'both': 2},
+            {'pid': None, 'name': '42'},
+            {}
+        ])
+
     def test_utils_convert_to_bool(self):
         io_map = {
             None: False,
@@ -238,6 +321,15 @@ class MyTests(unittest.TestCase):
         for input_string, expected_output in io_map.items():
             self.assertEqual(jc.utils.convert_size_to_int(input_string, decimal_bias=True), expected_output)
 
+    def test_utils_convert_sizes_to_int(self):
+        sizes = ['4.0K', '1,024', None, 'abc', '4.0K', '1.5 Gi', '2 exabytes']
+        self.assertEqual(
+            jc.utils.convert_sizes_to_int(sizes, posix_mode=True),
+            [4096, 1024, None, None, 4096, 1610612736, 2 * 1000**6]
+        )
+        self.assertEqual(jc.utils.convert_sizes_to_int(['1 KB'], binary=True), [1024])
+        self.assertEqual(jc.utils.convert_sizes_to_int([]), [])
+
 
     def test_utils_has_data_nodata(self):
         self.assertFalse(jc.utils.has_data('     \n      '))
@@ -306,6 +398,58 @@ line5
         expected = 'line2\n\nline4'
         self.assertEqual(jc.utils.line_slice(data, 1, 4), expected)
 
+    def test_utils_line_slice_mmap(self):
+        data = 'line1\r\nline2\n\nline4 ü\rline5\n'
+        with tempfile.TemporaryFile() as f:
+            f.write(data.encode('utf-8'))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for slice_start, slice_end in [(1, 4), (None, 2), (3, None), (1, -1), (-2, None)]:
+                    self.assertEqual(
+                        jc.utils.line_slice(mapped, slice_start, slice_end),
+                        jc.utils.line_slice(data, slice_start, slice_end)
+                    )
+
+    def test_utils_line_slice_mmap_bytes(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b'line1\n\xff\xfe\n')
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertRaises(ValueError, jc.utils.line_slice, mapped, 0, 2)
+
+    def test_utils_line_slice_negative_slices(self):
+        data = 'line1\r\nline2\n\nline4\rline5\n'
+        lines = ['line1', 'line2', '', 'line4', 'line5']
+        slices = [(-2, None), (-9, None), (-3, -1), (-1, -3), (None, -2), (2, -1), (-4, 3), (-2, 1), (-9, 9)]
+        for slice_start, slice_end in slices:
+            with self.subTest(f'slice: {slice_start}:{slice_end}'):
+                expected = lines[slice_start:slice_end]
+                self.assertEqual(jc.utils.line_slice(data, slice_start, slice_end), '\n'.join(expected))
+                self.assertEqual(list(jc.utils.line_slice(iter(lines), slice_start, slice_end)), expected)
+
+    def test_utils_line_slice_reverse_splitlines(self):
+        data = 'line1\r\nline2\n\nline4\rline5\r\n\r\nline7'
+        expected = list(reversed(list(jc.utils._lazy_splitlines(data))))
+        # small chunks split \r\n line endings and lines across chunks
+        for chunk_size in (1, 2, 3, 5, 1024):
+            with self.subTest(f'chunk size: {chunk_size}'):
+                self.assertEqual(list(jc.utils._lazy_reverse_splitlines(data, chunk_size)), expected)
+
+    def test_utils_line_slice_text_file_tail(self):
+        data = 'line1\nline2\r\n\nline4\rline5\n'
+        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', newline='', delete=False) as f:
+            f.write(data)
+
+        try:
+            for slice_start, slice_end in [(-2, None), (-3, -1), (-9, None)]:
+                with self.subTest(f'slice: {slice_start}:{slice_end}'):
+                    with open(f.name, 'r', encoding='utf-8') as text_file:
+                        expected = list(text_file)[slice_start:slice_end]
+                    with open(f.name, 'r', encoding='utf-8') as text_file:
+                        self.assertEqual(list(jc.utils.line_slice(text_file, slice_start, slice_end)), expected)
+        finally:
+            os.unlink(f.name)
+
     def test_utils_line_slice_iter_positive_blank_lines(self):
         data = [
             'line1',
@@ -336,6 +480,13 @@ line5
             with self.subTest(f'Original key: {data}'):
                 self.assertEqual(jc.utils.normalize_key(data), expected)
 
+    def test_normalize_key_interned(self):
+        # keys built at runtime should come back as the same string object
+        first = jc.utils.normalize_key(''.join(['Rx ', 'Bytes']))
+        second = jc.utils.normalize_key(''.join(['RX', '-bytes']))
+        self.assertEqual(first, 'rx_bytes')
+        self.assertIs(first, second)
+
 
     # need to mock shutil.get_terminal_size().columns or add a column parameter to test
     # def test_utils_warning_message(self):
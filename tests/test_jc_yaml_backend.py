@@ -0,0 +1,122 @@
+import io
+import os
+import glob
+import json
+import unittest
+from datetime import datetime, timezone
+import jc.yaml_backend
+from jc.exceptions import LibraryNotInstalled
+from jc.emitter import StreamingEmitter, write_yaml
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RUAMELYAML_INSTALLED = jc.yaml_backend.get_yaml() is not None
+
+
+@unittest.skipIf(not RUAMELYAML_INSTALLED, 'ruamel.yaml library not installed')
+class MyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = []
+        for file in sorted(glob.glob(os.path.join(THIS_DIR, 'fixtures', '**', '*.json'), recursive=True))[::40]:
+            with open(file, 'r', encoding='utf-8') as f:
+                try:
+                    cls.fixtures.append((file, json.load(f)))
+                except ValueError:
+                    pass
+
+    def assert_conforms(self, data, name=''):
+        for ascii_only in (False, True):
+            self.assertEqual(
+                ''.join(jc.yaml_backend.iterdumps(data, ascii_only)),
+                jc.yaml_backend._ruamel_dumps(data, ascii_only),
+                msg=f'ascii_only={ascii_only} output differs: {name}'
+            )
+
+    def test_yaml_backend_scalars(self):
+        """Scalars that are quoted, typed, or written by ruamel.yaml"""
+        data = [
+            None, True, False, 0, -1, 2**70, 3.14, 1e-07, 1e+20, -0.0,
+            float('nan'), float('inf'), float('-inf'),
+            '', ' ', 'a', 'true', 'No', 'null', '~', '12', '1_000', '_1', '0x1f',
+            '0o17', '1.5', '.5', '1e5', '.inf', '2024-01-02', '2024-1-2 3:04:05',
+            '<<', '=', '-', '- a', '-a', '?', ': a', 'a:', 'a: b', 'a #b', 'a#b',
+            '#a', 'a ', '---', '...', '"a"', "it's", "'a'", '@a', '`a', '%a',
+            '&a', '*a', '!a', '|', '>', '[a]', '{a}', 'a,b', 'café',
+            '\U0001f600', 'a\tb', 'a\nb', '\x00', '\x85', ' ', '﻿',
+            'x' * 77, 'x' * 78, 'word ' * 20, 'y' * 200,
+            b'bytes', (1, 2), datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            [], {}, [[]], [{}], [None, [None, {'a': None}]]
+        ]
+        self.assert_conforms(data, 'scalars')
+
+    def test_yaml_backend_keys(self):
+        data = {
+            'a': {'b': {'c': [1, {'d': [], 'e': {}}]}},
+            '': 'empty key',
+            'true': 'bool key',
+            'a b': 1,
+            'a: b': 2,
+            "it's": 3,
+            'k' * 99: 4,
+            'k' * 100: 5,
+            'k' * 130: 6,
+            1: 'int key',
+            None: 'null key'
+        }
+        self.assert_conforms(data, 'keys')
+
+        for key, value in data.items():
+            self.assert_conforms({key: value}, repr(key))
+            self.assert_conforms([{key: value}], repr(key))
+
+    def test_yaml_backend_documents(self):
+        for data in (None, '', 'a', 1, [], {}, [1], {'a': 1}):
+            self.assert_conforms(data, repr(data))
+
+    def test_yaml_backend_dumps(self):
+        self.assertEqual(jc.yaml_backend.dumps([{'a': 1}, {'b': None}]), '---\n- a: 1\n- b:')
+        self.assertEqual(jc.yaml_backend.dumps(None), '---\n...')
+
+    def test_yaml_backend_iterdumps_pieces(self):
+        data = [{'a': i} for i in range(3)]
+        self.assertEqual(list(jc.yaml_backend.iterdumps(data)), ['---\n', '- a: 0\n', '- a: 1\n', '- a: 2\n'])
+
+    def test_yaml_backend_fixtures(self):
+        for file, data in self.fixtures:
+            self.assert_conforms(data, file)
+
+    def test_yaml_backend_write_yaml(self):
+        data = [{'a': i, 'b': 'ü'} for i in range(2000)]
+        stream = io.BytesIO()
+        write_yaml(stream, data, buffer_size=100)
+        self.assertEqual(stream.getvalue(), jc.yaml_backend._ruamel_dumps(data, False).encode('utf-8'))
+
+        stream = io.BytesIO()
+        write_yaml(stream, data, ascii_only=True)
+        self.assertEqual(stream.getvalue(), jc.yaml_backend._ruamel_dumps(data, True).encode('utf-8'))
+
+    def test_yaml_backend_streaming_emitter(self):
+        stream = io.BytesIO()
+        emitter = StreamingEmitter(
+            stream,
+            dumps=lambda data, indent, separators, ascii_only: jc.yaml_backend.dumps(data, ascii_only)
+        )
+        emitter.emit({'a': 1})
+        emitter.emit({'b': [1, 2]})
+        emitter.flush()
+        self.assertEqual(stream.getvalue(), b'---\na: 1\n---\nb:\n- 1\n- 2\n')
+
+
+class NotInstalledTests(unittest.TestCase):
+    @unittest.skipIf(RUAMELYAML_INSTALLED, 'ruamel.yaml library installed')
+    def test_yaml_backend_not_installed(self):
+        with self.assertRaises(LibraryNotInstalled):
+            jc.yaml_backend.iterdumps({'a': 1})
+
+        with self.assertRaises(LibraryNotInstalled):
+            write_yaml(io.BytesIO(), {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -238,6 +238,38 @@ class MyTests(unittest.TestCase):
             self.assertEqual(jc.parsers.proc.parse(self.f_in[in_], quiet=True),
                                                    self.f_json[expected])
 
+    def test_proc_parser_from_filename(self):
+        """
+        Test proc parser file type lookup by /proc file path
+        """
+        files = {
+            '/proc/meminfo': 'proc_meminfo',
+            '/proc/stat': 'proc_stat',
+            '/proc/driver/rtc': 'proc_driver_rtc',
+            '/proc/net/tcp6': 'proc_net_tcp',
+            '/proc/self/net/dev': 'proc_net_dev',
+            '/proc/1/stat': 'proc_pid_stat',
+            '/proc/self/status': 'proc_pid_status',
+            '/proc/1/task/12/statm': 'proc_pid_statm',
+            '/proc/1/fdinfo/5': 'proc_pid_fdinfo',
+            '/proc/1/cmdline': None,
+            '/proc/mounts': None,
+            '/tmp/proc/meminfo': None
+        }
+        for filename, expected in files.items():
+            self.assertEqual(jc.parsers.proc.parser_from_filename(filename), expected, filename)
+
+    def test_proc_filename(self):
+        """
+        Test proc parser with a known /proc file path
+        """
+        self.assertEqual(jc.parsers.proc.parse(self.f_in['proc_meminfo'], quiet=True, filename='/proc/meminfo'),
+                         self.f_json['proc_meminfo'])
+
+        # unknown files are detected from the data
+        self.assertEqual(jc.parsers.proc.parse(self.f_in['proc_meminfo'], quiet=True, filename='/proc/foo'),
+                         self.f_json['proc_meminfo'])
+
 
 if __name__ == '__main__':
     unittest.main()
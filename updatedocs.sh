@@ -1,6 +1,10 @@
 #!/bin/bash
 # Update all documentation (README.md, Man page, Doc files)
 
+echo "Building parser metadata index"
+./build-parser-index.py && echo "++++ parser index build successful" || echo "---- parser index build failed"
+echo
+
 (
     echo === Building README.md
     ./readmegen.py && echo "++++ README.md build successful" || echo "---- README.md build failed"